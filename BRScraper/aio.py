@@ -0,0 +1,69 @@
+"""
+Asyncio versions of the getters.
+
+Every module exposes ``aget_*`` twins of its ``get_*`` functions (for
+example ``await nba.aget_stats(2024, 'advanced')``). They run the
+blocking getter on a shared thread pool sized like the HTTP connection
+pool, so several awaited calls overlap their network latency while still
+going through the same pooled session, disk cache and rate limiter.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from BRScraper import fetch
+
+_lock = threading.Lock()
+_executor = None
+_max_workers = fetch.DEFAULT_POOL_SIZE
+
+def configure(max_workers):
+    """
+    Set how many getters may run at the same time. Keep it at or below
+    the ``pool_size`` given to ``fetch.configure``.
+    """
+
+    global _executor, _max_workers
+
+    if max_workers <= 0:
+        raise ValueError(str(max_workers)+' is not a valid value. Try a value bigger than 0.')
+
+    with _lock:
+        _max_workers = max_workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+def get_executor():
+
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix='BRScraper')
+        return _executor
+
+async def run(func, *args, **kwargs):
+    """
+    Await ``func(*args, **kwargs)`` on the shared executor.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+def asyncify(func):
+    """
+    Build the ``a``-prefixed coroutine version of a blocking getter.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+
+    wrapper.__name__ = 'a'+func.__name__
+    wrapper.__qualname__ = 'a'+func.__qualname__
+    wrapper.__doc__ = 'Async version of ``'+func.__name__+'``; takes the same arguments.'
+
+    return wrapper
@@ -0,0 +1,147 @@
+"""
+Persistent on-disk cache for downloaded pages.
+
+Pages are stored by URL together with their ``ETag``/``Last-Modified``
+headers. How long an entry stays fresh depends on the endpoint (see
+``ttl_for``): finished seasons never change and are kept forever, live
+pages like salaries or playoff odds only for a few hours. Stale entries
+are revalidated with a conditional request by ``fetch.get_html``.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from datetime import date
+
+HOUR = 3600
+DAY = 24*HOUR
+
+# (pattern, ttl in seconds), first match wins
+TTL_RULES = [
+    (re.compile(r'/contracts/'), 6*HOUR),
+    (re.compile(r'/friv/playoff_prob'), 6*HOUR),
+    (re.compile(r'/friv/birthdays'), DAY),
+    (re.compile(r'/players/'), DAY),
+]
+
+CURRENT_SEASON_TTL = 6*HOUR
+DEFAULT_TTL = DAY
+
+_season_re = re.compile(r'(?<!\d)((?:19|20)\d{2})(?=[_.])')
+
+def default_directory():
+    """
+    Cache directory used when none is given: ``$BRSCRAPER_CACHE_DIR`` or
+    ``~/.cache/BRScraper``.
+    """
+
+    return os.environ.get('BRSCRAPER_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'BRScraper'))
+
+def season_finished(season, today=None):
+    """
+    A season is identified by its ending year and is considered over once
+    the next one is about to start (October of that year).
+    """
+
+    today = today or date.today()
+
+    return today >= date(int(season), 10, 1)
+
+def ttl_for(url, today=None):
+    """
+    Freshness lifetime in seconds for ``url``, or ``None`` for pages that
+    never change.
+    """
+
+    for pattern, ttl in TTL_RULES:
+        if pattern.search(url):
+            return ttl
+
+    match = _season_re.search(url.rsplit('/', 1)[-1])
+    if match:
+        if season_finished(match.group(1), today):
+            return None
+        return CURRENT_SEASON_TTL
+
+    return DEFAULT_TTL
+
+class DiskCache:
+    """
+    Directory of ``<sha1(url)>.html`` bodies with ``.json`` metadata.
+    """
+
+    def __init__(self, directory=None):
+
+        self.directory = directory or default_directory()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, url, ext):
+
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+        return os.path.join(self.directory, key+ext)
+
+    def _write(self, path, text):
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def load(self, url):
+        """
+        Return the cached entry for ``url`` (a dict with ``body``, ``etag``,
+        ``last_modified`` and ``stored_at``) or ``None``.
+        """
+
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(self._path(url, '.html'), encoding='utf-8') as f:
+                entry['body'] = f.read()
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def store(self, url, body, headers=None):
+
+        headers = headers or {}
+
+        self._write(self._path(url, '.html'), body)
+        self._write(self._path(url, '.json'), json.dumps({
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': time.time(),
+        }))
+
+    def touch(self, url):
+        """
+        Mark the entry for ``url`` as fresh again (after a 304).
+        """
+
+        entry = self.load(url)
+        if entry is None:
+            return
+
+        entry.pop('body')
+        entry['stored_at'] = time.time()
+        self._write(self._path(url, '.json'), json.dumps(entry))
+
+    def is_fresh(self, entry, now=None):
+
+        ttl = ttl_for(entry['url'])
+        if ttl is None:
+            return True
+
+        return (now or time.time()) - entry['stored_at'] < ttl
+
+    def clear(self):
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
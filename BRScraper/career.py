@@ -0,0 +1,164 @@
+"""
+Career lines built locally from season totals.
+
+``get_stats(season, 'totals')`` already has everything needed for career
+totals, per-game and per-36 lines, so once the seasons are collected (or
+stored in the ``warehouse``) careers for every player are one groupby on
+``player_id`` away, with no request per player.
+
+Traded players appear once per team plus once on a combined row
+(``TOT`` on older pages, ``2TM``/``3TM``... on current ones). The combined
+row is kept and the per-team rows are dropped, so nothing is counted
+twice.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from BRScraper import dtypes, metrics, warehouse
+
+COUNTING = ['G','GS','MP','FG','FGA','3P','3PA','2P','2PA','FT','FTA','ORB','DRB','TRB',
+            'AST','STL','BLK','TOV','PF','PTS','Trp-Dbl']
+
+PERCENTAGES = {'FG%': ('FG','FGA'), '3P%': ('3P','3PA'), '2P%': ('2P','2PA'), 'FT%': ('FT','FTA')}
+
+_combined_re = r'TOT|\d+TM'
+
+def _column(df, options):
+
+    for column in options:
+        if column in df.columns:
+            return column
+
+    raise ValueError('None of the columns "'+'", "'.join(options)+'" found.')
+
+def combined_rows(teams):
+    """
+    Mask of the rows summing a traded player's season (``TOT``, ``2TM``...).
+    """
+
+    # Few distinct teams: match the pattern once per code, not per row
+    codes = [t for t in pd.unique(teams.dropna()) if re.fullmatch(_combined_re, str(t))]
+
+    return teams.isin(codes)
+
+def season_rows(df):
+    """
+    One row per player and season: for traded players the combined row is
+    kept and the per-team rows are dropped.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Season totals with ``player_id``, a ``Team``/``Tm`` column and a
+        ``Season``/``season_year`` column (several seasons may be stacked).
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+
+    team = _column(df, ['Team','Tm','team_code'])
+    season = _column(df, ['Season','season_year'])
+
+    combined = combined_rows(df[team])
+    has_combined = combined.groupby([df['player_id'], df[season]]).transform('any')
+
+    return df[combined | ~has_combined]
+
+def _percentages(df):
+
+    for name, (made, attempts) in PERCENTAGES.items():
+        if made in df.columns and attempts in df.columns:
+            df[name] = df[made]/df[attempts].replace(0, np.nan)
+
+    if {'FG','3P','FGA'} <= set(df.columns):
+        df['eFG%'] = (df['FG']+0.5*df['3P'])/df['FGA'].replace(0, np.nan)
+
+    return df
+
+def career_totals(df):
+    """
+    Career totals of every player in ``df`` (stacked season totals).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per ``player_id`` with ``From``/``To`` (season ending
+        years), ``Seasons``, ``Teams`` (distinct teams played for), the
+        summed counting stats and recomputed shooting percentages.
+    """
+
+    df = df[df['player_id'].notna()]
+    team = _column(df, ['Team','Tm','team_code'])
+    season = _column(df, ['Season','season_year'])
+
+    years = df[season].map(warehouse.season_year).astype('Int64')
+    teams = df[team].where(~combined_rows(df[team]))
+    info = pd.DataFrame({'From': years.groupby(df['player_id']).min(),
+                         'To': years.groupby(df['player_id']).max(),
+                         'Seasons': years.groupby(df['player_id']).nunique(),
+                         'Teams': teams.groupby(df['player_id']).nunique()})
+
+    rows = season_rows(df)
+    counting = [c for c in COUNTING if c in rows.columns]
+    totals = rows[counting].apply(pd.to_numeric, errors='coerce').groupby(rows['player_id']).sum(min_count=1)
+
+    out = _percentages(info.join(totals))
+
+    return out.rename_axis('player_id').reset_index()
+
+def career_per_game(df):
+    """
+    Career per-game averages; ``G`` and ``GS`` stay as totals.
+    """
+
+    out = career_totals(df)
+    stats = [c for c in COUNTING if c in out.columns and c not in ['G','GS']]
+    out[stats] = out[stats].div(out['G'].replace(0, np.nan), axis=0)
+
+    return out
+
+def career_per_36(df):
+    """
+    Career per-36-minutes lines; ``G``, ``GS`` and ``MP`` stay as totals.
+    """
+
+    out = career_totals(df)
+    stats = [c for c in COUNTING if c in out.columns and c not in ['G','GS','MP']]
+    out[stats] = out[stats].mul(36/out['MP'].replace(0, np.nan), axis=0)
+
+    return out
+
+@dtypes.compactable
+@metrics.instrumented
+def get_career_stats(df=None, info='totals', playoffs=False):
+    """
+    Career lines of every player, without any request.
+
+    Parameters
+    ----------
+    df : pd.DataFrame, optional
+        Stacked season totals (e.g. ``nba.get_stats_bulk(seasons,
+        'totals')``). Defaults to every ``stats_totals`` season stored in
+        the enabled ``warehouse``.
+    info : str, optional
+        ``'totals'``, ``'per_game'`` or ``'per_36'``.
+    playoffs : bool, optional
+        Which warehouse rows to use when ``df`` is not given.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+
+    values = {'totals': career_totals, 'per_game': career_per_game, 'per_36': career_per_36}
+
+    if info not in values:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(values)+'".')
+
+    if df is None:
+        df = warehouse.query('stats_totals', playoffs=playoffs)
+
+    return values[info](df)
@@ -0,0 +1,234 @@
+"""
+Rate stats derived from season totals.
+
+The ``per_game``, ``per_36`` and ``per_100`` pages, and the shooting
+percentages ``get_stats`` drops, are all arithmetic on the ``totals``
+table. Team minutes, attempts, turnovers and pace (``get_team_stats``)
+add the team-relative rates (per 100 possessions, usage, assist and
+turnover percentages). Every view is computed with NumPy over whole
+columns, so a season needs the totals page and the team page instead of
+one page per format.
+
+Per 100 possessions uses the team's pace (possessions per 48 minutes),
+as the player's share of them, so it is close to but not exactly the
+site's value, which uses actual team possessions. Combined rows of traded
+players (``TOT``, ``2TM``...) use the league average team.
+"""
+import numpy as np
+import pandas as pd
+
+from BRScraper import career, dtypes, metrics, nba
+
+INFOS = ['per_game','per_36','per_100','shooting','advanced']
+
+TEAM_COLUMNS = ['MP','FG','FGA','FTA','TOV','Pace']
+
+def _keys(totals):
+
+    return [c for c in totals.columns if c not in career.COUNTING]
+
+def _counting(totals, exclude=()):
+
+    return [c for c in career.COUNTING if c in totals.columns and c not in exclude]
+
+def _values(totals, columns):
+
+    return totals[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+def _column(totals, column):
+
+    if column not in totals.columns:
+        # e.g. no 3P columns before 1979-80
+        return np.full(len(totals), np.nan)
+
+    return _values(totals, [column])[:, 0]
+
+def _divide(a, b):
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(b != 0, a/b, np.nan)
+
+def _scaled(totals, exclude, factor):
+
+    stats = _counting(totals, exclude)
+    out = totals.copy()
+    out[stats] = _values(totals, stats)*factor[:, None]
+
+    return out
+
+def per_game(totals):
+    """
+    Per-game averages; ``G`` and ``GS`` stay as totals.
+    """
+
+    g = _column(totals, 'G')
+
+    return _scaled(totals, ['G','GS'], _divide(1.0, g))
+
+def per_36(totals):
+    """
+    Per-36-minutes stats; ``G``, ``GS`` and ``MP`` stay as totals.
+    """
+
+    mp = _column(totals, 'MP')
+
+    return _scaled(totals, ['G','GS','MP'], _divide(36.0, mp))
+
+def team_context(totals, teams):
+    """
+    Team totals and pace aligned with the rows of ``totals``.
+
+    Parameters
+    ----------
+    totals : pd.DataFrame
+        Player season totals with a ``Team``/``Tm`` column.
+    teams : pd.DataFrame
+        One row per team indexed by team abbreviation, with the
+        ``TEAM_COLUMNS`` and a ``'LgAvg'`` row (see ``get_team_context``).
+
+    Returns
+    -------
+    dict of np.ndarray
+    """
+
+    team = 'Team' if 'Team' in totals.columns else 'Tm'
+    # object first: compacted frames have a categorical team column
+    codes = totals[team].astype(object).where(~career.combined_rows(totals[team]), 'LgAvg')
+    aligned = teams.reindex(codes)
+
+    return {column: pd.to_numeric(aligned[column], errors='coerce').to_numpy(dtype=float)
+            for column in TEAM_COLUMNS}
+
+def per_100(totals, teams):
+    """
+    Stats per 100 team possessions while the player is on the floor.
+    """
+
+    ctx = team_context(totals, teams)
+    mp = _column(totals, 'MP')
+
+    return _scaled(totals, ['G','GS','MP'], _divide(100.0, ctx['Pace']*mp/48))
+
+def shooting(totals):
+    """
+    ``FG%``, ``3P%``, ``2P%``, ``eFG%``, ``FT%``, ``TS%``, ``3PAr`` and
+    ``FTr`` next to the key columns.
+    """
+
+    v = {c: _column(totals, c) for c in ['FG','FGA','3P','3PA','2P','2PA','FT','FTA','PTS']}
+
+    out = totals[_keys(totals)].copy()
+    for name, (made, attempts) in career.PERCENTAGES.items():
+        out[name] = _divide(v[made], v[attempts])
+    out['eFG%'] = _divide(v['FG']+0.5*v['3P'], v['FGA'])
+    out['TS%'] = _divide(v['PTS'], 2*(v['FGA']+0.44*v['FTA']))
+    out['3PAr'] = _divide(v['3PA'], v['FGA'])
+    out['FTr'] = _divide(v['FTA'], v['FGA'])
+
+    return out
+
+def advanced(totals, teams):
+    """
+    ``TS%``, ``3PAr``, ``FTr``, ``AST%``, ``TOV%`` and ``USG%`` next to the
+    key columns (percentages on a 0-100 scale like the advanced page).
+    """
+
+    ctx = team_context(totals, teams)
+    v = {c: _column(totals, c) for c in ['MP','FG','FGA','FTA','TOV','AST']}
+    share = _divide(v['MP'], ctx['MP']/5) # fraction of team minutes on the floor
+
+    out = shooting(totals)[_keys(totals)+['TS%','3PAr','FTr']]
+    out['AST%'] = 100*_divide(v['AST'], share*ctx['FG']-v['FG'])
+    out['TOV%'] = 100*_divide(v['TOV'], v['FGA']+0.44*v['FTA']+v['TOV'])
+    out['USG%'] = 100*_divide(v['FGA']+0.44*v['FTA']+v['TOV'],
+                              share*(ctx['FGA']+0.44*ctx['FTA']+ctx['TOV']))
+
+    return out
+
+def get_team_context(season, playoffs=False):
+    """
+    Team totals and pace of a season indexed by team abbreviation, with
+    the league average team as ``'LgAvg'``. Both tables come from the same
+    page, fetched and parsed once.
+    """
+
+    # The undecorated helpers: 'LgAvg' is added to team_id, and the result
+    # is compacted once by the calling getter
+    totals = nba._get_team_stats(season, 'totals', playoffs=playoffs)
+    pace = nba._get_team_stats(season, 'advanced', playoffs=playoffs)
+
+    totals['team_id'] = totals['team_id'].fillna('LgAvg')
+    pace['team_id'] = pace['team_id'].fillna('LgAvg')
+
+    teams = totals.merge(pace[['team_id','Pace']].drop_duplicates('team_id'), on='team_id', how='left')
+
+    return teams.drop_duplicates('team_id').set_index('team_id')
+
+def derive(totals, info, teams=None):
+    """
+    One derived view of player season ``totals``.
+
+    Parameters
+    ----------
+    totals : pd.DataFrame
+        ``nba.get_stats(season, 'totals')``.
+    info : str
+        One of ``INFOS``.
+    teams : pd.DataFrame, optional
+        ``get_team_context(season)``; needed by ``'per_100'`` and
+        ``'advanced'``.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+
+    if info not in INFOS:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(INFOS)+'".')
+
+    if info in ['per_100','advanced'] and teams is None:
+        raise ValueError(info+' needs the team totals. Pass teams=get_team_context(season).')
+
+    if info=='per_game':
+        return per_game(totals)
+    if info=='per_36':
+        return per_36(totals)
+    if info=='shooting':
+        return shooting(totals)
+    if info=='per_100':
+        return per_100(totals, teams)
+
+    return advanced(totals, teams)
+
+@dtypes.compactable
+@metrics.instrumented
+def get_derived_stats(season, info='per_game', playoffs=False):
+    """
+    ``derive`` applied to a freshly fetched season.
+    """
+
+    if info not in INFOS:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(INFOS)+'".')
+
+    totals = nba._get_stats(season, 'totals', playoffs=playoffs)
+    teams = get_team_context(season, playoffs) if info in ['per_100','advanced'] else None
+
+    return derive(totals, info, teams)
+
+@dtypes.compactable
+@metrics.instrumented
+def get_all_derived_stats(season, playoffs=False):
+    """
+    Every derived view of a season from one totals fetch and one team page
+    fetch.
+
+    Returns
+    -------
+    dict
+        ``{info: pd.DataFrame}`` for every value of ``INFOS``.
+    """
+
+    totals = nba._get_stats(season, 'totals', playoffs=playoffs)
+    teams = get_team_context(season, playoffs)
+
+    return {info: derive(totals, info, teams) for info in INFOS}
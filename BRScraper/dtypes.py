@@ -0,0 +1,107 @@
+"""
+Memory-compact dtypes for the returned DataFrames.
+
+Parsed tables come back as ``float64`` and Python string (``object``)
+columns. ``compact`` converts whole-number columns (games, totals, ranks)
+to the smallest nullable integer type that fits, other numbers to
+``float32``, and team, position, season and league columns to
+``category``. That is several times smaller when many seasons are kept in
+memory.
+
+It is opt-in: call ``enable()`` (or set ``BRSCRAPER_COMPACT=1``) and
+every getter returns compact frames, or call ``compact(df)`` on any frame.
+"""
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = {'Team', 'Tm', 'team_id', 'team_code', 'Pos', 'Season', 'League', 'Lg', 'Conf', 'info'}
+
+INTEGER_TYPES = ['Int8', 'Int16', 'Int32', 'Int64']
+
+_enabled = bool(os.environ.get('BRSCRAPER_COMPACT'))
+
+def _integer_type(values):
+
+    low, high = np.nanmin(values), np.nanmax(values)
+    for name in INTEGER_TYPES:
+        info = np.iinfo(name.lower())
+        if info.min <= low and high <= info.max:
+            return name
+
+    return None
+
+def compact_column(series):
+    """
+    The compact version of one column (unchanged when no rule applies).
+    """
+
+    if series.name in CATEGORY_COLUMNS and not isinstance(series.dtype, pd.CategoricalDtype):
+        if series.dtype == object or pd.api.types.is_string_dtype(series):
+            return series.astype('category')
+
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return series
+
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    if np.isnan(values).all():
+        return series.astype('float32')
+
+    finite = values[~np.isnan(values)]
+    if np.isfinite(finite).all() and (finite == np.round(finite)).all():
+        name = _integer_type(finite)
+        if name:
+            return series.astype(name)
+
+    return series.astype('float32')
+
+def compact(df):
+    """
+    Return ``df`` with compact dtypes. Dicts of frames (e.g.
+    ``get_all_season_leaders``) are compacted value by value.
+    """
+
+    if isinstance(df, dict):
+        return {key: compact(value) for key, value in df.items()}
+
+    if not isinstance(df, pd.DataFrame):
+        return df
+
+    # Built in one go: setting columns one by one re-blocks the frame each time
+    out = pd.DataFrame({i: compact_column(column) for i, (_, column) in enumerate(df.items())}, index=df.index)
+    out.columns = df.columns
+
+    return out
+
+def enable():
+    """
+    Make every getter return compact frames.
+    """
+
+    global _enabled
+
+    _enabled = True
+
+def disable():
+
+    global _enabled
+
+    _enabled = False
+
+def enabled():
+
+    return _enabled
+
+def compactable(func):
+    """
+    Decorator applying ``compact`` to a getter's result when enabled.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        return compact(result) if _enabled else result
+
+    return wrapper
@@ -0,0 +1,386 @@
+"""
+Shared HTTP layer used by every getter in BRScraper.
+
+All pages are downloaded through one pooled ``requests.Session`` so that
+connections to basketball-reference.com are kept alive between calls
+instead of paying a new TCP+TLS handshake for every table.
+
+An optional on-disk cache (see ``enable_cache``) sits in front of the
+session; cached pages are served without touching the network and stale
+ones are revalidated with ``If-None-Match``/``If-Modified-Since``.
+
+Every network request first takes a slot from a shared token bucket
+(see ``BRScraper.ratelimit``); 429/503 answers are retried after the
+server's ``Retry-After``. The queue wait and network time of the last
+request are available from ``last_timing``.
+
+Parsed pages are memoized in memory for a few minutes (``read_html`` and
+``memoized``), so slicing the same page several ways costs one fetch and
+one parse.
+
+``configure(base_url=...)`` (or ``$BRSCRAPER_BASE_URL``) sends every
+request to another host, e.g. a local mirror or mock server.
+"""
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from io import StringIO
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from BRScraper import metrics, parse
+from BRScraper.cache import DiskCache
+from BRScraper.memo import LRUMemo
+from BRScraper.ratelimit import TokenBucket, parse_retry_after
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 30) # (connect, read) in seconds
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE = 5 # seconds, doubled on every retry without Retry-After
+RETRY_STATUSES = (429, 503)
+DEFAULT_MEMO_SIZE = 32 # parsed pages
+DEFAULT_MEMO_TTL = 600 # seconds
+BASE_URL = 'https://www.basketball-reference.com'
+
+logger = logging.getLogger(__name__)
+
+# Queue wait (rate limiter) and network time of one request, in seconds
+Timing = namedtuple('Timing', ['url', 'status', 'queue_wait', 'network', 'attempt'])
+
+_lock = threading.Lock()
+_session = None
+_injected = False
+_cache = None
+_limiter = TokenBucket()
+_local = threading.local()
+_memo = LRUMemo(DEFAULT_MEMO_SIZE, DEFAULT_MEMO_TTL)
+_config = {'pool_size': DEFAULT_POOL_SIZE,
+           'timeout': DEFAULT_TIMEOUT,
+           'max_retries': DEFAULT_MAX_RETRIES,
+           'base_url': (os.environ.get('BRSCRAPER_BASE_URL') or BASE_URL).rstrip('/')}
+
+def _build_session(pool_size):
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # gzip/deflate (and br when brotli is installed) plus keep-alive
+    session.headers.update({'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
+                            'Connection': 'keep-alive'})
+
+    return session
+
+def get_session():
+    """
+    Return the session shared by all getters, creating it on first use.
+    """
+
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = _build_session(_config['pool_size'])
+        return _session
+
+def set_session(session):
+    """
+    Use a caller-provided ``requests.Session`` for every request.
+
+    Parameters
+    ----------
+    session : requests.Session or None
+        Session to inject. ``None`` drops it and goes back to the
+        library-managed pooled session.
+
+    Returns
+    -------
+    requests.Session or None
+        The session injected before, ``None`` if it was library-managed,
+        so it can be put back afterwards.
+    """
+
+    global _session, _injected
+
+    with _lock:
+        previous = _session if _injected else None
+        _session = session
+        _injected = session is not None
+
+    return previous
+
+def configure(pool_size=None, timeout=None, requests_per_minute=None, max_retries=None,
+              memo_size=None, memo_ttl=None, base_url=None):
+    """
+    Change the settings of the shared session.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Maximum number of kept-alive connections per host.
+    timeout : float or tuple, optional
+        Timeout passed to ``requests``, either a single value or a
+        ``(connect, read)`` tuple.
+    requests_per_minute : float, optional
+        Maximum sustained request rate of the shared rate limiter.
+    max_retries : int, optional
+        How many times a 429/503 answer is retried.
+    memo_size : int, optional
+        How many parsed pages are kept in memory (0 disables the memo).
+    memo_ttl : float, optional
+        Seconds a parsed page stays in memory.
+    base_url : str, optional
+        Host every request is sent to instead of ``BASE_URL``, e.g.
+        ``'http://127.0.0.1:8000'`` for a local mock server. Pass
+        ``BASE_URL`` to go back to the real site.
+    """
+
+    global _session, _limiter, _memo
+
+    if pool_size is not None:
+        if pool_size <= 0:
+            raise ValueError(str(pool_size)+' is not a valid value. Try a value bigger than 0.')
+        with _lock:
+            _config['pool_size'] = pool_size
+            if not _injected:
+                _session = None
+
+    if timeout is not None:
+        _config['timeout'] = timeout
+
+    if requests_per_minute is not None:
+        _limiter = TokenBucket(requests_per_minute)
+
+    if max_retries is not None:
+        if max_retries < 0:
+            raise ValueError(str(max_retries)+' is not a valid value. Try a value bigger or equal than 0.')
+        _config['max_retries'] = max_retries
+
+    if memo_size is not None or memo_ttl is not None:
+        _memo = LRUMemo(_memo.maxsize if memo_size is None else memo_size,
+                        _memo.ttl if memo_ttl is None else memo_ttl)
+
+    if base_url is not None and base_url.rstrip('/') != _config['base_url']:
+        _config['base_url'] = base_url.rstrip('/')
+        # Memoized pages are keyed by the getters' URLs, not the host
+        _memo.clear()
+
+def clear_memo():
+    """
+    Forget every parsed page kept in memory.
+    """
+
+    _memo.clear()
+
+def memoized(key, loader):
+    """
+    Return the in-memory value for ``key``, computing it with ``loader()``
+    on a miss. Values are shared between callers and must not be mutated.
+    """
+
+    return _memo.get_or_load(key, loader)
+
+def set_rate_limiter(limiter):
+    """
+    Replace the shared rate limiter.
+
+    Parameters
+    ----------
+    limiter : TokenBucket or None
+        Any object with ``acquire``/``penalize``/``reward`` methods.
+        ``None`` disables rate limiting (e.g. against a local mirror).
+    """
+
+    global _limiter
+
+    _limiter = limiter
+
+def get_rate_limiter():
+
+    return _limiter
+
+def last_timing():
+    """
+    ``Timing`` of the last network request made by the current thread,
+    or ``None``.
+    """
+
+    return getattr(_local, 'timing', None)
+
+def enable_cache(directory=None):
+    """
+    Cache downloaded pages on disk.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Where to keep the pages. Defaults to ``$BRSCRAPER_CACHE_DIR`` or
+        ``~/.cache/BRScraper``.
+
+    Returns
+    -------
+    DiskCache
+    """
+
+    global _cache
+
+    _cache = DiskCache(directory)
+
+    return _cache
+
+def disable_cache():
+
+    global _cache
+
+    _cache = None
+
+def get_cache():
+
+    return _cache
+
+def resolve_url(url):
+    """
+    ``url`` on the configured base URL (unchanged for the real site).
+    """
+
+    base_url = _config['base_url']
+    if base_url != BASE_URL and url.startswith(BASE_URL):
+        return base_url+url[len(BASE_URL):]
+
+    return url
+
+def _measure(response, queue_wait, network):
+
+    # requests times the wait for the response headers; the rest is the body
+    elapsed = getattr(response, 'elapsed', None)
+    connect = min(elapsed.total_seconds(), network) if elapsed is not None else 0.0
+    content = getattr(response, 'content', None)
+
+    metrics.add('queue_wait', queue_wait)
+    metrics.add('connect', connect)
+    metrics.add('transfer', network-connect)
+    metrics.add('bytes', len(content) if content is not None else len(response.text.encode('utf-8')))
+    metrics.add('requests', 1)
+
+def get(url, **kwargs):
+    """
+    GET ``url`` through the shared session and rate limiter, retrying
+    429/503 answers, and raise on HTTP errors.
+
+    Returns
+    -------
+    requests.Response
+    """
+
+    url = resolve_url(url)
+    kwargs.setdefault('timeout', _config['timeout'])
+    session = get_session()
+    max_retries = _config['max_retries']
+
+    for attempt in range(max_retries+1):
+        limiter = _limiter
+        queue_wait = limiter.acquire() if limiter is not None else 0.0
+
+        start = time.monotonic()
+        response = session.get(url, **kwargs)
+        network = time.monotonic()-start
+
+        _local.timing = Timing(url, response.status_code, queue_wait, network, attempt)
+        if metrics.active():
+            _measure(response, queue_wait, network)
+        logger.debug('GET %s -> %s (queue %.3fs, network %.3fs)',
+                     url, response.status_code, queue_wait, network)
+
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            break
+
+        delay = parse_retry_after(response.headers.get('Retry-After'))
+        if delay is None:
+            delay = BACKOFF_BASE*2**attempt
+        logger.warning('%s returned %s, retrying in %.1fs', url, response.status_code, delay)
+
+        if limiter is not None:
+            limiter.penalize(delay)
+        else:
+            time.sleep(delay)
+            metrics.add('queue_wait', delay)
+
+    if limiter is not None and response.status_code < 400:
+        limiter.reward()
+
+    response.raise_for_status()
+
+    return response
+
+def get_html(url):
+    """
+    Return the decoded HTML of ``url``, from the cache when enabled.
+    """
+
+    url = resolve_url(url)
+    cache = _cache
+    if cache is None:
+        return get(url).text
+
+    entry = cache.load(url)
+    if entry is not None and cache.is_fresh(entry):
+        metrics.add('cache_hits', 1)
+        return entry['body']
+
+    headers = {}
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = get(url, headers=headers)
+
+    if entry is not None and response.status_code == 304:
+        cache.touch(url)
+        return entry['body']
+
+    cache.store(url, response.text, response.headers)
+
+    return response.text
+
+def read_html(url, **kwargs):
+    """
+    Drop-in replacement for ``pd.read_html(url)`` that downloads through
+    the shared session. Keyword arguments go to ``pd.read_html``.
+
+    The parsed tables are memoized per URL; every call gets its own
+    copies, so callers are free to modify them.
+    """
+
+    def load():
+        html = get_html(url)
+        with metrics.span('parse'):
+            return pd.read_html(StringIO(html), **kwargs)
+
+    key = ('read_html', url, tuple(sorted(kwargs.items())))
+    tables = memoized(key, load)
+
+    return [table.copy() for table in tables]
+
+def read_tables(url, href_re=parse.PLAYER_HREF_RE):
+    """
+    Like ``read_html`` but parsed with ``parse.read_tables``, so tables
+    with player links also get a ``player_id`` column (captured from the
+    links by ``href_re``). Memoized per URL; every call gets its own
+    copies.
+    """
+
+    key = ('read_tables', url, href_re.pattern)
+    tables = memoized(key, lambda: parse.read_tables(get_html(url), href_re=href_re))
+
+    return [table.copy() for table in tables]
+
+if os.environ.get('BRSCRAPER_CACHE_DIR'):
+    enable_cache()
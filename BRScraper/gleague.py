@@ -1,6 +1,9 @@
 import pandas as pd
 import warnings
+from BRScraper import aio, dtypes, fetch, identity, metrics
 
+@dtypes.compactable
+@metrics.instrumented
 def get_awards(award):
     
     values = ['mvp','roy','dpoy','mip','ipoy','all_gleague','all_rookie','all_defense','sc_mvp']
@@ -10,15 +13,49 @@ def get_awards(award):
     
     url = 'https://www.basketball-reference.com/gleague/awards/'+award+'.html'
 
-    df = pd.read_html(url)[0]
+    df = fetch.read_tables(url)[0]
 
     df.columns = df.columns.droplevel(0)
     df = df.dropna(how='all', axis=0) 
     df = df.dropna(how='all', axis=1)  
     df = df[(df['Player'].notna())&(df['Player']!='Player')].reset_index(drop=True)
     
+    # Feed the cross-league identity index used by players.get_career
+    if 'player_id' in df.columns:
+        identity.record('gleague', df['player_id'], df['Player'])
+    
     return df
 
+@dtypes.compactable
+@metrics.instrumented
+def get_player_stats(name):
+    
+    # 'name' may also be an exact G League player id such as 'cabocbr01d'
+    if identity.GLEAGUE_ID_RE.fullmatch(name.strip()):
+        player_id = name.strip()
+    else:
+        player_id = identity.resolve('gleague', name)
+        if player_id is None:
+            raise ValueError(name+' is not in the player index. Load a G League page where that player appears first (e.g. get_awards).')
+    
+    return _player_stats(player_id, name)
+
+def _player_stats(player_id, name=None):
+    
+    url = 'https://www.basketball-reference.com/gleague/players/'+player_id[0]+'/'+player_id+'.html'
+    
+    try:
+        df = fetch.read_html(url)[0]
+    except:
+        raise ValueError((name or player_id)+' is not a valid name. Check for mispelling errors or if that players exists.')
+    
+    df = df.dropna(how='all', axis=0)
+    df = df[df['Season'].astype(str).str.match(r'\d{4}-\d{2}')].reset_index(drop=True)
+    
+    return df
+
+@dtypes.compactable
+@metrics.instrumented
 def get_standings(season, info='total', showcase=False):
     
     values = ['total','east','west']
@@ -29,7 +66,7 @@ def get_standings(season, info='total', showcase=False):
     url = 'https://www.basketball-reference.com/gleague/years/'+str(season)+'.html'
     
     try:
-        df = pd.read_html(url)
+        df = fetch.read_html(url)
     except:
         raise ValueError(str(season)+' is not a valid season.')
     
@@ -65,3 +102,8 @@ def get_standings(season, info='total', showcase=False):
     df['Seed'] = df.index+1    
     
     return df
+
+# Async versions, e.g. `await gleague.aget_awards(...)`
+aget_awards = aio.asyncify(get_awards)
+aget_standings = aio.asyncify(get_standings)
+aget_player_stats = aio.asyncify(get_player_stats)
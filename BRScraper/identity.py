@@ -0,0 +1,227 @@
+"""
+Cross-league player identity index.
+
+The same person has a different id in each part of Basketball Reference:
+``cabocbr01`` for the NBA (``/players/c/cabocbr01.html``), ``cabocbr01d``
+for the G League (``/gleague/players/c/cabocbr01d.html``) and
+``bruno-caboclo-1`` for international leagues
+(``/international/players/bruno-caboclo-1.html``). The league getters
+record the ids they read from the player links of their tables here (the
+NBA ids live in the ``names`` index), and ``links`` joins them into one
+identity, so a player's pages in every league are known without a single
+request. Like the ``names`` index it is kept in memory unless ``enable()``
+is called or ``$BRSCRAPER_IDENTITY_INDEX`` is set.
+
+Ids are joined by structure first (a G League id is the NBA id plus
+``d``) and otherwise by the normalized name when only one player of that
+league has it.
+"""
+import json
+import logging
+import os
+import re
+import threading
+
+from BRScraper import names, persist
+
+logger = logging.getLogger(__name__)
+
+LEAGUES = ['nba', 'gleague', 'international']
+
+GLEAGUE_ID_RE = re.compile(r'[a-z]+[0-9]{2}d')
+INTERNATIONAL_ID_RE = re.compile(r'[a-z0-9]+(-[a-z0-9]+)*-[0-9]+')
+
+class IdentityIndex:
+    """
+    G League and international ``player_id -> name`` maps persisted to
+    ``path`` (``None`` keeps them in memory only).
+    """
+
+    def __init__(self, path=None):
+
+        self.path = path
+        self._lock = threading.RLock()
+        self._players = {'gleague': {}, 'international': {}}
+        self._by_name = {'gleague': {}, 'international': {}}
+
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            for league, players in data.get('players', {}).items():
+                for player_id, name in players.items():
+                    self._add(league, player_id, name)
+
+    def __len__(self):
+
+        return sum(len(players) for players in self._players.values())
+
+    def _add(self, league, player_id, name):
+
+        if player_id in self._players[league]:
+            return False
+
+        self._players[league][player_id] = name
+        self._by_name[league].setdefault(names.normalize(name), []).append(player_id)
+
+        return True
+
+    def add(self, league, player_ids, player_names):
+        """
+        Add the players of ``league`` (``'gleague'`` or
+        ``'international'``) and save the index when anything changed.
+        """
+
+        if league not in self._players:
+            raise ValueError(str(league)+' is not a valid value. Try one of: "'+'", "'.join(self._players)+'".')
+
+        with self._lock:
+            changed = False
+            for player_id, name in zip(player_ids, player_names):
+                if isinstance(player_id, str) and player_id and isinstance(name, str) and name:
+                    changed |= self._add(league, player_id, name.rstrip('*'))
+            if changed:
+                self.save()
+
+        return changed
+
+    def save(self):
+
+        if not self.path:
+            return
+
+        with self._lock:
+            persist.write_json(self.path, {'players': self._players})
+
+    def lookup(self, league, name):
+        """
+        Ids of every ``league`` player called ``name``.
+        """
+
+        with self._lock:
+            return list(self._by_name[league].get(names.normalize(name), []))
+
+    def name(self, league, player_id):
+
+        with self._lock:
+            return self._players[league].get(player_id)
+
+_shared = persist.SharedIndex(IdentityIndex, 'BRSCRAPER_IDENTITY_INDEX', 'identity.json')
+
+# Module-level access to the shared index, see ``persist.SharedIndex``
+default_path = _shared.default_path
+get_index = _shared.get
+set_index = _shared.set
+enable = _shared.enable
+disable = _shared.disable
+
+def record(league, player_ids, player_names):
+    """
+    Called by the G League and international getters with the ids and
+    names they just read.
+    """
+
+    try:
+        get_index().add(league, player_ids, player_names)
+    except Exception as e:
+        logger.warning('Could not update the identity index: %s', e)
+
+def _lookup(league, name):
+
+    if league == 'nba':
+        return names.lookup(name)
+
+    return get_index().lookup(league, name)
+
+def _name(league, player_id):
+
+    if league == 'nba':
+        found = names.get_index().names([player_id])[0]
+    else:
+        found = get_index().name(league, player_id)
+
+    return found
+
+def _pinned(player):
+    """
+    ``(league, player_id)`` when ``player`` is an indexed id.
+    """
+
+    player = player.strip()
+    for league in LEAGUES:
+        if _name(league, player) is not None:
+            return league, player
+
+    return None
+
+def _link_structure(found):
+
+    # A G League id is the NBA id plus 'd'
+    if 'nba' in found and 'gleague' not in found and _name('gleague', found['nba']+'d') is not None:
+        found['gleague'] = found['nba']+'d'
+    if 'gleague' in found and 'nba' not in found and GLEAGUE_ID_RE.fullmatch(found['gleague']):
+        if _name('nba', found['gleague'][:-1]) is not None:
+            found['nba'] = found['gleague'][:-1]
+
+def resolve(league, player):
+    """
+    ``player_id`` in ``league`` of ``player`` (a name or an id of any
+    league, see ``links``). ``None`` when the index has no such player in
+    that league.
+    """
+
+    if _pinned(player):
+        return links(player).get(league)
+
+    ids = _lookup(league, player)
+    if len(ids) > 1:
+        raise ValueError('There are several '+league+' players called '+player+
+                         '. Try one of these player ids instead: '+', '.join(ids)+'.')
+
+    return ids[0] if ids else None
+
+def links(player):
+    """
+    Ids of ``player`` in every league the index knows them in.
+
+    Parameters
+    ----------
+    player : str
+        A name (any case, accents optional) or an id of any league
+        (``'cabocbr01'``, ``'cabocbr01d'``, ``'bruno-caboclo-1'``).
+
+    Returns
+    -------
+    dict
+        League (``'nba'``, ``'gleague'``, ``'international'``) to id,
+        only for the leagues where the player was found.
+
+    Raises
+    ------
+    ValueError
+        When ``player`` is a name and several players of one league have
+        it; the message lists the candidate ids. A given id is only linked
+        to leagues where its name is unambiguous.
+    """
+
+    pinned = _pinned(player)
+    if pinned:
+        league, player_id = pinned
+        found = {league: player_id}
+        name = _name(league, player_id)
+    else:
+        found = {}
+        name = player
+
+    for league in LEAGUES:
+        _link_structure(found)
+        if league in found:
+            continue
+        ids = _lookup(league, name)
+        if len(ids) == 1:
+            found[league] = ids[0]
+        elif len(ids) > 1 and not pinned:
+            raise ValueError('There are several '+league+' players called '+name+
+                             '. Try one of these player ids instead: '+', '.join(ids)+'.')
+    _link_structure(found)
+
+    return {league: found[league] for league in LEAGUES if league in found}
@@ -0,0 +1,7 @@
+"""
+International competitions.
+
+Each league has its own module (``from BRScraper.international import
+euroleague``); ``get_stats_many`` sweeps several of them at once.
+"""
+from BRScraper.international.leagues import CLUB_LEAGUES, LEAGUES, aget_stats_many, get_stats_many, register
@@ -0,0 +1,185 @@
+"""
+Registry of the international competitions and the one engine behind
+all of their getters.
+
+Every league lives under ``/international/<slug>/`` with the same page
+layout, so a league is just a name -> slug entry in ``LEAGUES``. The
+league modules (``euroleague``, ``acb``, ...) call this engine, and
+``get_stats_many`` sweeps many leagues and seasons concurrently through
+the shared session, cache and rate limiter.
+"""
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from BRScraper import aio, dtypes, fetch, identity, metrics, parse
+
+BASE_URL = 'https://www.basketball-reference.com/international/'
+
+LEAGUES = {
+    'aba': 'aba-adriatic',
+    'acb': 'spain-liga-acb',
+    'cba': 'cba-china',
+    'eurocup': 'eurocup',
+    'euroleague': 'euroleague',
+    'greece': 'greek-basket-league',
+    'israel': 'israel-super-league',
+    'italy': 'italy-basket-serie-a',
+    'lnb': 'france-lnb-pro-a',
+    'nbl': 'nbl-australia',
+    'russia': 'vtb-united',
+    'turkey': 'turkey-super-league',
+    'olympics': 'mens-olympics',
+    'olympics_women': 'womens-olympics',
+}
+
+CLUB_LEAGUES = ['aba','acb','cba','eurocup','euroleague','greece','israel','italy','lnb','nbl','russia','turkey']
+
+STATS_PAGES = {'per_game': '_per_game', 'totals': '_totals', 'per_36': '_per_minute'}
+
+def register(name, slug):
+    """
+    Add a competition, e.g. ``register('lkl', 'lithuania-lkl')`` for
+    ``/international/lithuania-lkl/``.
+    """
+
+    LEAGUES[name] = slug
+
+def _slug(league):
+
+    if league not in LEAGUES:
+        raise ValueError(str(league)+' is not a valid league. Try one of: "'+'", "'.join(LEAGUES)+'".')
+
+    return LEAGUES[league]
+
+def _get_stats(league, season, info='per_game', rename=False):
+
+    slug = _slug(league)
+
+    if info not in STATS_PAGES:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(STATS_PAGES)+'".')
+
+    url = BASE_URL+slug+'/'+str(season)+STATS_PAGES[info]+'.html'
+
+    try:
+        df = fetch.read_tables(url, href_re=parse.INTERNATIONAL_HREF_RE)[0]
+    except:
+        raise ValueError(str(season)+' is not a valid season.')
+
+    df = df[(df['Player'].notna())&(df['Player']!='Player')].reset_index(drop=True)
+
+    # Feed the cross-league identity index used by players.get_career
+    if 'player_id' in df.columns:
+        identity.record('international', df['player_id'], df['Player'])
+
+    if rename:
+        cols = ['player_id','Player','Team','G']
+        for column in df.columns:
+            if column not in cols:
+                new_column = column+'_'+info
+                df = df.rename(columns={column:new_column})
+
+    df['Season'] = str(int(str(season))-1)+'-'+str(season)[-2:]
+
+    return df
+
+@dtypes.compactable
+@metrics.instrumented
+def get_stats(league, season, info='per_game', rename=False):
+
+    return _get_stats(league, season, info, rename)
+
+@dtypes.compactable
+@metrics.instrumented
+def get_standings(league, season):
+
+    url = BASE_URL+_slug(league)+'/'+str(season)+'.html'
+
+    try:
+        df = fetch.read_html(url)[0]
+    except:
+        raise ValueError(str(season)+' is not a valid season.')
+
+    df = df.rename(columns={'Unnamed: 0_level_1':'Team'})
+    df.columns = df.columns.droplevel(0)
+    df['Seed'] = df.index+1
+
+    return df
+
+@dtypes.compactable
+@metrics.instrumented
+def get_stats_many(leagues=None, seasons=(), info='per_game', max_workers=4, errors='raise'):
+    """
+    Get the stats of several leagues and seasons in one call.
+
+    Pages are fetched concurrently by a bounded pool of workers, all going
+    through the shared session, cache and rate limiter.
+
+    Parameters
+    ----------
+    leagues : iterable of str, optional
+        Names from ``LEAGUES``. Defaults to every club league
+        (``CLUB_LEAGUES``).
+    seasons : iterable of int
+        Desired seasons (in format ``2023``).
+    info : str, optional
+        ``'per_game'``, ``'totals'`` or ``'per_36'``.
+    max_workers : int, optional
+        Maximum number of pages fetched at the same time.
+    errors : str, optional
+        ``'raise'`` to fail on the first unavailable page, ``'warn'`` to
+        skip it with a warning (not every league has every season).
+
+    Returns
+    -------
+    pd.DataFrame
+        All the frames stacked, with a ``League`` key column; ``League``
+        and ``Season`` are categorical.
+    """
+
+    leagues = list(CLUB_LEAGUES) if leagues is None else [leagues] if isinstance(leagues, str) else leagues
+    leagues = list(dict.fromkeys(leagues))
+    seasons = list(seasons)
+
+    for league in leagues:
+        _slug(league)
+
+    if info not in STATS_PAGES:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(STATS_PAGES)+'".')
+
+    if errors not in ['raise','warn']:
+        raise ValueError(str(errors)+' is not a valid value. Try one of: "raise", "warn".')
+
+    units = [(league, season) for league in leagues for season in seasons]
+
+    def fetch_unit(unit):
+        league, season = unit
+        try:
+            df = _get_stats(league, season, info=info)
+        except ValueError as e:
+            if errors=='raise':
+                raise ValueError(league+': '+str(e))
+            warnings.warn('WARNING: skipping '+league+' '+str(season)+': '+str(e))
+            return None
+        df['League'] = league
+        return df
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dfs = [df for df in executor.map(metrics.bind(fetch_unit), units) if df is not None]
+
+    if not dfs:
+        return pd.DataFrame(columns=['Season','League'])
+
+    df = pd.concat(dfs, ignore_index=True)
+
+    season_labels = [str(int(str(season))-1)+'-'+str(season)[-2:] for season in seasons]
+    df['Season'] = pd.Categorical(df['Season'], categories=list(dict.fromkeys(season_labels)), ordered=True)
+    df['League'] = pd.Categorical(df['League'], categories=leagues)
+
+    return df
+
+# Async versions, e.g. `await leagues.aget_stats('euroleague', 2024)`
+aget_stats = aio.asyncify(get_stats)
+aget_standings = aio.asyncify(get_standings)
+aget_stats_many = aio.asyncify(get_stats_many)
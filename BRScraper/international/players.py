@@ -1,25 +1,40 @@
 import pandas as pd
 import warnings
+from BRScraper import aio, dtypes, fetch, gleague, identity, metrics, nba
 import re
 
-def get_player_stats(name):
+def _player_id(name):
+    
+    # 'name' may also be an exact international player id such as 'bruno-caboclo-1'
+    if identity.INTERNATIONAL_ID_RE.fullmatch(name.strip()):
+        return name.strip()
+    
+    player_id = identity.resolve('international', name)
+    if player_id is not None:
+        return player_id
     
+    # Players no league page has shown yet: the first player of a name gets '-1'
     name2 = re.sub('[^a-zA-Z0-9 \n\.]', '', name)
 
     if name2!=name:
         raise ValueError(name+' has special characters and is not a valid name. Try replacing the special characters.')
     
-    try:
-        name_url = name.lower().strip().replace(' ','-')
+    return name.lower().strip().replace(' ','-')+'-1'
 
-        url = 'https://www.basketball-reference.com/international/players/'+name_url+'-1.html'
-    except:
-        raise ValueError(name+''' is not in a valid name format.
-                        Valid names would be "Bruno Caboclo", 'bruno caboclo' or "BRUNO CABOCLO" for example.''')
+@dtypes.compactable
+@metrics.instrumented
+def get_player_stats(name):
+    
+    return _player_stats(_player_id(name), name)
+
+def _player_stats(player_id, name=None):
+    
+    url = 'https://www.basketball-reference.com/international/players/'+player_id+'.html'
+    
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_html(url)[0]
     except:
-        raise ValueError(name+' is not a valid name. Check for mispelling errors or if that players exists.')
+        raise ValueError((name or player_id)+' is not a valid name. Check for mispelling errors or if that players exists.')
                          
     df = df.dropna(how='all', axis=0)
     
@@ -29,12 +44,48 @@ def get_player_stats(name):
     
     return df
 
+@dtypes.compactable
+@metrics.instrumented
+def get_career(name):
+    """
+    Get a player's career in every league: NBA, G League and international.
+
+    The player's id in each league comes from the local identity index
+    (filled by ``nba.get_stats``, ``gleague.get_awards`` and the
+    international ``get_stats``), so this is one request per league the
+    player played in and none for the others.
+
+    Parameters
+    ----------
+    name : str
+        Player name or an id of any league (``'jamesle01'``,
+        ``'cabocbr01d'``, ``'bruno-caboclo-1'``).
+
+    Returns
+    -------
+    dict of pd.DataFrame
+        League (``'nba'``, ``'gleague'``, ``'international'``) to that
+        league's season-by-season stats.
+    """
+    
+    ids = identity.links(name)
+    
+    if not ids:
+        raise ValueError(name+' is not in the player index. Load a season of the leagues that player played in first (e.g. nba.get_stats).')
+    
+    # Ids are already resolved: read each page directly, compacting once on the way out
+    getters = {'nba': nba._player_stats, 'gleague': gleague._player_stats, 'international': _player_stats}
+    
+    return {league: getters[league](player_id) for league, player_id in ids.items()}
+
+@dtypes.compactable
+@metrics.instrumented
 def get_mvps():
 
     url = 'https://www.basketball-reference.com/international/awards/mvp.html'
 
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_html(url)[0]
     except:
         raise ValueError(name+' is not a valid name. Check for mispelling errors or if that players exists.')
 
@@ -43,3 +94,8 @@ def get_mvps():
     df = df[(df['Player'].notna())&(df['Player']!='Player')].reset_index(drop=True)
     
     return df
+
+# Async versions, e.g. `await players.aget_player_stats(...)`
+aget_player_stats = aio.asyncify(get_player_stats)
+aget_mvps = aio.asyncify(get_mvps)
+aget_career = aio.asyncify(get_career)
@@ -0,0 +1,145 @@
+"""
+Leaderboards computed locally from season stats.
+
+``nba.get_season_leaders`` is limited to the site's top 20 (10 in the
+playoffs) of one season and costs a fetch per call. ``get_leaders`` ranks
+any stat of the stored ``get_stats`` seasons (or of a frame you pass)
+over any season range, with any depth and a minimum games qualifier. The
+top ``n`` are picked with ``np.argpartition``, which is linear in the
+number of rows, and only those ``n`` are sorted.
+"""
+import numpy as np
+import pandas as pd
+
+from BRScraper import career, dtypes, metrics, names, warehouse
+
+def top_n(values, n, ascending=False):
+    """
+    Positions of the ``n`` best values, best first. NaN values are never
+    picked.
+
+    Parameters
+    ----------
+    values : array-like
+    n : int
+    ascending : bool, optional
+        ``True`` when lower is better (e.g. turnovers).
+
+    Returns
+    -------
+    np.ndarray
+    """
+
+    key = np.asarray(values, dtype=float)
+    if not ascending:
+        key = -key
+
+    valid = np.flatnonzero(~np.isnan(key))
+    n = min(n, len(valid))
+    if n <= 0:
+        return np.array([], dtype=int)
+
+    key = key[valid]
+    if n < len(key):
+        best = np.argpartition(key, n-1)[:n]
+    else:
+        best = np.arange(len(key))
+
+    return valid[best[np.argsort(key[best], kind='stable')]]
+
+def _season_filter(df, seasons):
+
+    column = 'season_year' if 'season_year' in df.columns else 'Season'
+    years = df[column].map(warehouse.season_year)
+
+    if isinstance(seasons, tuple):
+        first, last = (warehouse.season_year(s) for s in seasons)
+        return df[(years >= first) & (years <= last)]
+
+    if isinstance(seasons, (list, set, range)):
+        return df[years.isin([warehouse.season_year(s) for s in seasons])]
+
+    return df[years == warehouse.season_year(seasons)]
+
+@dtypes.compactable
+@metrics.instrumented
+def get_leaders(stat, n=10, seasons=None, info='totals', playoffs=False, min_games=0,
+                career_totals=False, ascending=False, df=None):
+    """
+    Top ``n`` player seasons (or careers) in ``stat``.
+
+    Parameters
+    ----------
+    stat : str
+        Any numeric column of the ``info`` tables (e.g. ``'PTS'``,
+        ``'WS'``, ``'TS%'``).
+    n : int, optional
+        Depth of the leaderboard, without upper limit.
+    seasons : int, str, list or tuple, optional
+        One season (``2010`` or ``'2009-10'``), a list, or a
+        ``(first, last)`` range. All stored seasons by default.
+    info : str, optional
+        ``get_stats`` format of the stored data (``warehouse`` table
+        ``'stats_'+info``).
+    playoffs : bool, optional
+        Regular season or playoffs rows of the warehouse.
+    min_games : int, optional
+        Minimum games played (``G``) to qualify.
+    career_totals : bool, optional
+        Rank summed careers over ``seasons`` instead of single seasons
+        (counting stats of ``totals`` data only).
+    ascending : bool, optional
+        ``True`` when lower is better.
+    df : pd.DataFrame, optional
+        Stacked ``get_stats`` frames to rank instead of the warehouse.
+
+    Returns
+    -------
+    pd.DataFrame
+        The leaderboard rows with ``Rk`` (ties share a rank) and
+        ``Player`` (from the player index, else from the stored rows)
+        first.
+    """
+
+    if n <= 0:
+        raise ValueError(str(n)+' is not a valid value. Try a value bigger than 0.')
+
+    if df is None:
+        if isinstance(seasons, range):
+            seasons = list(seasons)
+        # Single seasons only need the key columns and the stat
+        stored = warehouse.get_store().columns('stats_'+info) if warehouse.get_store() else []
+        columns = None
+        if not career_totals and stat in stored:
+            columns = [c for c in dict.fromkeys(['player_id','Player','team_code','season_year','G',stat])
+                       if c in stored]
+        df = warehouse.query('stats_'+info, season=seasons, playoffs=playoffs, columns=columns)
+    elif seasons is not None:
+        df = _season_filter(df, seasons)
+
+    df = df[df['player_id'].notna()]
+    stored_names = None
+    if 'Player' in df.columns:
+        stored_names = df.dropna(subset=['Player']).drop_duplicates('player_id', keep='last')
+        stored_names = stored_names.set_index('player_id')['Player']
+        df = df.drop(columns=['Player'])
+    df = career.career_totals(df) if career_totals else career.season_rows(df)
+
+    if stat not in df.columns:
+        raise ValueError(str(stat)+' is not a valid stat. Try one of: "'+'", "'.join(map(str, df.columns))+'".')
+
+    if min_games:
+        df = df[pd.to_numeric(df['G'], errors='coerce') >= min_games]
+
+    values = pd.to_numeric(df[stat], errors='coerce').to_numpy(dtype=float)
+    best = top_n(values, n, ascending)
+
+    out = df.iloc[best].reset_index(drop=True)
+    ranks = pd.Series(values[best]).rank(method='min', ascending=ascending).astype(int)
+    players = pd.Series(names.get_index().names(out['player_id']), dtype=object)
+    if stored_names is not None:
+        players = players.fillna(out['player_id'].map(stored_names))
+    out.insert(0, 'Player', players.to_numpy())
+    out.insert(0, 'Rk', ranks.to_numpy())
+
+    return out
@@ -0,0 +1,76 @@
+"""
+Small thread-safe LRU memo with a time-to-live.
+
+Used by ``fetch`` to keep the parsed tables of recently read pages in
+memory, so getters that slice the same page differently (east/west
+standings, the award voting tables, ...) pay for one fetch and one parse.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+class LRUMemo:
+    """
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries kept; 0 disables the memo.
+    ttl : float or None
+        Seconds an entry stays valid, ``None`` for no expiry.
+    """
+
+    def __init__(self, maxsize=32, ttl=600):
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the value stored for ``key`` or ``None``.
+        """
+
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if self.ttl is not None and time.monotonic()-stored_at >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """
+        Return the memoized value for ``key``, calling ``loader()`` and
+        storing its result on a miss.
+        """
+
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.put(key, value)
+
+        return value
+
+    def clear(self):
+
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+
+        return len(self._data)
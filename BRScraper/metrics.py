@@ -0,0 +1,311 @@
+"""
+Per-call timing of the getters.
+
+Once a hook is added (``add_hook``), every getter call produces one
+``Call`` record splitting its time into stages: waiting for the rate
+limiter (``queue_wait``), waiting for the response headers (``connect``:
+DNS, connect, TLS and server time), downloading the body (``transfer``),
+turning HTML into DataFrames (``parse``) and everything else the getter
+does with them (``transform``), plus the bytes downloaded and the rows
+returned. Hooks receive the records as they happen; ``JSONLinesExporter``
+and ``PrometheusExporter`` are ready-made hooks.
+
+Getters called by another getter on the same thread (e.g.
+``players.get_career``) are counted in the outer call, which is the only
+one reported. Bulk getters run their pages on worker threads through
+``bind``, so those pages are counted in the bulk call too; its stages
+then add up the time of every worker and can exceed ``seconds``.
+
+Without hooks nothing is measured. ``BRSCRAPER_METRICS=calls.jsonl``
+adds a ``JSONLinesExporter`` writing to that file on import.
+"""
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('queue_wait', 'connect', 'transfer', 'parse', 'transform')
+
+COUNTS = ('bytes', 'requests', 'cache_hits')
+
+Call = namedtuple('Call', ['getter', 'timestamp', 'seconds', *STAGES, *COUNTS, 'rows', 'error'])
+
+_hooks = []
+_hooks_lock = threading.Lock()
+_local = threading.local()
+
+class _Active:
+
+    __slots__ = ('getter', 'timestamp', 'start', 'values', 'open', 'lock')
+
+    def __init__(self, getter):
+        self.getter = getter
+        self.timestamp = time.time()
+        self.start = time.perf_counter()
+        self.values = {**dict.fromkeys(STAGES, 0.0), **dict.fromkeys(COUNTS, 0)}
+        self.open = set()
+        self.lock = threading.Lock()
+
+    def merge(self, values):
+        with self.lock:
+            for name, value in values.items():
+                self.values[name] += value
+
+def add_hook(hook):
+    """
+    Call ``hook(call)`` with the ``Call`` record of every getter call.
+    Exceptions raised by hooks are logged, never propagated.
+    """
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = _hooks+[hook]
+
+    return hook
+
+def remove_hook(hook):
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = [h for h in _hooks if h is not hook]
+
+def clear_hooks():
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = []
+
+def _current():
+
+    stack = getattr(_local, 'stack', None)
+
+    return stack[-1] if stack else None
+
+def active():
+    """
+    Whether the current thread is inside a measured getter call.
+    """
+
+    return _current() is not None
+
+def add(name, value):
+    """
+    Add ``value`` to a stage (seconds) or a count of the current call.
+    """
+
+    call = _current()
+    if call is not None:
+        with call.lock:
+            call.values[name] += value
+
+@contextmanager
+def span(stage):
+    """
+    Time the block as ``stage`` of the current call. Nested spans of the
+    same stage are counted once.
+    """
+
+    call = _current()
+    if call is None or stage in call.open:
+        yield
+        return
+
+    call.open.add(stage)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        call.values[stage] += time.perf_counter()-start
+        call.open.discard(stage)
+
+def _rows(result):
+
+    if isinstance(result, dict):
+        return sum(_rows(value) or 0 for value in result.values())
+
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+def _emit(call):
+
+    for hook in _hooks:
+        try:
+            hook(call)
+        except Exception as e:
+            logger.warning('Metrics hook %r failed: %s', hook, e)
+
+def instrumented(func):
+    """
+    Decorator reporting a ``Call`` record for every call of a getter.
+    """
+
+    getter = func.__module__.replace('BRScraper.', '', 1)+'.'+func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        call = _Active(getter)
+        stack.append(call)
+
+        result, error = None, None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter()-call.start
+            stack.pop()
+            if stack:
+                # Nested getter: its stages belong to the outer call
+                stack[-1].merge(call.values)
+            else:
+                values = call.values
+                values['transform'] = max(0.0, seconds-sum(values[stage] for stage in STAGES[:-1]))
+                _emit(Call(getter, call.timestamp, seconds, *[values[name] for name in STAGES+COUNTS],
+                           _rows(result) if error is None else None, error))
+
+    return wrapper
+
+def bind(func):
+    """
+    ``func`` counted in the current call when it runs on another thread,
+    e.g. the pages a bulk getter fetches on its worker threads. Returns
+    ``func`` unchanged outside a measured call.
+    """
+
+    parent = _current()
+    if parent is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        # Each thread gets its own record (spans are per thread), merged when done
+        call = _Active(parent.getter)
+        stack.append(call)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stack.pop()
+            parent.merge(call.values)
+
+    return wrapper
+
+class JSONLinesExporter:
+    """
+    Hook appending every ``Call`` as one JSON object per line to ``path``.
+    """
+
+    def __init__(self, path):
+
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+
+        line = json.dumps(call._asdict())+'\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+_HELP = {'bytes': 'Bytes downloaded by getter calls.', 'requests': 'HTTP requests made by getter calls.',
+         'cache_hits': 'Pages getter calls read from the disk cache.', 'rows': 'Rows returned by getter calls.',
+         'errors': 'Getter calls that raised.'}
+
+class PrometheusExporter:
+    """
+    Hook aggregating the calls per getter into Prometheus metrics: a
+    ``brscraper_call_seconds`` histogram (for p50/p99 with
+    ``histogram_quantile``), the time of each stage, and bytes, requests,
+    rows and errors counters. ``render()`` returns the text exposition
+    format; ``write(path)`` saves it atomically, e.g. for the node
+    exporter's textfile collector.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, buckets=BUCKETS):
+
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._getters = {}
+
+    def __call__(self, call):
+
+        with self._lock:
+            entry = self._getters.get(call.getter)
+            if entry is None:
+                entry = self._getters[call.getter] = {
+                    'buckets': [0]*len(self.buckets), 'count': 0, 'sum': 0.0,
+                    'stages': dict.fromkeys(STAGES, 0.0), 'counts': dict.fromkeys(COUNTS+('rows', 'errors'), 0)}
+            for i, bound in enumerate(self.buckets):
+                if call.seconds <= bound:
+                    entry['buckets'][i] += 1
+            entry['count'] += 1
+            entry['sum'] += call.seconds
+            for stage in STAGES:
+                entry['stages'][stage] += getattr(call, stage)
+            for name in COUNTS:
+                entry['counts'][name] += getattr(call, name)
+            entry['counts']['rows'] += call.rows or 0
+            entry['counts']['errors'] += call.error is not None
+
+    def render(self):
+
+        lines = ['# HELP brscraper_call_seconds Duration of getter calls.',
+                 '# TYPE brscraper_call_seconds histogram']
+        with self._lock:
+            getters = sorted(self._getters.items())
+            for getter, entry in getters:
+                label = 'getter="'+getter+'"'
+                for bound, n in zip(self.buckets, entry['buckets']):
+                    lines.append('brscraper_call_seconds_bucket{'+label+',le="'+repr(float(bound))+'"} '+str(n))
+                lines.append('brscraper_call_seconds_bucket{'+label+',le="+Inf"} '+str(entry['count']))
+                lines.append('brscraper_call_seconds_sum{'+label+'} '+repr(entry['sum']))
+                lines.append('brscraper_call_seconds_count{'+label+'} '+str(entry['count']))
+
+            lines += ['# HELP brscraper_stage_seconds_total Time of getter calls by stage.',
+                      '# TYPE brscraper_stage_seconds_total counter']
+            for getter, entry in getters:
+                for stage, seconds in entry['stages'].items():
+                    lines.append('brscraper_stage_seconds_total{getter="'+getter+'",stage="'+stage+'"} '+repr(seconds))
+
+            for name, text in _HELP.items():
+                lines += ['# HELP brscraper_'+name+'_total '+text,
+                          '# TYPE brscraper_'+name+'_total counter']
+                for getter, entry in getters:
+                    lines.append('brscraper_'+name+'_total{getter="'+getter+'"} '+str(entry['counts'][name]))
+
+        return '\n'.join(lines)+'\n'
+
+    def write(self, path):
+
+        directory = os.path.dirname(path) or '.'
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+if os.environ.get('BRSCRAPER_METRICS'):
+    add_hook(JSONLinesExporter(os.environ['BRSCRAPER_METRICS']))
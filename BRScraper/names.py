@@ -0,0 +1,312 @@
+"""
+Player name to ``player_id`` index.
+
+Basketball Reference player pages live at ``/players/j/jamesle01.html``;
+the id cannot be reliably guessed from the name (duplicate names get
+``02``, ``03``, ... suffixes, and many ids do not follow the
+``last5+first2`` rule). The index is filled from the ids ``get_stats``
+already reads and from the alphabetical player index pages, and answers
+lookups, prefix searches and fuzzy searches in memory. It is only saved
+to disk (JSON next to the page cache) after ``enable()`` or with
+``$BRSCRAPER_PLAYER_INDEX`` set.
+"""
+import bisect
+import difflib
+import json
+import logging
+import os
+import re
+import string
+import threading
+import unicodedata
+
+import pandas as pd
+
+from BRScraper import fetch, parse, persist
+
+logger = logging.getLogger(__name__)
+
+INDEX_URL = 'https://www.basketball-reference.com/players/{letter}/'
+
+_suffixes = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+_clean_re = re.compile(r'[^a-z0-9 ]+')
+
+def normalize(name):
+    """
+    Lowercase ``name`` and drop accents, punctuation and Hall of Fame
+    stars, so ``'Nikola Jokić'`` and ``'nikola jokic'`` are the same key.
+    """
+
+    name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii')
+    name = _clean_re.sub('', name.lower().replace('-', ' '))
+
+    return ' '.join(name.split())
+
+def _surname_key(key):
+
+    words = key.split()
+    while len(words) > 1 and words[-1] in _suffixes:
+        words.pop()
+
+    return ' '.join(words[1:]+words[:1])
+
+class PlayerIndex:
+    """
+    In-memory name index persisted to ``path`` (``None`` keeps it in
+    memory only).
+    """
+
+    def __init__(self, path=None):
+
+        self.path = path
+        self._lock = threading.RLock()
+        self._players = {}
+        self._by_name = {}
+        self._sorted = None
+        self._letters = set()
+
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._letters = set(data.get('letters', []))
+            for player_id, entry in data.get('players', {}).items():
+                self._add(player_id, entry['name'], entry.get('from'), entry.get('to'))
+
+    def __len__(self):
+
+        return len(self._players)
+
+    def _add(self, player_id, name, first=None, last=None):
+
+        entry = self._players.get(player_id)
+        if entry is None:
+            entry = self._players[player_id] = {'name': name, 'from': first, 'to': last}
+            self._by_name.setdefault(normalize(name), []).append(player_id)
+            self._sorted = None
+            return True
+
+        changed = False
+        if first is not None and (entry['from'] is None or first < entry['from']):
+            entry['from'], changed = first, True
+        if last is not None and (entry['to'] is None or last > entry['to']):
+            entry['to'], changed = last, True
+
+        return changed
+
+    def add(self, player_ids, names, first=None, last=None):
+        """
+        Add players (or widen their ``from``/``to`` seasons) and save the
+        index when anything changed.
+        """
+
+        with self._lock:
+            changed = False
+            for player_id, name in zip(player_ids, names):
+                if player_id and isinstance(name, str) and name:
+                    changed |= self._add(player_id, name.rstrip('*'), first, last)
+            if changed:
+                self.save()
+
+        return changed
+
+    def save(self):
+
+        if not self.path:
+            return
+
+        with self._lock:
+            persist.write_json(self.path, {'letters': sorted(self._letters), 'players': self._players})
+
+    def lookup(self, name):
+        """
+        Ids of every player called ``name`` (any case, accents optional).
+        """
+
+        with self._lock:
+            return list(self._by_name.get(normalize(name), []))
+
+    def names(self, player_ids):
+        """
+        Display name of each id, ``None`` for ids not in the index.
+        """
+
+        with self._lock:
+            return [self._players[i]['name'] if i in self._players else None for i in player_ids]
+
+    def frame(self, player_ids):
+
+        with self._lock:
+            rows = [(i, self._players[i]['name'], self._players[i]['from'], self._players[i]['to'])
+                    for i in player_ids]
+
+        df = pd.DataFrame(rows, columns=['player_id', 'Player', 'From', 'To'])
+        df[['From', 'To']] = df[['From', 'To']].astype('Int64')
+
+        return df
+
+    def _keys(self):
+
+        with self._lock:
+            if self._sorted is None:
+                names = list(self._by_name)
+                self._sorted = (sorted(names), sorted((_surname_key(k), k) for k in names))
+            return self._sorted
+
+    def search(self, prefix, limit=10):
+        """
+        Players whose first or last name starts with ``prefix``
+        (``'lebron ja'``, ``'james le'`` and ``'jam'`` all find LeBron
+        James).
+        """
+
+        query = normalize(prefix)
+        if not query:
+            return self.frame([])
+
+        names, surnames = self._keys()
+        found = []
+        i = bisect.bisect_left(names, query)
+        while i < len(names) and names[i].startswith(query):
+            found.append(names[i])
+            i += 1
+        i = bisect.bisect_left(surnames, (query,))
+        while i < len(surnames) and surnames[i][0].startswith(query):
+            found.append(surnames[i][1])
+            i += 1
+
+        ids = [i for key in dict.fromkeys(found) for i in self._by_name[key]]
+
+        return self.frame(ids[:limit])
+
+    def fuzzy(self, name, limit=10, cutoff=0.75):
+        """
+        Players whose name is close to ``name`` (typos, missing letters).
+        """
+
+        names, _ = self._keys()
+        keys = difflib.get_close_matches(normalize(name), names, n=limit, cutoff=cutoff)
+
+        return self.frame([i for key in keys for i in self._by_name[key]][:limit])
+
+    def load_letter(self, letter):
+        """
+        Add every player of the Basketball Reference index page of
+        ``letter`` (last name initial).
+        """
+
+        letter = letter.lower()
+        html = fetch.get_html(INDEX_URL.format(letter=letter))
+        df = parse.read_table(html, 'players')
+        df = df[df['player_id'].notna()]
+
+        with self._lock:
+            for player_id, name, first, last in zip(df['player_id'], df['Player'], df['From'], df['To']):
+                self._add(player_id, str(name).rstrip('*'), int(first), int(last))
+            self._letters.add(letter)
+            self.save()
+
+    def letters(self):
+
+        with self._lock:
+            return set(self._letters)
+
+_shared = persist.SharedIndex(PlayerIndex, 'BRSCRAPER_PLAYER_INDEX', 'players.json')
+
+# Module-level access to the shared index, see ``persist.SharedIndex``
+default_path = _shared.default_path
+get_index = _shared.get
+set_index = _shared.set
+enable = _shared.enable
+disable = _shared.disable
+
+def record(player_ids, names, season=None):
+    """
+    Called by ``get_stats`` with the ids and names it just read.
+    """
+
+    try:
+        get_index().add(player_ids, names, season, season)
+    except Exception as e:
+        logger.warning('Could not update the player index: %s', e)
+
+def lookup(name):
+    """
+    Ids of every indexed player called ``name``, see ``PlayerIndex.lookup``.
+    """
+
+    return get_index().lookup(name)
+
+def _initials(name):
+
+    words = normalize(name).split()
+    while len(words) > 1 and words[-1] in _suffixes:
+        words.pop()
+
+    return list(dict.fromkeys(w[0] for w in words[1:]+words[:1] if w[0] in string.ascii_lowercase))
+
+def resolve(name):
+    """
+    ``player_id`` of the player called ``name``.
+
+    The index is searched first; on a miss the index pages of the last
+    name initials are fetched once and searched again.
+
+    Raises
+    ------
+    ValueError
+        When no player or several players have that name; the message
+        lists the closest names or the candidate ids.
+    """
+
+    index = get_index()
+    ids = index.lookup(name)
+
+    if not ids:
+        for letter in _initials(name):
+            if letter not in index.letters():
+                try:
+                    index.load_letter(letter)
+                except Exception:
+                    continue
+                ids = index.lookup(name)
+                if ids:
+                    break
+
+    if len(ids) == 1:
+        return ids[0]
+
+    if not ids:
+        close = index.fuzzy(name, limit=5)
+        hint = ' Did you mean: "'+'", "'.join(close['Player'])+'"?' if len(close) else ''
+        raise ValueError(name+' is not a valid name. Check for mispelling errors or if that players exists.'+hint)
+
+    players = index.frame(ids)
+    options = ', '.join(row.player_id+' ('+str(row.From)+'-'+str(row.To)+')' for row in players.itertuples())
+    raise ValueError('There are several players called '+name+'. Try one of these player ids instead: '+options+'.')
+
+def search(prefix, limit=10):
+    """
+    Prefix search on the shared index, see ``PlayerIndex.search``.
+    """
+
+    return get_index().search(prefix, limit)
+
+def fuzzy(name, limit=10, cutoff=0.75):
+    """
+    Fuzzy search on the shared index, see ``PlayerIndex.fuzzy``.
+    """
+
+    return get_index().fuzzy(name, limit, cutoff)
+
+def build(letters=string.ascii_lowercase):
+    """
+    Fetch the index pages of ``letters`` (every letter by default) so all
+    players can be resolved offline.
+    """
+
+    index = get_index()
+    for letter in letters:
+        if letter not in index.letters():
+            index.load_letter(letter)
+
+    return index
@@ -2,8 +2,9 @@ import pandas as pd
 import warnings
 import re
 import requests
-from bs4 import BeautifulSoup
 from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from BRScraper import aio, career, dtypes, fetch, metrics, names, parse, warehouse
 
 dict_teams = {'Utah Jazz':'UTA','Phoenix Suns':'PHO',
              'Philadelphia 76ers':'PHI','Brooklyn Nets':'BRK',
@@ -23,6 +24,8 @@ dict_teams = {'Utah Jazz':'UTA','Phoenix Suns':'PHO',
              'Houston Rockets':'HOU','New Jersey Nets':'NJN',
              'New Orleans Hornets':'NOH','Seattle SuperSonics':'SEA'}
 
+@dtypes.compactable
+@metrics.instrumented
 def get_current_salaries(info='players'):
     
     values = ['players','teams']
@@ -34,12 +37,12 @@ def get_current_salaries(info='players'):
                 'https://www.basketball-reference.com/contracts/'] # teams
 
     if info=='players':
-        df = pd.read_html(url_salary[0])[0]
+        df = fetch.read_tables(url_salary[0])[0]
         df.columns = df.columns.droplevel(0)
         df = df[(df['Player'].notna())&(df['Player']!='Player')].drop(columns=['Rk']).reset_index(drop=True)
 
     elif info=='teams':
-        df = pd.read_html(url_salary[1])[0]
+        df = fetch.read_html(url_salary[1])[0]
         df.columns = df.columns.droplevel(0)
         df = df.drop(columns=['Rk'])
         df = df.rename(columns={'Team':'Tm'})
@@ -51,8 +54,14 @@ def get_current_salaries(info='players'):
     
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_stats(season, info='per_game', playoffs=False, rename=False):
     
+    return _get_stats(season, info, playoffs, rename)
+
+def _get_stats(season, info='per_game', playoffs=False, rename=False):
+    
     values = ['per_game','totals','advanced','per_36','per_100']
     
     if info not in values:
@@ -76,78 +85,39 @@ def get_stats(season, info='per_game', playoffs=False, rename=False):
         # Select the appropriate URL based on the 'info' parameter
         url = url_stats[info]
         
-        # Fetch the HTML content of the page
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error for bad status codes
-        
-        # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Locate the table containing the statistics
-        table = soup.find('table')
-        if table is None:
-            raise ValueError(f"No table found on the page for season {season} and info '{info}'.")
-        
-        tbody = table.find('tbody')
-        if tbody is None:
-            raise ValueError(f"No table body found on the page for season {season} and info '{info}'.")
+        # Fetch the HTML content of the page (raises for bad status codes)
+        html = fetch.get_html(url)
         
-        # Extract all table rows
-        rows = tbody.find_all('tr')
-        
-        # Initialize a list to store player_ids
-        player_ids = []
-        
-        # Iterate over each row to extract the 'player_id'
-
-        for row in rows:
-            # Find the <td> element with 'data-stat' attribute 'name_display'
-            player_td = row.find('td', {'data-stat': 'name_display'})            
-            if not player_td:
-                player_td = row.find('td', {'data-stat': 'player'})
-
-            if player_td:
-                # Extract the player's name text
-                player_name = player_td.get_text(strip=True)
-                
-                player_id = player_td.get('data-append-csv', None)
-                # print(player_id)
-                if player_id:
-                    player_ids.append(player_id)
-            # else:
-            #     print(row)
-        
-        # Use pandas to read the table into a DataFrame
-        from io import StringIO
-        df = pd.read_html(StringIO(response.text))[0]
+        # Read the stats table and the aligned 'player_id' (data-append-csv)
+        # of every row in a single lxml pass
+        df = parse.read_table(html)
+        if 'player_id' not in df.columns:
+            raise ValueError(f"No player ids found on the page for season {season} and info '{info}'.")
         
         # Filter the DataFrame to exclude rows where 'Player' is NaN, 'Player', or 'League Average'
         df = df[(df['Player'].notna()) &
                 (df['Player'] != 'Player') &
                 (df['Player'] != 'League Average')].reset_index(drop=True)
         
+        # Feed the name -> player_id index used by get_player_stats
+        names.record(df['player_id'], df['Player'], int(season))
+        
         # Remove the original 'Rk' column
         if 'Rk' in df.columns:
             df = df.drop(['Rk'], axis=1)
 
-        df = df.drop(['Player'], axis=1)
-        df = df.drop(['Age'], axis=1)
-        df = df.drop(['FG%'], axis=1)
-        df = df.drop(['2P%'], axis=1)
-        df = df.drop(['3P%'], axis=1)
-        df = df.drop(['eFG%'], axis=1)
-        df = df.drop(['FT%'], axis=1)
-        
-        # remove player_ids
-        # Insert the 'player_id' column as the first column
-        # print(player_ids)
-        df.insert(0, 'player_id', player_ids)
+        # Percentages are not on every page (e.g. 'advanced')
+        players = df['Player'].str.rstrip('*')
+        df = df.drop(columns=['Player','Age','FG%','2P%','3P%','eFG%','FT%'], errors='ignore')
         
     except requests.HTTPError as http_err:
         raise ValueError(f"HTTP error occurred: {http_err}")
     except Exception as e:
         raise ValueError(f"An error occurred while fetching data for season {season}: {e}")
 
+    # Stored rows keep the name, so leaderboards built later need no player index
+    warehouse.record('stats_'+info, df.assign(Player=players), season=int(season), playoffs=bool(playoffs))
+
     if rename:
         cols = ['Player','Pos','Age','Tm','G','GS']
         for column in df.columns:
@@ -159,6 +129,173 @@ def get_stats(season, info='per_game', playoffs=False, rename=False):
         
     return df
 
+@dtypes.compactable
+@metrics.instrumented
+def get_stats_bulk(seasons, infos=('per_game','totals','advanced','per_36','per_100'), playoffs=False,
+                   max_workers=4, errors='raise'):
+    """
+    Get the stats of several seasons and formats in one call.
+
+    Pages are fetched concurrently by a bounded pool of workers, all going
+    through the shared session, cache and rate limiter.
+
+    Parameters
+    ----------
+    seasons : iterable of int
+        Desired seasons (in format ``2023``).
+    infos : iterable of str, optional
+        Desired formats, any of the ``get_stats`` ``info`` values.
+    playoffs : bool or iterable of bool, optional
+        Regular season (``False``), playoffs (``True``) or both
+        (``(False, True)``).
+    max_workers : int, optional
+        Maximum number of pages fetched at the same time.
+    errors : str, optional
+        ``'raise'`` to fail on the first unavailable page, ``'warn'`` to
+        skip it with a warning.
+
+    Returns
+    -------
+    pd.DataFrame
+        All the ``get_stats`` frames stacked, with ``Season``, ``info`` and
+        ``Playoffs`` key columns (``Season`` and ``info`` categorical).
+    """
+
+    values = ['per_game','totals','advanced','per_36','per_100']
+
+    seasons = list(seasons)
+    infos = [infos] if isinstance(infos, str) else list(infos)
+    comps = [playoffs] if isinstance(playoffs, bool) else list(playoffs)
+
+    for info in infos:
+        if info not in values:
+            raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(values)+'".')
+
+    if errors not in ['raise','warn']:
+        raise ValueError(str(errors)+' is not a valid value. Try one of: "raise", "warn".')
+
+    units = [(season, info, comp) for comp in comps for season in seasons for info in infos]
+
+    def fetch_unit(unit):
+        season, info, comp = unit
+        try:
+            df = _get_stats(season, info=info, playoffs=comp)
+        except ValueError as e:
+            if errors=='raise':
+                raise
+            warnings.warn('WARNING: skipping season '+str(season)+' '+info+': '+str(e))
+            return None
+        df['info'] = info
+        df['Playoffs'] = comp
+        return df
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dfs = [df for df in executor.map(metrics.bind(fetch_unit), units) if df is not None]
+
+    if not dfs:
+        return pd.DataFrame(columns=['Season','info','Playoffs'])
+
+    df = pd.concat(dfs, ignore_index=True)
+
+    season_labels = [str(int(str(season))-1)+'-'+str(season)[-2:] for season in seasons]
+    df['Season'] = pd.Categorical(df['Season'], categories=list(dict.fromkeys(season_labels)), ordered=True)
+    df['info'] = pd.Categorical(df['info'], categories=infos)
+
+    return df
+
+@dtypes.compactable
+@metrics.instrumented
+def get_stats_wide(season, infos=('per_game','totals','advanced','per_100'), playoffs=False, traded='all',
+                   max_workers=4):
+    """
+    Get several formats of a season joined into one wide frame.
+
+    The pages are fetched concurrently and hash-joined on ``player_id`` and
+    team: each format is aligned to the union of keys with one reindex,
+    and all columns are assembled in a single concat.
+
+    Parameters
+    ----------
+    season : int
+        Desired season (in format ``2023``).
+    infos : iterable of str, optional
+        Formats to join, any of the ``get_stats`` ``info`` values.
+    playoffs : bool, optional
+        Whether to get playoffs stats.
+    traded : str, optional
+        Rows kept for traded players, the same in every format: ``'all'``,
+        ``'combined'`` (only the ``TOT``/``2TM``... row) or ``'teams'``
+        (only the per-team rows).
+    max_workers : int, optional
+        Maximum number of pages fetched at the same time.
+
+    Returns
+    -------
+    pd.DataFrame
+        ``player_id``, team, the shared columns (``Pos``, ``Age``, ``G``,
+        ``GS``, ``Awards``) once, then each format's stats suffixed with
+        ``'_'+info`` (like ``rename=True``), and ``Season``.
+    """
+
+    values = ['per_game','totals','advanced','per_36','per_100']
+    infos = [infos] if isinstance(infos, str) else list(dict.fromkeys(infos))
+
+    if not infos:
+        raise ValueError(str(infos)+' is not a valid value. Try one or more of: "'+'", "'.join(values)+'".')
+
+    for info in infos:
+        if info not in values:
+            raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(values)+'".')
+
+    if traded not in ['all','combined','teams']:
+        raise ValueError(str(traded)+' is not a valid value. Try one of: "all", "combined", "teams".')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dfs = list(executor.map(metrics.bind(lambda info: _get_stats(season, info=info, playoffs=playoffs)), infos))
+
+    team = 'Team' if 'Team' in dfs[0].columns else 'Tm'
+    keys = ['player_id', team]
+    shared = ['Pos','Age','G','GS','Awards']
+
+    def rows(df):
+        combined = career.combined_rows(df[team])
+        if traded=='combined':
+            df = career.season_rows(df)
+        elif traded=='teams':
+            df = df[~combined]
+        return df.drop_duplicates(keys)
+
+    dfs = [rows(df) for df in dfs]
+
+    # Union of the keys, in order of first appearance
+    index = pd.MultiIndex.from_frame(dfs[0][keys])
+    for df in dfs[1:]:
+        index = index.append(pd.MultiIndex.from_frame(df[keys])).unique()
+
+    # reindex on the (unique) key index is a hash lookup per row
+    aligned = [df.drop(columns=['Season']).set_index(keys).reindex(index).reset_index(drop=True)
+               for df in dfs]
+
+    columns = [pd.DataFrame(list(index), columns=keys)]
+
+    common = {}
+    for column in shared:
+        for part in aligned:
+            if column in part.columns:
+                common[column] = part[column] if column not in common else common[column].fillna(part[column])
+    columns.append(pd.DataFrame(common))
+
+    for info, part in zip(infos, aligned):
+        part = part.drop(columns=[c for c in shared if c in part.columns])
+        columns.append(part.add_suffix('_'+info))
+
+    df = pd.concat(columns, axis=1)
+    df['Season'] = str(int(str(season))-1)+'-'+str(season)[-2:]
+
+    return df
+
+@dtypes.compactable
+@metrics.instrumented
 def get_standings(season, info='total'):
     
     values = ['total','east','west']
@@ -169,7 +306,7 @@ def get_standings(season, info='total'):
     url = 'https://www.basketball-reference.com/leagues/NBA_'+str(season)+'_standings.html'
     
     try:
-        df = pd.read_html(url)
+        df = fetch.read_html(url)
     except:
         raise ValueError(str(season)+' is not a valid season.')
         
@@ -190,32 +327,81 @@ def get_standings(season, info='total'):
 
     df['Seed'] = df.index+1    
     
+    warehouse.record('standings', df, season=int(season), conference=info)
+    
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_general_info():
     
     url = 'https://www.basketball-reference.com/leagues/'
     
-    df = pd.read_html(url)[0]
+    df = fetch.read_html(url)[0]
     df.columns = df.columns.droplevel(0)
     
     return df
 
-def get_season_leaders(season, info, n=10, playoffs=False, per_game=False):
+@dtypes.compactable
+@metrics.instrumented
+def get_team_stats(season, info='totals', playoffs=False):
     
-    values = ['pts','reb','oreb','dreb','ast','stl','blk','fg%','ft%','3pt%','2pt%','efg%','ts%','fg','fga',
-               '2p','2pa','3p','3pa','fgm','ft','fta','min','tov','pf','per','ws','ows','dws','ws48','bpm',
-               'obpm','dbpm','vorp','ortg','drtg','usg%','trb%','orb%','ast%','drb%','stl%','blk%','tov%']
+    return _get_team_stats(season, info, playoffs)
+
+def _get_team_stats(season, info='totals', playoffs=False):
+    
+    values = ['totals','per_game','advanced']
     
     if info not in values:
         raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(values)+'".')
     
+    if playoffs:
+        comp = 'playoffs'
+    else:
+        comp = 'leagues'
+    
+    url = 'https://www.basketball-reference.com/'+comp+'/NBA_'+str(season)+'.html'
+    
+    try:
+        # Every format is a table of the same page: parse it once
+        doc = fetch.memoized(('doc', url), lambda: parse.parse_document(fetch.get_html(url)))
+        df = parse.read_table(doc, info+'-team', id_stats=parse.TEAM_ID_STATS, id_column='team_id',
+                              href_re=parse.TEAM_HREF_RE)
+    except:
+        raise ValueError(str(season)+' is not a valid season.')
+    
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.droplevel(list(range(df.columns.nlevels-1)))
+        df = df.loc[:, ~df.columns.str.startswith('Unnamed')]
+    
+    team = 'Team' if 'Team' in df.columns else 'Tm'
+    df[team] = df[team].str.rstrip('*')
+    df = df[df[team].notna()].drop(columns=['Rk'], errors='ignore').reset_index(drop=True)
+    
+    return df
+
+# Position of each leaderboard among the tables of the leaders page, as
+# (totals, per game). None: no per game leaderboard (warns), same index:
+# rate stats where totals and per game are the same thing.
+leaders_tables = {'pts':(0,1),'reb':(2,3),'oreb':(4,None),'dreb':(5,None),'ast':(6,7),'stl':(8,9),
+                  'blk':(10,11),'fg%':(12,12),'ft%':(13,13),'3pt%':(14,14),'2pt%':(15,15),'efg%':(16,16),
+                  'ts%':(17,17),'fg':(18,18),'fga':(19,19),'2p':(20,20),'2pa':(21,21),'3p':(22,22),
+                  '3pa':(23,23),'fgm':(24,24),'ft':(25,25),'fta':(26,26),'min':(27,28),'tov':(29,None),
+                  'pf':(30,None),'per':(31,31),'ws':(32,32),'ows':(33,33),'dws':(34,34),'ws48':(35,35),
+                  'bpm':(36,36),'obpm':(37,37),'dbpm':(38,38),'vorp':(39,39),'ortg':(40,40),'drtg':(41,41),
+                  'usg%':(42,42),'trb%':(43,43),'orb%':(44,44),'ast%':(45,45),'drb%':(46,46),'stl%':(47,47),
+                  'blk%':(48,48),'tov%':(49,49)}
+
+def _check_leaders_n(n, playoffs):
+    
     if n<=0:
         raise ValueError(str(n)+' is not a valid value. Try a value bigger than 0.')
     elif n>20 and playoffs==False:
         warnings.warn('WARNING: maximum of 20 players for regular season, selecting 20')
     elif n>10 and playoffs==True:
         warnings.warn('WARNING: maximum of 10 players for playoffs, selecting 10')
+
+def _leaders_tables(season, playoffs):
     
     if playoffs:
         comp = 'playoffs'
@@ -225,128 +411,43 @@ def get_season_leaders(season, info, n=10, playoffs=False, per_game=False):
     url='https://www.basketball-reference.com/'+comp+'/NBA_'+str(season)+'_leaders.html'
     
     try:
-        df = pd.read_html(url)
+        tables = fetch.memoized(('tables', url),
+                                lambda: parse.parse_document(fetch.get_html(url)).xpath('//table'))
     except:
         raise ValueError(str(season)+' is not a valid season.')
-        
-    if info=='pts':
-        if per_game:
-            df = df[1]
-        else:
-            df = df[0]
-    elif info=='reb':
-        if per_game:
-            df = df[3]
-        else:
-            df = df[2]
-    elif info=='oreb':
-        df = df[4]
-        if per_game:
-            warnings.warn('WARNING: Only total info for '+info)
-    elif info=='dreb':
-        df = df[5]
-        if per_game:
-            warnings.warn('WARNING: Only total info for '+info)
-    elif info=='ast':
-        if per_game:
-            df = df[7]
-        else:
-            df = df[6]
-    elif info=='stl':
-        if per_game:
-            df = df[9]
-        else:
-            df = df[8]
-    elif info=='blk':
-        if per_game:
-            df = df[11]
-        else:
-            df = df[10]
-    elif info=='fg%':
-        df = df[12]
-    elif info=='ft%':
-        df = df[13]
-    elif info=='3pt%':
-        df = df[14]
-    elif info=='2pt%':
-        df = df[15]
-    elif info=='efg%':
-        df = df[16]
-    elif info=='ts%':
-        df = df[17]
-    elif info=='fg':
-        df = df[18]
-    elif info=='fga':
-        df = df[19]
-    elif info=='2p':
-        df = df[20]
-    elif info=='2pa':
-        df = df[21]
-    elif info=='3p':
-        df = df[22]
-    elif info=='3pa':
-        df = df[23]
-    elif info=='fgm':
-        df = df[24]            
-    elif info=='ft':
-        df = df[25]            
-    elif info=='fta':
-        df = df[26]
-    elif info=='min':
-        if per_game:
-            df = df[28]
-        else:
-            df = df[27]
-    elif info=='tov':
-        df = df[29]
-        if per_game:
-            warnings.warn('WARNING: Only total info for '+info)
-    elif info=='pf':
-        df = df[30]
-        if per_game:
+    
+    if not tables:
+        raise ValueError(str(season)+' is not a valid season.')
+    
+    return tables
+
+def _leaders_index(info, per_game, warn=True):
+    
+    total, per_game_index = leaders_tables[info]
+    
+    if not per_game:
+        return total
+    elif per_game_index is None:
+        if warn:
             warnings.warn('WARNING: Only total info for '+info)
-    elif info=='per':
-        df = df[31]
-    elif info=='ws':
-        df = df[32]
-    elif info=='ows':
-        df = df[33]
-    elif info=='dws':
-        df = df[34]
-    elif info=='ws48':
-        df = df[35]
-    elif info=='bpm':
-        df = df[36]
-    elif info=='obpm':
-        df = df[37]
-    elif info=='dbpm':
-        df = df[38]
-    elif info=='vorp':
-        df = df[39]
-    elif info=='ortg':
-        df = df[40]
-    elif info=='drtg':
-        df = df[41]
-    elif info=='usg%':
-        df = df[42]
-    elif info=='trb%':
-        df = df[43]
-    elif info=='orb%':
-        df = df[44]
-    elif info=='ast%':
-        df = df[45]
-    elif info=='drb%':
-        df = df[46]
-    elif info=='stl%':
-        df = df[47]
-    elif info=='blk%':
-        df = df[48]
-    elif info=='tov%':
-        df = df[49]
+        return total
+    
+    return per_game_index
 
+def _leaders_frame(tables, info, n, per_game, warn=True):
+    
+    index = _leaders_index(info, per_game, warn)
+    
+    if index>=len(tables):
+        raise ValueError(info+' leaders are not available for this season.')
+    
+    # Only the requested leaderboard is converted to a DataFrame
+    df, ids = parse.table_to_frame(tables[index])
+    
     df = df.drop(columns=[0])
     
     df.columns = ['Player',info.upper()]
+    df.insert(0, 'player_id', ids)
     
     df['Rank'] = df.index+1
     df = df[df['Rank']<=n]
@@ -356,12 +457,66 @@ def get_season_leaders(season, info, n=10, playoffs=False, per_game=False):
     
     return df
 
+@dtypes.compactable
+@metrics.instrumented
+def get_season_leaders(season, info, n=10, playoffs=False, per_game=False):
+    
+    values = list(leaders_tables)
+    
+    if info not in values:
+        raise ValueError(str(info)+' is not a valid value. Try one of: "'+'", "'.join(values)+'".')
+    
+    _check_leaders_n(n, playoffs)
+    
+    tables = _leaders_tables(season, playoffs)
+    
+    return _leaders_frame(tables, info, n, per_game)
+
+@dtypes.compactable
+@metrics.instrumented
+def get_all_season_leaders(season, n=10, playoffs=False, per_game=False):
+    """
+    Get every leaderboard of a season from a single download and parse.
+
+    Parameters
+    ----------
+    season : int
+        The season to get the leaders for.
+    n : int, optional
+        Number of players per leaderboard (maximum of 20 for regular
+        season and 10 for playoffs).
+    playoffs : bool, optional
+        Whether to return the playoffs or the regular season leaders.
+    per_game : bool, optional
+        Whether to use per game leaderboards where the site has them.
+
+    Returns
+    -------
+    dict of pd.DataFrame
+        The same frames ``get_season_leaders`` returns, keyed by ``info``.
+        Leaderboards the season does not have (older seasons and playoffs
+        have fewer) are left out with a warning.
+    """
+    
+    _check_leaders_n(n, playoffs)
+    
+    tables = _leaders_tables(season, playoffs)
+    
+    found = [info for info in leaders_tables if _leaders_index(info, per_game, warn=False)<len(tables)]
+    missing = [info for info in leaders_tables if info not in found]
+    if missing:
+        warnings.warn('WARNING: '+', '.join(missing)+' leaders are not available for this season, skipping them')
+    
+    return {info: _leaders_frame(tables, info, n, per_game, warn=False) for info in found}
+
+@dtypes.compactable
+@metrics.instrumented
 def get_coach_data(season):
     
     url = 'https://www.basketball-reference.com/leagues/NBA_'+str(season)+'_coaches.html'
     
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_html(url)[0]
     except:
         raise ValueError(str(season)+' is not a valid season.')
         
@@ -376,90 +531,120 @@ def get_coach_data(season):
         
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_player_stats(name):
     
-    name2 = re.sub('[^a-zA-Z0-9 \n\.]', '', name)
+    # 'name' may also be an exact player id such as 'jamesle01'
+    if re.fullmatch('[a-z]+[0-9]{2}', name.strip()) and not names.lookup(name):
+        player_id = name.strip()
+    else:
+        player_id = names.resolve(name)
 
-    if name2!=name:
-        raise ValueError(name+' has special characters and is not a valid name. Try replacing the special characters.')
+    return _player_stats(player_id, name)
 
+def _player_stats(player_id, name=None):
+    
     try:
-        name_url = name.lower().strip().split(' ')
+        df = _career_totals(fetch.get_html(_player_url(player_id)))
+    except:
+        raise ValueError((name or player_id)+' is not a valid name. Check for mispelling errors or if that players exists.')
+    
+    return df
 
-        if len(name_url[1])>=5:
-            len_name = 5
-        else:
-            len_name = len(name_url[1])
+def _player_url(player_id):
 
-        name_url = name_url[1][:len_name] + name_url[0][:2]
+    return 'https://www.basketball-reference.com/players/'+player_id[0]+'/'+player_id+'.html'
 
-        first_l = name.strip().split(' ')[1][0].lower()
+def _career_totals(html):
+    
+    # Read the season-by-season totals straight from the parsed page
+    doc = parse.parse_document(html)
+    tables = doc.xpath('//div[@id="div_totals"]//table')
+    table = tables[0] if tables else parse.find_table(doc, 'totals')
+    
+    df, _ = parse.table_to_frame(table, id_stats=None)
+    df = df.dropna(how='all', axis=0).reset_index(drop=True)
+    
+    # Stop at the career summary rows
+    career = df.index[df['Season']=='Career']
+    if len(career):
+        df = df.iloc[:career[0]]
+    
+    return df
 
-        url = 'https://www.basketball-reference.com/players/'+first_l+'/'+name_url+'01.html'
-    except:
-        raise ValueError(name+''' is not in a valid name format.
-                        Valid names would be "LeBron James", "lebron james" or "LEBRON JAMES" for example.''')
-                         
-    try:
-        # Fetch the page content
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise ValueError(
-                name
-                + " is not a valid name. Check for misspelling errors or if that player exists."
-            )
-        html = response.text
+@dtypes.compactable
+@metrics.instrumented
+def get_player_stats_bulk(player_ids, max_workers=4, errors='raise'):
+    """
+    Get the career totals of many players in one call.
 
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
+    Career pages are fetched concurrently by a bounded pool of workers, all
+    going through the shared session, cache and rate limiter, and each
+    totals table is read directly from the parsed page.
 
-        # Find the span with id='totals_link' and data-label='Totals'
-        totals_span = soup.find(
-            "span", attrs={"id": "totals_link", "data-label": "Totals"}
-        )
+    Parameters
+    ----------
+    player_ids : iterable of str
+        Player ids, e.g. the ``player_id`` column of ``get_stats``.
+        Repeated and missing ids are skipped.
+    max_workers : int, optional
+        Maximum number of pages fetched at the same time.
+    errors : str, optional
+        ``'raise'`` to fail on the first unavailable page, ``'warn'`` to
+        skip it with a warning.
 
-        if totals_span is None:
-            raise ValueError("Totals data-label not found for " + name)
+    Returns
+    -------
+    pd.DataFrame
+        One row per player and season (the ``get_player_stats`` columns),
+        with ``player_id`` as first column.
+    """
 
-        # Now, find the parent div with id='div_totals'
-        parent_div = soup.find("div", id="div_totals")
+    if errors not in ['raise','warn']:
+        raise ValueError(str(errors)+' is not a valid value. Try one of: "raise", "warn".')
 
-        if parent_div is None:
-            raise ValueError("Totals table container not found for " + name)
+    player_ids = [i for i in dict.fromkeys(player_ids) if isinstance(i, str) and i]
 
-        # Now, find the table within this div
-        table = parent_div.find("table")
+    def fetch_player(player_id):
+        try:
+            df = _player_stats(player_id)
+        except ValueError as e:
+            if errors=='raise':
+                raise
+            warnings.warn('WARNING: skipping player '+player_id+': '+str(e))
+            return None
+        df.insert(0, 'player_id', player_id)
+        return df
 
-        if table is None:
-            raise ValueError("Totals table not found for " + name)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dfs = [df for df in executor.map(metrics.bind(fetch_player), player_ids) if df is not None]
 
-        # Read the table into pandas DataFrame
-        df = pd.read_html(str(table))[0]
-    except:
-        raise ValueError(name+' is not a valid name. Check for mispelling errors or if that players exists.')
-                         
-    df = df.dropna(how='all', axis=0)
-    
-    num = df[df['Season']=='Career'].index[0]
-    
-    df = df.iloc[:num]
-    
-    return df
+    if not dfs:
+        return pd.DataFrame(columns=['player_id','Season'])
+
+    return pd.concat(dfs, ignore_index=True)
 
+@dtypes.compactable
+@metrics.instrumented
 def get_draft_info(season):
     
     url = 'https://www.basketball-reference.com/draft/NBA_'+str(season)+'.html'
     
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_tables(url)[0]
     except:
         raise ValueError(str(season)+' is not a valid season.')
     
     df.columns = df.columns.droplevel(0)
     df = df[(df['Tm'].notna())&(df['Player']!='Player')].drop(columns=['Rk']).reset_index(drop=True)
     
+    warehouse.record('draft', df, season=int(season))
+    
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_playoffs_probs(conf):
     
     values = ['east','west']
@@ -469,7 +654,7 @@ def get_playoffs_probs(conf):
     
     url = 'https://www.basketball-reference.com/friv/playoff_prob.html'
     
-    df = pd.read_html(url)
+    df = fetch.read_html(url)
     
     if conf == 'east':
         df = df[0]
@@ -482,20 +667,26 @@ def get_playoffs_probs(conf):
     
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_rookies(season):
     
     url = 'https://www.basketball-reference.com/leagues/NBA_'+str(season)+'_rookies.html'
     
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_tables(url)[0]
     except:
         raise ValueError(str(season)+' is not a valid season.')
         
     df.columns = df.columns.droplevel(0)
     df = df[(df['Player'].notna())&(df['Player']!='Player')].drop(['Rk'], axis=1).reset_index(drop=True)
     
+    warehouse.record('rookies', df, season=int(season))
+    
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_birthdays():
     
     today = date.today()    
@@ -505,7 +696,7 @@ def get_birthdays():
     url = 'https://www.basketball-reference.com/friv/birthdays.fcgi?month='+str(month)+'&day='+str(day)
     
     try:
-        df = pd.read_html(url)[0]
+        df = fetch.read_tables(url)[0]
     except:
         raise ValueError('It seems there are no birthdays today :(')
     
@@ -515,6 +706,8 @@ def get_birthdays():
     
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_awards(award):
     
     values = ['mvp','roy','dpoy','smoy','tmoy','mip','citizenship','finals_mvp','playoffs_mvp',
@@ -526,7 +719,7 @@ def get_awards(award):
     
     url = 'https://www.basketball-reference.com/awards/'+award+'.html'
 
-    df = pd.read_html(url)[0]
+    df = fetch.read_tables(url)[0]
     
     if award not in ['eoy','coy','nbca_coy']:
         df.columns = df.columns.droplevel(0)
@@ -534,8 +727,12 @@ def get_awards(award):
         df = df.dropna(how='all', axis=1)  
         df = df[(df['Player'].notna())&(df['Player']!='Player')].reset_index(drop=True)
     
+    warehouse.record('awards', df, award=award)
+    
     return df
 
+@dtypes.compactable
+@metrics.instrumented
 def get_award_votings(award:str, season:int)->pd.DataFrame:
     """
     Get award voting data for a given award and season.
@@ -583,7 +780,7 @@ def get_award_votings(award:str, season:int)->pd.DataFrame:
     
     # Read table from url
     try:
-        df = pd.read_html(url)[index]
+        df = fetch.read_tables(url)[index]
     except Exception as e:
         raise ValueError(str(season)+' is not a valid season.') from e
     
@@ -594,3 +791,23 @@ def get_award_votings(award:str, season:int)->pd.DataFrame:
     df = df[df['Player'].notna()].reset_index(drop=True)
 
     return df
+
+# Async versions, e.g. `await nba.aget_stats(2024, info="advanced")`
+aget_current_salaries = aio.asyncify(get_current_salaries)
+aget_stats = aio.asyncify(get_stats)
+aget_stats_bulk = aio.asyncify(get_stats_bulk)
+aget_stats_wide = aio.asyncify(get_stats_wide)
+aget_standings = aio.asyncify(get_standings)
+aget_general_info = aio.asyncify(get_general_info)
+aget_team_stats = aio.asyncify(get_team_stats)
+aget_season_leaders = aio.asyncify(get_season_leaders)
+aget_all_season_leaders = aio.asyncify(get_all_season_leaders)
+aget_coach_data = aio.asyncify(get_coach_data)
+aget_player_stats = aio.asyncify(get_player_stats)
+aget_player_stats_bulk = aio.asyncify(get_player_stats_bulk)
+aget_draft_info = aio.asyncify(get_draft_info)
+aget_playoffs_probs = aio.asyncify(get_playoffs_probs)
+aget_rookies = aio.asyncify(get_rookies)
+aget_birthdays = aio.asyncify(get_birthdays)
+aget_awards = aio.asyncify(get_awards)
+aget_award_votings = aio.asyncify(get_award_votings)
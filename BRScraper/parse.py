@@ -0,0 +1,282 @@
+"""
+Fast, single-pass table extraction with lxml.
+
+``pd.read_html`` parses the whole document (and every table in it) and
+drops attributes like the ``data-append-csv`` player ids, so getters that
+needed ids parsed the page twice. ``read_table`` parses the page once,
+walks only the wanted table and returns the DataFrame (with the same
+column names ``pd.read_html`` would give) plus the aligned ids.
+"""
+import re
+
+import lxml.html
+import numpy as np
+import pandas as pd
+
+from BRScraper import metrics
+
+ID_STATS = ('name_display', 'player')
+TEAM_ID_STATS = ('team', 'team_name')
+
+PLAYER_HREF_RE = re.compile(r'/players/\w/(\w+)\.html')
+TEAM_HREF_RE = re.compile(r'/teams/(\w+)/')
+INTERNATIONAL_HREF_RE = re.compile(r'/international/players/([\w-]+)\.html')
+_whitespace_re = re.compile(r'[\r\n]+|\s{2,}') # same cleanup as pd.read_html
+
+def parse_document(html):
+    """
+    Parse ``html`` once so several tables can be read from the same tree.
+    """
+
+    if isinstance(html, (bytes, str)):
+        with metrics.span('parse'):
+            return lxml.html.fromstring(html)
+
+    return html
+
+def find_table(doc, table_id=None):
+    """
+    Locate a ``<table>`` by id (or the first one). Basketball Reference
+    ships many secondary tables inside HTML comments, which are searched
+    too when the id is not found in the live document.
+    """
+
+    if table_id is None:
+        tables = doc.xpath('//table')
+        if not tables:
+            raise ValueError('No tables found')
+        return tables[0]
+
+    tables = doc.xpath('//table[@id=$id]', id=table_id)
+    if tables:
+        return tables[0]
+
+    marker = 'id="'+table_id+'"'
+    for comment in doc.xpath('//comment()'):
+        if comment.text and marker in comment.text:
+            tables = lxml.html.fromstring(comment.text).xpath('//table[@id=$id]', id=table_id)
+            if tables:
+                return tables[0]
+
+    raise ValueError('No table with id "'+table_id+'" found')
+
+def table_ids(doc):
+    """
+    Ids of every table in the document, commented-out ones included.
+    """
+
+    ids = doc.xpath('//table/@id')
+    for comment in doc.xpath('//comment()'):
+        if comment.text and '<table' in comment.text:
+            ids += lxml.html.fromstring(comment.text).xpath('//table/@id')
+
+    return ids
+
+def _cell_text(cell):
+
+    return _whitespace_re.sub(' ', cell.text_content()).strip()
+
+def _expand(row):
+
+    cells = []
+    for cell in row.xpath('./th|./td'):
+        cells += [cell]*int(cell.get('colspan', 1) or 1)
+
+    return cells
+
+def _header(table):
+
+    rows = table.xpath('./thead/tr')
+    if not rows:
+        first = table.xpath('.//tr')
+        rows = first[:1] if first and not first[0].xpath('./td') else []
+
+    levels = [[_cell_text(cell) for cell in _expand(row)] for row in rows]
+    width = max([len(level) for level in levels], default=0)
+    levels = [level+['']*(width-len(level)) for level in levels]
+
+    if len(levels) <= 1:
+        names = levels[0] if levels else []
+        return [name or 'Unnamed: '+str(i) for i, name in enumerate(names)]
+
+    columns = []
+    for i in range(width):
+        columns.append(tuple(level[i] or 'Unnamed: '+str(i)+'_level_'+str(j)
+                             for j, level in enumerate(levels)))
+
+    return pd.MultiIndex.from_tuples(columns)
+
+def _dedupe(columns):
+
+    if isinstance(columns, pd.MultiIndex):
+        return columns
+
+    seen = {}
+    names = []
+    for name in columns:
+        if name in seen:
+            seen[name] += 1
+            names.append(name+'.'+str(seen[name]))
+        else:
+            seen[name] = 0
+            names.append(name)
+
+    return names
+
+def _link_id(cell, href_re):
+
+    for href in cell.xpath('.//a/@href'):
+        match = href_re.search(href)
+        if match:
+            return match.group(1)
+
+    return None
+
+def _row_id(row, id_stats, href_re):
+
+    for cell in row.xpath('./th|./td'):
+        if cell.get('data-stat') in id_stats:
+            return cell.get('data-append-csv') or _link_id(cell, href_re)
+
+    # Tables without data-stat attributes (e.g. the leaders boxes)
+    return _link_id(row, href_re)
+
+def _convert(values):
+
+    series = pd.Series(values, dtype=object)
+
+    try:
+        return pd.to_numeric(series)
+    except (ValueError, TypeError):
+        pass
+
+    try:
+        if series.str.contains(',', regex=False).any():
+            return pd.to_numeric(series.str.replace(',', '', regex=False))
+    except (ValueError, TypeError, AttributeError):
+        pass
+
+    return series
+
+def table_to_frame(table, id_stats=ID_STATS, skip_header_rows=True, href_re=PLAYER_HREF_RE):
+    """
+    Turn an lxml ``<table>`` into a DataFrame.
+
+    Parameters
+    ----------
+    table : lxml.html.HtmlElement
+        The table element.
+    id_stats : tuple of str or None, optional
+        ``data-stat`` values of the cell holding the player. When given,
+        the second return value lists each row's player id (from
+        ``data-append-csv`` or the player link), ``None`` where missing.
+    skip_header_rows : bool, optional
+        Drop the header rows Basketball Reference repeats inside long
+        tables (``<tr class="thead">``).
+    href_re : re.Pattern, optional
+        Pattern capturing the id from a link when the cell has no
+        ``data-append-csv`` (``TEAM_HREF_RE`` for team tables).
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, list)
+    """
+
+    with metrics.span('parse'):
+        return _table_to_frame(table, id_stats, skip_header_rows, href_re)
+
+def _table_to_frame(table, id_stats, skip_header_rows, href_re):
+
+    columns = _dedupe(_header(table))
+
+    body = table.xpath('./tbody/tr')
+    if not body:
+        body = [row for row in table.xpath('.//tr') if row.xpath('./td')]
+
+    data = []
+    ids = []
+    for row in body:
+        if skip_header_rows and 'thead' in (row.get('class') or '').split():
+            continue
+        cells = [_cell_text(cell) for cell in _expand(row)]
+        if not cells:
+            continue
+        data.append(cells)
+        if id_stats:
+            ids.append(_row_id(row, id_stats, href_re))
+
+    if not len(columns):
+        # No header row: integer column names, like pd.read_html
+        columns = list(range(max([len(cells) for cells in data], default=0)))
+
+    width = len(columns)
+    records = [(cells+['']*width)[:width] for cells in data]
+
+    frame = {}
+    for i in range(width):
+        frame[i] = _convert([cells[i] if cells[i] != '' else np.nan for cells in records])
+
+    df = pd.DataFrame(frame, index=range(len(records)))
+    df.columns = columns
+
+    return df, ids
+
+def read_table(html, table_id=None, id_stats=ID_STATS, id_column='player_id', href_re=PLAYER_HREF_RE):
+    """
+    Read one table from ``html`` in a single parse.
+
+    Parameters
+    ----------
+    html : str, bytes or parsed document
+        Page content (or the result of ``parse_document``).
+    table_id : str, optional
+        Id of the table to read. Defaults to the first table on the page.
+    id_stats : tuple of str or None, optional
+        Player cell ``data-stat`` values used to extract player ids.
+    id_column : str or None, optional
+        Name of the column where the player ids are inserted (first
+        position). Nothing is inserted when ``None`` or when the table has
+        no ids.
+    href_re : re.Pattern, optional
+        Pattern capturing the id from the cell's link.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+
+    table = find_table(parse_document(html), table_id)
+    df, ids = table_to_frame(table, id_stats=id_stats, href_re=href_re)
+
+    return insert_ids(df, ids, id_column)
+
+def read_tables(html, id_stats=ID_STATS, id_column='player_id', href_re=PLAYER_HREF_RE):
+    """
+    Every table of the page (not the commented-out ones), in the same
+    order and with the same columns as ``pd.read_html``, plus the player
+    id column on the tables that have player links. One parse for all.
+
+    Returns
+    -------
+    list of pd.DataFrame
+    """
+
+    dfs = []
+    for table in parse_document(html).xpath('//table'):
+        df, ids = table_to_frame(table, id_stats=id_stats, href_re=href_re)
+        dfs.append(insert_ids(df, ids, id_column))
+
+    return dfs
+
+def insert_ids(df, ids, id_column='player_id'):
+    """
+    Insert ``ids`` as the first column of ``df`` unless all are missing.
+    """
+
+    if id_column and any(ids):
+        if isinstance(df.columns, pd.MultiIndex):
+            # Survives both droplevel(0) and '_'.join flattening
+            id_column = ('',)*(df.columns.nlevels-1)+(id_column,)
+        df.insert(0, id_column, ids)
+
+    return df
@@ -0,0 +1,87 @@
+"""
+Plumbing shared by the persisted JSON indexes (``names``, ``identity``).
+
+Each index module keeps one ``SharedIndex``: the process-wide index,
+created on first use, kept in memory only unless ``enable()`` is called
+or its environment variable is set, and written with ``write_json`` so a
+crash never leaves a half-written file behind.
+"""
+import json
+import os
+import tempfile
+import threading
+
+from BRScraper import cache
+
+def write_json(path, data):
+    """
+    Write ``data`` as JSON to ``path`` through a temporary file in the
+    same directory that replaces it in one step.
+    """
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+class SharedIndex:
+    """
+    Lazily created index of type ``factory`` (called with a path or
+    ``None``), saved to ``$variable`` when it is set or to ``filename`` in
+    the cache directory after ``enable()``.
+    """
+
+    def __init__(self, factory, variable, filename):
+
+        self.factory = factory
+        self.variable = variable
+        self.filename = filename
+        self._index = None
+        self._lock = threading.Lock()
+
+    def default_path(self):
+        """
+        ``$variable`` or ``filename`` in the cache directory.
+        """
+
+        return os.environ.get(self.variable, os.path.join(cache.default_directory(), self.filename))
+
+    def get(self):
+        """
+        The shared index, created on first use: loaded from and saved to
+        ``$variable`` when it is set, in memory only otherwise.
+        """
+
+        with self._lock:
+            if self._index is None:
+                self._index = self.factory(os.environ.get(self.variable))
+            return self._index
+
+    def set(self, index):
+        """
+        Use ``index`` as the shared index; ``None`` creates a new one on
+        next use.
+        """
+
+        with self._lock:
+            self._index = index
+
+    def enable(self, path=None):
+        """
+        Load the shared index from ``path`` (``default_path()`` by default)
+        and save it there whenever it changes. Returns the new index.
+        """
+
+        index = self.factory(path or self.default_path())
+        self.set(index)
+
+        return index
+
+    def disable(self):
+        """
+        Keep the shared index in memory only from now on.
+        """
+
+        self.get().path = None
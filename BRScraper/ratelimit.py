@@ -0,0 +1,125 @@
+"""
+Token-bucket scheduler shared by every request BRScraper makes.
+
+Basketball Reference allows roughly 20 requests per minute and jails
+clients that go faster. ``TokenBucket`` hands out request slots at that
+rate across all threads, pauses everyone when the server answers 429 and
+adapts its rate (multiplicative decrease on 429, additive increase on
+success) so long crawls settle at the highest rate the site accepts.
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+DEFAULT_REQUESTS_PER_MINUTE = 19 # stays under the site's 20/min limit
+
+def parse_retry_after(value, now=None):
+    """
+    Seconds to wait from a ``Retry-After`` header (delta-seconds or an
+    HTTP date), or ``None`` when missing or unparseable.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+
+    return max(0.0, (when-now).total_seconds())
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Parameters
+    ----------
+    requests_per_minute : float
+        Maximum sustained rate, also the ceiling for adaptive increases.
+    capacity : int
+        Number of requests that may be sent back to back.
+    min_requests_per_minute : float, optional
+        Floor for adaptive decreases. Defaults to an eighth of the rate.
+    """
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, capacity=1,
+                 min_requests_per_minute=None):
+
+        if requests_per_minute <= 0:
+            raise ValueError(str(requests_per_minute)+' is not a valid value. Try a value bigger than 0.')
+
+        self.max_rate = requests_per_minute/60
+        self.min_rate = (min_requests_per_minute or requests_per_minute/8)/60
+        self.rate = self.max_rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_minute(self):
+        return self.rate*60
+
+    def _refill(self, now):
+
+        self._tokens = min(self.capacity, self._tokens+(now-self._updated)*self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting in the queue.
+        """
+
+        start = time.monotonic()
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until-now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return now-start
+                    delay = (1-self._tokens)/self.rate
+            time.sleep(delay)
+
+    def penalize(self, delay):
+        """
+        Called on a 429: halve the rate and hold every caller for ``delay``
+        seconds.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate/2)
+            self._blocked_until = max(self._blocked_until, now+delay)
+            self._tokens = 0.0
+            self._updated = now+delay
+
+    def reward(self):
+        """
+        Called on a success: creep back towards the maximum rate.
+        """
+
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate+self.max_rate/20)
@@ -0,0 +1,315 @@
+"""
+Local store of everything the getters have scraped.
+
+Once enabled, ``get_stats`` (every format), ``get_draft_info``,
+``get_rookies``, ``get_awards`` and ``get_standings`` write their results
+through to a local SQLite database, one table per dataset, indexed by
+``player_id`` and by ``(season_year, team_code)``. Questions like "every season of
+player X" or "every player of team Y in 2010" are then answered locally
+in milliseconds with ``query``, without a new web fetch.
+
+SQLite is used because it ships with Python and gives real indexes
+without adding a dependency.
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_store = None
+
+_season_re = re.compile(r'^(\d{4})-(\d{2})$')
+
+def default_path():
+    """
+    ``$BRSCRAPER_WAREHOUSE`` or ``~/.cache/BRScraper/warehouse.sqlite``.
+    """
+
+    return os.environ.get('BRSCRAPER_WAREHOUSE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'BRScraper', 'warehouse.sqlite'))
+
+def season_year(value):
+    """
+    Ending year of a season given as ``2023`` or ``'2022-23'``, or ``None``.
+    """
+
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+
+    match = _season_re.match(str(value))
+    if match:
+        return int(match.group(1))+1
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _quote(name):
+
+    return '"'+str(name).replace('"', '""')+'"'
+
+def _sql_type(series):
+
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return 'INTEGER'
+    if pd.api.types.is_numeric_dtype(series):
+        return 'REAL'
+
+    return 'TEXT'
+
+def _flatten(columns):
+
+    names = []
+    for column in columns:
+        if isinstance(column, tuple):
+            column = '_'.join(str(part) for part in column if part and not str(part).startswith('Unnamed'))
+        names.append(str(column))
+
+    return names
+
+class Warehouse:
+    """
+    SQLite-backed store with one table per dataset.
+
+    Every stored row gets a ``season_year`` (ending year) and a
+    ``team_code`` column next to the getter's own columns, plus the key
+    columns given to ``write``. SQLite column names are case-insensitive,
+    hence the names that cannot clash with ``Season`` or ``Team``.
+    """
+
+    def __init__(self, path=None):
+
+        self.path = path or default_path()
+        if self.path != ':memory:' and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+
+    def close(self):
+
+        with self._lock:
+            self._conn.close()
+
+    def tables(self):
+
+        with self._lock:
+            rows = self._conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name").fetchall()
+
+        return [row[0] for row in rows]
+
+    def columns(self, dataset):
+        """
+        Column names of a stored dataset (empty when not stored).
+        """
+
+        with self._lock:
+            return self._columns(dataset)
+
+    def _columns(self, table):
+
+        return [row[1] for row in self._conn.execute('PRAGMA table_info('+_quote(table)+')')]
+
+    def _prepare(self, df, keys):
+
+        frame = df.copy()
+        frame.columns = _flatten(frame.columns)
+        frame = frame.loc[:, ~pd.Index(frame.columns).str.lower().duplicated()]
+
+        for key, value in keys.items():
+            frame[key] = value
+
+        if 'season_year' not in keys:
+            source = next((c for c in ['Season', 'Year', 'Draft'] if c in frame.columns), None)
+            frame['season_year'] = frame[source].map(season_year) if source else None
+        frame['season_year'] = pd.to_numeric(frame['season_year'], errors='coerce').astype('Int64')
+
+        team = next((c for c in ['Team', 'Tm'] if c in frame.columns), None)
+        frame['team_code'] = frame[team] if team else None
+
+        return frame
+
+    def write(self, dataset, df, season=None, **keys):
+        """
+        Store ``df`` in the ``dataset`` table, replacing the rows previously
+        stored under the same ``season`` and ``keys`` (e.g.
+        ``season=2023, playoffs=False``).
+        """
+
+        if season is not None:
+            keys = dict(season_year=season_year(season), **keys)
+        frame = self._prepare(df, keys)
+
+        with self._lock, self._conn:
+            existing = self._columns(dataset)
+            if not existing:
+                definition = ', '.join(_quote(c)+' '+_sql_type(frame[c]) for c in frame.columns)
+                self._conn.execute('CREATE TABLE '+_quote(dataset)+' ('+definition+')')
+            else:
+                for column in frame.columns:
+                    if column not in existing:
+                        self._conn.execute('ALTER TABLE '+_quote(dataset)+' ADD COLUMN '
+                                           +_quote(column)+' '+_sql_type(frame[column]))
+
+            self._conn.execute('CREATE INDEX IF NOT EXISTS '+_quote(dataset+'_season_team')
+                               +' ON '+_quote(dataset)+' (season_year, team_code)')
+            if 'player_id' in frame.columns:
+                self._conn.execute('CREATE INDEX IF NOT EXISTS '+_quote(dataset+'_player_id')
+                                   +' ON '+_quote(dataset)+' (player_id)')
+
+            if keys:
+                where = ' AND '.join(_quote(k)+' IS ?' for k in keys)
+                self._conn.execute('DELETE FROM '+_quote(dataset)+' WHERE '+where,
+                                   [_python(v) for v in keys.values()])
+
+            columns = ', '.join(_quote(c) for c in frame.columns)
+            marks = ', '.join('?' for _ in frame.columns)
+            rows = frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+            self._conn.executemany('INSERT INTO '+_quote(dataset)+' ('+columns+') VALUES ('+marks+')',
+                                   ([_python(v) for v in row] for row in rows))
+
+    def query(self, dataset, player_id=None, season=None, team=None, columns=None, **filters):
+        """
+        Rows of ``dataset`` matching every given filter.
+
+        Parameters
+        ----------
+        dataset : str
+            Table name, e.g. ``'stats_totals'``, ``'draft'``, ``'awards'``.
+        player_id : str or list, optional
+        season : int, list or tuple, optional
+            Season(s) as ending years or ``'2009-10'`` labels, matched
+            against ``season_year``. A ``(first, last)`` tuple selects a
+            range.
+        team : str or list, optional
+        columns : list of str, optional
+            Only read these columns (all by default).
+        **filters
+            Equality filters on any other column (e.g. ``playoffs=False``).
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+
+        if dataset not in self.tables():
+            raise ValueError(str(dataset)+' is not a stored dataset. Try one of: "'+'", "'.join(self.tables())+'".')
+
+        clauses = []
+        params = []
+
+        def add(column, value):
+            if isinstance(value, (list, set)):
+                value = list(value)
+                clauses.append(_quote(column)+' IN ('+', '.join('?' for _ in value)+')')
+                params.extend(_python(v) for v in value)
+            else:
+                clauses.append(_quote(column)+' = ?')
+                params.append(_python(value))
+
+        if player_id is not None:
+            add('player_id', player_id)
+        if isinstance(season, tuple):
+            clauses.append('season_year BETWEEN ? AND ?')
+            params.extend(season_year(s) for s in season)
+        elif isinstance(season, (list, set)):
+            add('season_year', [season_year(s) for s in season])
+        elif season is not None:
+            add('season_year', season_year(season))
+        if team is not None:
+            add('team_code', team)
+        for column, value in filters.items():
+            add(column, value)
+
+        selected = ', '.join(_quote(c) for c in columns) if columns else '*'
+        sql = 'SELECT '+selected+' FROM '+_quote(dataset)
+        if clauses:
+            sql += ' WHERE '+' AND '.join(clauses)
+        sql += ' ORDER BY rowid' # insertion order, not index order
+
+        return self.sql(sql, params)
+
+    def sql(self, query, params=()):
+        """
+        Run a raw SQL query against the store.
+        """
+
+        with self._lock:
+            return pd.read_sql_query(query, self._conn, params=list(params))
+
+def _python(value):
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+def enable(path=None):
+    """
+    Start writing every getter result through to the local store.
+
+    Returns
+    -------
+    Warehouse
+    """
+
+    global _store
+
+    _store = Warehouse(path)
+
+    return _store
+
+def disable():
+
+    global _store
+
+    if _store is not None:
+        _store.close()
+    _store = None
+
+def set_store(store):
+    """
+    Use ``store`` (a ``Warehouse`` or ``None``) as the write-through store,
+    without closing the current one.
+    """
+
+    global _store
+
+    _store = store
+
+def get_store():
+
+    return _store
+
+def record(dataset, df, season=None, **keys):
+    """
+    Write-through hook called by the getters; does nothing unless the
+    store is enabled and never makes the getter fail.
+    """
+
+    store = _store
+    if store is None or df is None or df.empty:
+        return
+
+    try:
+        store.write(dataset, df, season=season, **keys)
+    except Exception as e:
+        logger.warning('Could not store %s in the warehouse: %s', dataset, e)
+
+def query(dataset, player_id=None, season=None, team=None, columns=None, **filters):
+    """
+    Query the enabled store, see ``Warehouse.query``.
+    """
+
+    if _store is None:
+        raise ValueError('The warehouse is not enabled. Call warehouse.enable() first.')
+
+    return _store.query(dataset, player_id=player_id, season=season, team=team, columns=columns, **filters)
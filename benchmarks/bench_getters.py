@@ -0,0 +1,266 @@
+"""
+Offline benchmark of every public getter of ``nba``, ``gleague`` and
+``international``: parse and post-processing time (page download
+excluded), peak memory and rows per second, replayed from fixture pages.
+
+    python benchmarks/bench_getters.py                          # synthetic pages
+    python benchmarks/bench_getters.py --pages saved/           # recorded pages
+    python benchmarks/bench_getters.py --save-baseline base.json
+    python benchmarks/bench_getters.py --baseline base.json     # exit 1 on regressions
+
+Recorded pages are looked up by URL path under ``--pages``, e.g.
+``saved/leagues/NBA_2024_per_game.html`` (``index.html`` for paths ending
+in ``/``), and replace the synthetic page of that path. Nothing is
+downloaded.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from BRScraper import dtypes, fetch, gleague, identity, names, nba, warehouse
+from BRScraper import international
+from BRScraper.international import (aba, acb, cba, eurocup, euroleague, greece, israel, italy, leagues, lnb,
+                                     nbl, olympics, players, russia, turkey)
+from benchmarks.fixtures import SEASON, load_pages, site
+
+NOISE_MS = 1.0 # differences below this are never regressions
+
+class Response:
+
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+class ReplaySession:
+    """
+    Stand-in for ``requests.Session`` answering from ``pages`` (URL path
+    -> HTML). ``elapsed`` is the time spent in ``get``, subtracted from
+    the measured getter time.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.elapsed = 0.0
+
+    def get(self, url, **kwargs):
+        start = time.perf_counter()
+        html = self.pages.get(urlsplit(url).path)
+        response = Response(html) if html is not None else Response('', 404)
+        self.elapsed += time.perf_counter()-start
+        return response
+
+def _ids(pages, pattern):
+
+    return [m.group(1) for m in map(re.compile(pattern).fullmatch, sorted(pages)) if m]
+
+def cases(pages):
+    """
+    ``(label, getter, args, kwargs)`` of every benchmarked call.
+    """
+
+    nba_ids = _ids(pages, r'/players/\w/(\w+)\.html')
+    gleague_ids = _ids(pages, r'/gleague/players/\w/(\w+)\.html')
+    international_ids = _ids(pages, r'/international/players/([\w-]+)\.html')
+
+    # One player known in all three leagues, for players.get_career
+    names.get_index().add(nba_ids[:1], ['Bench Player'])
+    identity.record('gleague', gleague_ids[:1], ['Bench Player'])
+    identity.record('international', international_ids[:1], ['Bench Player'])
+
+    found = [
+        ('nba.get_current_salaries', nba.get_current_salaries, (), {}),
+        ('nba.get_current_salaries(teams)', nba.get_current_salaries, ('teams',), {}),
+        ('nba.get_stats', nba.get_stats, (SEASON,), {}),
+        ('nba.get_stats(advanced)', nba.get_stats, (SEASON, 'advanced'), {}),
+        ('nba.get_stats_bulk', nba.get_stats_bulk, ([SEASON],), {}),
+        ('nba.get_stats_wide', nba.get_stats_wide, (SEASON,), {}),
+        ('nba.get_standings', nba.get_standings, (SEASON,), {}),
+        ('nba.get_general_info', nba.get_general_info, (), {}),
+        ('nba.get_team_stats', nba.get_team_stats, (SEASON,), {}),
+        ('nba.get_season_leaders', nba.get_season_leaders, (SEASON, 'pts'), {}),
+        ('nba.get_all_season_leaders', nba.get_all_season_leaders, (SEASON,), {}),
+        ('nba.get_coach_data', nba.get_coach_data, (SEASON,), {}),
+        ('nba.get_player_stats', nba.get_player_stats, (nba_ids[0],), {}),
+        ('nba.get_player_stats_bulk', nba.get_player_stats_bulk, (nba_ids,), {}),
+        ('nba.get_draft_info', nba.get_draft_info, (SEASON,), {}),
+        ('nba.get_playoffs_probs', nba.get_playoffs_probs, ('east',), {}),
+        ('nba.get_rookies', nba.get_rookies, (SEASON,), {}),
+        ('nba.get_birthdays', nba.get_birthdays, (), {}),
+        ('nba.get_awards', nba.get_awards, ('mvp',), {}),
+        ('nba.get_award_votings', nba.get_award_votings, ('mvp', SEASON), {}),
+        ('gleague.get_awards', gleague.get_awards, ('mvp',), {}),
+        ('gleague.get_standings', gleague.get_standings, (SEASON,), {}),
+        ('gleague.get_player_stats', gleague.get_player_stats, (gleague_ids[0],), {}),
+    ]
+
+    for module in [aba, acb, cba, eurocup, euroleague, greece, israel, italy, lnb, nbl, russia, turkey, olympics]:
+        name = module.__name__.rsplit('.', 1)[1]
+        found.append((name+'.get_stats', module.get_stats, (SEASON,), {}))
+        found.append((name+'.get_standings', module.get_standings, (SEASON,), {}))
+
+    found += [
+        ('international.get_stats_many', international.get_stats_many, (leagues.CLUB_LEAGUES, [SEASON]), {}),
+        ('players.get_player_stats', players.get_player_stats, (international_ids[0],), {}),
+        ('players.get_mvps', players.get_mvps, (), {}),
+        ('players.get_career', players.get_career, ('Bench Player',), {}),
+    ]
+
+    return found
+
+def rows(result):
+
+    if isinstance(result, dict):
+        return sum(len(df) for df in result.values())
+
+    return len(result)
+
+def measure(session, func, args, kwargs, repeat, memory=True):
+    """
+    Best time (seconds, downloads excluded), peak traced memory (bytes,
+    ``None`` without ``memory``) and rows returned by one call.
+    """
+
+    best = float('inf')
+    for _ in range(repeat):
+        fetch.clear_memo()
+        session.elapsed = 0.0
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter()-start-session.elapsed)
+
+    if not memory:
+        return best, None, rows(result)
+
+    # Separate run: tracing slows allocations down several times
+    fetch.clear_memo()
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak, rows(result)
+
+@contextmanager
+def replaying(pages):
+    """
+    Answer every request from ``pages`` with no rate limit, page cache,
+    compaction, warehouse or previously indexed players, and put all of
+    them back on exit.
+    """
+
+    session = ReplaySession(pages)
+    previous_session = fetch.set_session(session)
+    limiter, cache, compact = fetch.get_rate_limiter(), fetch.get_cache(), dtypes.enabled()
+    store, player_index, identity_index = warehouse.get_store(), names.get_index(), identity.get_index()
+
+    fetch.set_rate_limiter(None)
+    fetch.disable_cache()
+    dtypes.disable()
+    warehouse.set_store(None)
+    names.set_index(names.PlayerIndex())
+    identity.set_index(identity.IdentityIndex())
+    fetch.clear_memo()
+    try:
+        yield session
+    finally:
+        fetch.set_session(previous_session)
+        fetch.set_rate_limiter(limiter)
+        if cache is not None:
+            fetch.enable_cache(cache.directory)
+        if compact:
+            dtypes.enable()
+        warehouse.set_store(store)
+        names.set_index(player_index)
+        identity.set_index(identity_index)
+        # The memo holds parsed replayed pages
+        fetch.clear_memo()
+
+def run(pages, repeat=5, match=None, memory=True):
+    """
+    Benchmark every case whose label contains ``match``; returns
+    ``{label: {'ms', 'peak_mb', 'rows', 'rows_per_s'}}``.
+    """
+
+    results = {}
+
+    with replaying(pages) as session, warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for label, func, args, kwargs in cases(pages):
+            if match and match not in label:
+                continue
+            seconds, peak, n = measure(session, func, args, kwargs, repeat, memory)
+            results[label] = {'ms': seconds*1000, 'peak_mb': peak/2**20 if memory else None, 'rows': n,
+                              'rows_per_s': n/seconds if seconds > 0 else float('inf')}
+
+    return results
+
+def regressions(results, baseline, threshold):
+    """
+    ``(label, metric, before, after)`` of every result worse than the
+    baseline by more than ``threshold`` (a fraction).
+    """
+
+    found = []
+    for label, result in results.items():
+        before = baseline.get(label)
+        if before is None:
+            continue
+        if result['ms'] > before['ms']*(1+threshold) and result['ms']-before['ms'] > NOISE_MS:
+            found.append((label, 'ms', before['ms'], result['ms']))
+        if result['peak_mb'] and before['peak_mb'] and result['peak_mb'] > before['peak_mb']*(1+threshold):
+            found.append((label, 'peak_mb', before['peak_mb'], result['peak_mb']))
+
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', help='Directory of recorded pages, laid out by URL path')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--match', help='Only the getters whose label contains this text')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the (slow) peak memory runs')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown, as a fraction')
+    parser.add_argument('--save-baseline', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    pages = site()
+    if args.pages:
+        pages.update(load_pages(args.pages))
+
+    results = run(pages, args.repeat, args.match, not args.no_memory)
+
+    print(f"{'getter':36} {'rows':>7} {'time':>10} {'rows/s':>11} {'peak':>9}")
+    for label, r in results.items():
+        peak = f"{r['peak_mb']:7.1f}MB" if r['peak_mb'] is not None else f"{'-':>9}"
+        print(f"{label:36} {r['rows']:7d} {r['ms']:8.1f}ms {r['rows_per_s']:11.0f} {peak}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            found = regressions(results, json.load(f), args.threshold)
+        for label, metric, before, after in found:
+            print(f"REGRESSION {label}: {metric} {before:.1f} -> {after:.1f} (+{(after/before-1)*100:.0f}%)")
+        if found:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Memory benchmark for ``dtypes.compact``: deep memory usage of stacked
+season stats frames with the default dtypes against the compact ones.
+
+    python benchmarks/bench_memory.py                # 45 synthetic seasons
+    python benchmarks/bench_memory.py --seasons 10
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BRScraper import dtypes, parse
+from benchmarks.fixtures import stats_page
+
+def season_frame(season):
+    # Same shape as nba.get_stats: ids, no Rk/Player/Age/percentages, Season label
+    df = parse.read_table(stats_page(seed=season)[0])
+    df = df[df['Player'].notna() & (df['Player'] != 'League Average')].reset_index(drop=True)
+    df = df.drop(columns=['Rk','Player','Age','FG%','2P%','3P%','eFG%','FT%'], errors='ignore')
+    df['Season'] = str(season-1)+'-'+str(season)[-2:]
+    return df
+
+def megabytes(df):
+    return df.memory_usage(deep=True).sum()/2**20
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=45)
+    args = parser.parse_args()
+
+    frames = [season_frame(season) for season in range(2025-args.seasons, 2025)]
+
+    start = time.perf_counter()
+    compact = [dtypes.compact(df) for df in frames]
+    elapsed = time.perf_counter()-start
+
+    before = sum(megabytes(df) for df in frames)
+    after = sum(megabytes(df) for df in compact)
+
+    print(f"{'frames':>8} {'rows':>8} {'default':>10} {'compact':>10} {'ratio':>7} {'time':>9}")
+    print(f"{len(frames):8d} {sum(len(df) for df in frames):8d} {before:8.1f}MB {after:8.1f}MB "
+          f"{before/after:6.1f}x {elapsed*1000:7.1f}ms")
+
+    print()
+    print(pd.DataFrame({'default': frames[-1].dtypes.astype(str), 'compact': compact[-1].dtypes.astype(str)}))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Parse-time benchmark for ``nba.get_stats``: the previous BeautifulSoup +
+``pd.read_html`` double parse against the single lxml pass of
+``parse.read_table``.
+
+    python benchmarks/bench_parse.py                       # synthetic page
+    python benchmarks/bench_parse.py saved/NBA_2023_*.html # saved pages
+"""
+import argparse
+import os
+import sys
+import time
+from io import StringIO
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BRScraper import parse
+from benchmarks.fixtures import stats_page
+
+def double_parse(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    player_ids = []
+    for row in soup.find('table').find('tbody').find_all('tr'):
+        player_td = row.find('td', {'data-stat': 'name_display'}) or row.find('td', {'data-stat': 'player'})
+        if player_td and player_td.get('data-append-csv'):
+            player_ids.append(player_td['data-append-csv'])
+    df = pd.read_html(StringIO(html))[0]
+    return df, player_ids
+
+def single_parse(html):
+    return parse.read_table(html)
+
+def best_of(func, html, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        times.append(time.perf_counter()-start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', help='Saved season stats pages')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pages = [(path, open(path, encoding='utf-8').read()) for path in args.pages]
+    if not pages:
+        pages = [('synthetic (650 players)', stats_page()[0])]
+
+    print(f"{'page':40} {'bs4+read_html':>14} {'read_table':>11} {'speedup':>8}")
+    for name, html in pages:
+        old = best_of(double_parse, html, args.repeat)
+        new = best_of(single_parse, html, args.repeat)
+        print(f"{os.path.basename(name)[:40]:40} {old*1000:12.1f}ms {new*1000:9.1f}ms {old/new:7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+"""
+Synthetic pages laid out like Basketball Reference's.
+
+Used by the benchmarks when no recorded pages are available. The markup
+mirrors the real site: ``data-stat`` cells, ``data-append-csv`` player
+ids, ``<tr class="thead">`` header rows repeated every 20 players, a
+League Average footer, secondary tables hidden in HTML comments and a
+large amount of navigation chrome around the table.
+"""
+import os
+import random
+
+STATS = [
+    ('ranker', 'Rk'), ('name_display', 'Player'), ('age', 'Age'), ('team_name_abbr', 'Team'),
+    ('pos', 'Pos'), ('games', 'G'), ('games_started', 'GS'), ('mp_per_g', 'MP'),
+    ('fg_per_g', 'FG'), ('fga_per_g', 'FGA'), ('fg_pct', 'FG%'), ('fg3_per_g', '3P'),
+    ('fg3a_per_g', '3PA'), ('fg3_pct', '3P%'), ('fg2_per_g', '2P'), ('fg2a_per_g', '2PA'),
+    ('fg2_pct', '2P%'), ('efg_pct', 'eFG%'), ('ft_per_g', 'FT'), ('fta_per_g', 'FTA'),
+    ('ft_pct', 'FT%'), ('orb_per_g', 'ORB'), ('drb_per_g', 'DRB'), ('trb_per_g', 'TRB'),
+    ('ast_per_g', 'AST'), ('stl_per_g', 'STL'), ('blk_per_g', 'BLK'), ('tov_per_g', 'TOV'),
+    ('pf_per_g', 'PF'), ('pts_per_g', 'PTS'), ('awards', 'Awards'),
+]
+
+TEAMS = ['ATL','BOS','BRK','CHO','CHI','CLE','DAL','DEN','DET','GSW','HOU','IND','LAC','LAL','MEM',
+         'MIA','MIL','MIN','NOP','NYK','OKC','ORL','PHI','PHO','POR','SAC','SAS','TOR','UTA','WAS']
+
+POSITIONS = ['PG','SG','SF','PF','C']
+
+def _chrome(size):
+    links = ''.join('<li><a href="/players/x/link'+str(i)+'.html">Link '+str(i)+'</a></li>' for i in range(size))
+    return '<div id="nav"><ul>'+links+'</ul></div><script>var x = 1;</script>'
+
+def _header():
+    cells = ''.join('<th aria-label="'+label+'" data-stat="'+stat+'" scope="col" class=" poptip center">'
+                    +label+'</th>' for stat, label in STATS)
+    return '<tr>'+cells+'</tr>'
+
+def _row(rank, rng):
+    first = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 8))).title()
+    last = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 9))).title()
+    player_id = (last.lower()[:5]+first.lower()[:2]+'0'+str(rng.randint(1, 3)))
+    g = rng.randint(1, 82)
+    fga = round(rng.uniform(0, 20), 1)
+    fg = round(fga*rng.uniform(0.3, 0.6), 1)
+    values = {
+        'age': rng.randint(19, 40), 'team_name_abbr': rng.choice(TEAMS), 'pos': rng.choice(POSITIONS),
+        'games': g, 'games_started': rng.randint(0, g), 'mp_per_g': round(rng.uniform(2, 38), 1),
+        'fg_per_g': fg, 'fga_per_g': fga, 'fg_pct': '%.3f' % (fg/fga if fga else 0),
+        'awards': rng.choice(['', '', '', 'MVP-5,AS']),
+    }
+    cells = ['<th scope="row" class="right " data-stat="ranker" csk="'+str(rank)+'">'+str(rank)+'</th>',
+             '<td class="left " data-append-csv="'+player_id+'" data-stat="name_display" csk="'+last+','+first+'">'
+             '<a href="/players/'+player_id[0]+'/'+player_id+'.html">'+first+' '+last+'</a></td>']
+    for stat, _ in STATS[2:]:
+        value = values.get(stat, round(rng.uniform(0, 10), 1))
+        cells.append('<td class="right " data-stat="'+stat+'">'+str(value)+'</td>')
+    return '<tr>'+''.join(cells)+'</tr>', player_id
+
+def stats_page(n_players=650, seed=0, table_id='per_game_stats'):
+    """
+    HTML of a season stats page with ``n_players`` rows and the list of
+    player ids in row order.
+    """
+
+    rng = random.Random(seed)
+    rows = []
+    ids = []
+    for rank in range(1, n_players+1):
+        row, player_id = _row(rank, rng)
+        rows.append(row)
+        ids.append(player_id)
+        if rank % 20 == 0:
+            rows.append(_header().replace('<tr>', '<tr class="thead">', 1))
+
+    footer = '<tr><th data-stat="ranker"></th><td data-stat="name_display">League Average</td>'+'<td></td>'*(len(STATS)-2)+'</tr>'
+    table = ('<table class="sortable stats_table" id="'+table_id+'" data-cols-to-freeze=",3">'
+             '<caption>Player Stats Table</caption><thead>'+_header()+'</thead><tbody>'
+             +''.join(rows)+'</tbody><tfoot>'+footer+'</tfoot></table>')
+    hidden = '<!-- <div><table id="hidden_'+table_id+'"><tr><th>A</th></tr><tr><td>1</td></tr></table></div> -->'
+
+    html = ('<!DOCTYPE html><html><head><title>Stats</title></head><body>'
+            +_chrome(1500)+'<div class="table_container">'+table+'</div>'+hidden+_chrome(500)+'</body></html>')
+
+    return html, ids
+
+SEASON = 2024
+
+LEAGUE_SLUGS = ['aba-adriatic','spain-liga-acb','cba-china','eurocup','euroleague','greek-basket-league',
+                'israel-super-league','italy-basket-serie-a','france-lnb-pro-a','nbl-australia','vtb-united',
+                'turkey-super-league','mens-olympics','womens-olympics']
+
+def _name(rng):
+    first = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 8))).title()
+    last = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 9))).title()
+    return first, last
+
+def _cell(value):
+    # (text, href) tuples are player links
+    if isinstance(value, tuple):
+        return '<td data-stat="player"><a href="'+value[1]+'">'+value[0]+'</a></td>'
+    return '<td>'+str(value)+'</td>'
+
+def table(headers, rows, table_id=None):
+    """
+    HTML of a table. ``headers`` is a list of header rows, each a list of
+    labels or ``(label, colspan)`` pairs; cells of ``rows`` are values or
+    ``(text, href)`` player links.
+    """
+
+    head = ''
+    for header in headers:
+        cells = [h if isinstance(h, tuple) else (h, 1) for h in header]
+        head += '<tr>'+''.join('<th colspan="'+str(span)+'">'+label+'</th>' for label, span in cells)+'</tr>'
+    body = ''.join('<tr>'+''.join(_cell(value) for value in row)+'</tr>' for row in rows)
+    table_id = ' id="'+table_id+'"' if table_id else ''
+
+    return '<table'+table_id+'><thead>'+head+'</thead><tbody>'+body+'</tbody></table>'
+
+def page(*tables):
+
+    return '<!DOCTYPE html><html><body>'+_chrome(300)+''.join(tables)+_chrome(100)+'</body></html>'
+
+def _players(rng, n, href='/players/{letter}/{id}.html'):
+    players = []
+    for _ in range(n):
+        first, last = _name(rng)
+        player_id = last.lower()[:5]+first.lower()[:2]+'0'+str(rng.randint(1, 3))
+        link = href.format(letter=player_id[0], id=player_id, slug=(first+'-'+last).lower()+'-1')
+        players.append((first+' '+last, link))
+    return players
+
+def _stats(rng, n):
+    return [round(rng.uniform(0, 30), 1) for _ in range(n)]
+
+def _standings(rng, conference):
+    header = [[conference, 'W', 'L', 'W/L%', 'GB', 'PS/G', 'PA/G', 'SRS']]
+    rows = []
+    for team in rng.sample(TEAMS, 15):
+        w = rng.randint(15, 65)
+        rows.append([team, w, 82-w, '%.3f' % (w/82), rng.randint(0, 40), *_stats(rng, 3)])
+    return table(header, rows)
+
+def _career_rows(rng, n, extra=()):
+    seasons = [str(y-1)+'-'+str(y)[-2:] for y in range(SEASON-n+1, SEASON+1)]
+    return [[season, *extra, rng.choice(TEAMS), *_stats(rng, 8)] for season in seasons]
+
+def site(seed=0, n_players=650, league_players=250):
+    """
+    Synthetic pages for every getter, keyed by URL path (query strings
+    dropped), e.g. ``'/leagues/NBA_2024_per_game.html'``. ``n_players``
+    rows on the NBA season stats pages, ``league_players`` on the
+    international ones.
+    """
+
+    rng = random.Random(seed)
+    pages = {}
+
+    for suffix in ['per_game', 'totals', 'advanced', 'per_minute', 'per_poss']:
+        for comp in ['leagues', 'playoffs']:
+            pages['/'+comp+'/NBA_'+str(SEASON)+'_'+suffix+'.html'] = stats_page(n_players, seed)[0]
+
+    seasons = ['2024-25', '2025-26', '2026-27', '2027-28', '2028-29', '2029-30']
+    pages['/contracts/players.html'] = page(table(
+        [[('', 3), ('Salary', 6), ('', 1)], ['Rk', 'Player', 'Tm', *seasons, 'Guaranteed']],
+        [[i+1, player, rng.choice(TEAMS), *[rng.randint(10**6, 5*10**7) for _ in range(7)]]
+         for i, player in enumerate(_players(rng, 500))]))
+    pages['/contracts/'] = page(table(
+        [[('', 2), ('Salary', 6)], ['Rk', 'Team', *seasons]],
+        [[i+1, team, *[rng.randint(10**8, 2*10**8) for _ in range(6)]] for i, team in enumerate(TEAMS)]))
+
+    standings = page(_standings(rng, 'Eastern Conference'), _standings(rng, 'Western Conference'))
+    pages['/leagues/NBA_'+str(SEASON)+'_standings.html'] = standings
+
+    pages['/leagues/'] = page(table(
+        [[('', 3), ('Voting', 2), ('League Leaders', 4)],
+         ['Season', 'Lg', 'Champion', 'MVP', 'Rookie of the Year', 'Points', 'Rebounds', 'Assists', 'Win Shares']],
+        [[str(y-1)+'-'+str(y)[-2:], 'NBA', rng.choice(TEAMS), *[p for p, _ in _players(rng, 6)]]
+         for y in range(1950, SEASON+1)]))
+
+    team_header = [['Rk', 'Team', 'G', 'MP', 'FG', 'FGA', 'FG%', '3P', '3PA', 'ORB', 'DRB', 'AST', 'PTS']]
+    for comp in ['leagues', 'playoffs']:
+        tables = []
+        for info in ['totals', 'per_game', 'advanced']:
+            rows = ''.join('<tr><th>'+str(i+1)+'</th><td data-stat="team"><a href="/teams/'+team+'/'+str(SEASON)
+                           +'.html">'+team+'</a></td>'+''.join('<td>'+str(v)+'</td>' for v in _stats(rng, 11))+'</tr>'
+                           for i, team in enumerate(TEAMS))
+            tables.append(table(team_header, []).replace('<tbody></tbody>', '<tbody>'+rows+'</tbody>')
+                          .replace('<table>', '<table id="'+info+'-team">'))
+        pages['/'+comp+'/NBA_'+str(SEASON)+'.html'] = page(*tables)
+
+        boards = []
+        for _ in range(50):
+            rows = ''.join('<tr><td>'+str(i+1)+'.</td><td><a href="'+href+'">'+name+'</a> • '+rng.choice(TEAMS)
+                           +'</td><td>'+str(round(rng.uniform(0, 2000), 1))+'</td></tr>'
+                           for i, (name, href) in enumerate(_players(rng, 20)))
+            boards.append('<table>'+rows+'</table>')
+        pages['/'+comp+'/NBA_'+str(SEASON)+'_leaders.html'] = page(*boards)
+
+    pages['/leagues/NBA_'+str(SEASON)+'_coaches.html'] = page(table(
+        [[('', 6), ('Regular Season', 10), ('', 1), ('Playoffs', 9)],
+         [('', 6), ('Current Season', 3), ('Franchise', 3), ('Career', 4), ('', 1),
+          ('Current Season', 3), ('Franchise', 3), ('Career', 3)],
+         ['Coach', 'Tm', '', 'Franchise', 'Career', '', *['G', 'W', 'L']*3, 'W%', '', *['G', 'W', 'L']*3]],
+        [[' '.join(_name(rng)), team, '', rng.randint(0, 10), rng.randint(0, 30), '',
+          *[rng.randint(0, 900) for _ in range(9)], '.500', '', *[rng.randint(0, 100) for _ in range(9)]]
+         for team in TEAMS]))
+
+    career_header = [['Season', 'Age', 'Team', 'G', 'GS', 'MP', 'FG', 'FGA', 'TRB', 'AST', 'PTS']]
+    for name, href in _players(rng, 10, '/players/{letter}/{id}.html'):
+        html = table(career_header, _career_rows(rng, 15, [rng.randint(19, 40)])+[['Career', '', '', *_stats(rng, 8)]])
+        pages[href] = page('<div id="div_totals">'+html+'</div>')
+
+    pages['/draft/NBA_'+str(SEASON)+'.html'] = page(table(
+        [[('', 4), ('Round 1', 2), ('Totals', 4)], ['Rk', 'Pk', 'Tm', 'Player', 'College', 'Yrs', 'G', 'MP', 'PTS', 'TRB']],
+        [[i+1, i+1, rng.choice(TEAMS), player, 'State', *_stats(rng, 5)] for i, player in enumerate(_players(rng, 60))]))
+
+    probs = []
+    for conference in ['Eastern Conference', 'Western Conference']:
+        probs.append(table(
+            [[('', 4), ('Playoff Seeding', 6), ('', 1)], ['Rk', conference, 'W', 'L', *map(str, range(1, 7)), '']],
+            [[i+1, team, rng.randint(10, 60), rng.randint(10, 60), *_stats(rng, 6), ''] for i, team in enumerate(TEAMS[:15])]))
+    pages['/friv/playoff_prob.html'] = page(*probs)
+
+    pages['/leagues/NBA_'+str(SEASON)+'_rookies.html'] = page(table(
+        [[('', 5), ('Totals', 6)], ['Rk', 'Player', 'Debut', 'Age', 'Yrs', 'G', 'MP', 'FG', 'TRB', 'AST', 'PTS']],
+        [[i+1, player, 'Oct 24 \'23', rng.randint(19, 24), 1, *_stats(rng, 6)]
+         for i, player in enumerate(_players(rng, 100))]))
+
+    pages['/friv/birthdays.fcgi'] = page(table(
+        [[('', 4), ('Totals', 4), ('', 1)], ['Rk', 'Player', 'Born', 'From', 'G', 'PTS', 'TRB', 'AST', '']],
+        [[i+1, player, 1980, 2000, *_stats(rng, 4), ''] for i, player in enumerate(_players(rng, 30))]))
+
+    award_header = [[('', 4), ('Totals', 4)], ['Season', 'Lg', 'Player', 'Age', 'G', 'MP', 'PTS', 'TRB']]
+    for award in ['mvp', 'roy']:
+        pages['/awards/'+award+'.html'] = page(table(
+            award_header, [[str(y-1)+'-'+str(y)[-2:], 'NBA', player, rng.randint(20, 35), *_stats(rng, 4)]
+                           for y, player in zip(range(SEASON, 1955, -1), _players(rng, 70))]))
+
+    votings = []
+    for award in ['mvp', 'roy', 'nba', 'all_defense']:
+        votings.append(table(
+            [[('', 4), ('Voting', 4), ('Per Game', 3)],
+             ['Rank', 'Player', 'Age', 'Tm', 'First', 'Pts Won', 'Pts Max', 'Share', 'PTS', 'TRB', 'AST']],
+            [[i+1, player, rng.randint(20, 35), rng.choice(TEAMS), *_stats(rng, 7)]
+             for i, player in enumerate(_players(rng, 15))]))
+    pages['/awards/awards_'+str(SEASON)+'.html'] = page(*votings)
+
+    for award in ['mvp', 'roy']:
+        pages['/gleague/awards/'+award+'.html'] = page(table(
+            award_header, [[str(y-1)+'-'+str(y)[-2:], 'GLG', player, rng.randint(20, 35), *_stats(rng, 4)]
+                           for y, player in zip(range(SEASON, 2001, -1),
+                                                _players(rng, 25, '/gleague/players/{letter}/{id}d.html'))]))
+
+    gleague = [_standings(rng, conference) for conference in ['Eastern', 'Western']]
+    pages['/gleague/years/'+str(SEASON)+'.html'] = page(*(gleague*2))
+
+    season_header = [['Season', 'Team', 'G', 'MP', 'FG', 'FGA', 'TRB', 'AST', 'STL', 'PTS']]
+    for name, href in _players(rng, 10, '/gleague/players/{letter}/{id}d.html'):
+        pages[href] = page(table(season_header, _career_rows(rng, 5)+[['Career', '', *_stats(rng, 8)]]))
+
+    league_header = [['Player', 'Team', 'G', 'MP', 'FG', 'FGA', '3P', '3PA', 'TRB', 'AST', 'PTS']]
+    for slug in LEAGUE_SLUGS:
+        players = _players(rng, league_players, '/international/players/{slug}.html')
+        for suffix in ['per_game', 'totals', 'per_minute']:
+            pages['/international/'+slug+'/'+str(SEASON)+'_'+suffix+'.html'] = page(table(
+                league_header, [[player, rng.choice(TEAMS), *_stats(rng, 9)] for player in players]))
+        pages['/international/'+slug+'/'+str(SEASON)+'.html'] = page(table(
+            [[('', 1), ('Overall', 4)], ['', 'W', 'L', 'W/L%', 'PTS']],
+            [[team, rng.randint(5, 30), rng.randint(5, 30), '.500', *_stats(rng, 1)] for team in TEAMS[:18]]))
+
+    intl_header = [['Season', 'Age', 'Team', '', 'G', 'MP', 'FG', 'FGA', 'TRB', 'AST', 'PTS', 'STL']]
+    for name, href in _players(rng, 10, '/international/players/{slug}.html'):
+        rows = [row[:3]+['Country']+row[3:] for row in _career_rows(rng, 8, [rng.randint(19, 40)])]
+        pages[href] = page(table(intl_header, rows+[['Career']+['']*11]))
+
+    pages['/international/awards/mvp.html'] = page(table(
+        [[('', 4), ('Totals', 3)], ['Season', 'League', 'Player', 'Team', 'G', 'PTS', 'TRB']],
+        [[str(y-1)+'-'+str(y)[-2:], 'EuroLeague', player, rng.choice(TEAMS), *_stats(rng, 3)]
+         for y, player in zip(range(SEASON, 1990, -1), _players(rng, 34, '/international/players/{slug}.html'))]))
+
+    return pages
+
+def load_pages(directory):
+    """
+    Recorded pages saved under ``directory`` by URL path, e.g.
+    ``saved/leagues/NBA_2024_per_game.html`` (``index.html`` for paths
+    ending in ``/``).
+    """
+
+    pages = {}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            key = '/'+os.path.relpath(path, directory).replace(os.sep, '/')
+            if key.endswith('/index.html'):
+                key = key[:-len('index.html')]
+            with open(path, encoding='utf-8') as f:
+                pages[key] = f.read()
+
+    return pages
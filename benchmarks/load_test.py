@@ -0,0 +1,98 @@
+"""
+End-to-end throughput of bulk crawls against the local mock server:
+``nba.get_stats_bulk`` and ``international.get_stats_many`` over several
+seasons, for each number of workers, with the configured latency, 429s
+and 5xx errors. The real site is never contacted.
+
+    python benchmarks/load_test.py                                  # 1, 4 and 8 workers
+    python benchmarks/load_test.py --workers 2,16 --latency 0.2 --rate-429 0.05 --retry-after 0.5
+    python benchmarks/load_test.py --rpm 19                         # with the default rate limit
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BRScraper import dtypes, fetch, identity, international, names, nba, warehouse
+from benchmarks.fixtures import SEASON, site
+from benchmarks.mock_server import MockServer
+
+INFOS = ('per_game', 'totals', 'advanced', 'per_36', 'per_100')
+
+def crawl(seasons, workers):
+    """
+    Rows returned by the bulk getters for ``seasons``.
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        nba_stats = nba.get_stats_bulk(seasons, INFOS, max_workers=workers, errors='warn')
+        league_stats = international.get_stats_many(None, seasons, max_workers=workers, errors='warn')
+
+    return len(nba_stats)+len(league_stats)
+
+def run(server, seasons, workers, rpm=None, max_retries=3):
+    """
+    Crawl once through ``server``; returns the wall time, rows and the
+    server's answers by status.
+    """
+
+    fetch.configure(base_url=server.url, pool_size=max(workers, 1), max_retries=max_retries)
+    if rpm:
+        fetch.configure(requests_per_minute=rpm)
+    else:
+        fetch.set_rate_limiter(None)
+    fetch.clear_memo()
+    server.statuses.clear()
+
+    start = time.perf_counter()
+    rows = crawl(seasons, workers)
+    elapsed = time.perf_counter()-start
+
+    return elapsed, rows, dict(server.statuses)
+
+def setup():
+
+    fetch.disable_cache()
+    dtypes.disable()
+    warehouse.disable()
+    names.set_index(names.PlayerIndex())
+    identity.set_index(identity.IdentityIndex())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--players', type=int, default=200, help='Rows of each NBA stats page')
+    parser.add_argument('--workers', default='1,4,8', help='Comma-separated numbers of workers')
+    parser.add_argument('--rpm', type=float, default=0, help='Requests per minute (0: no rate limit)')
+    parser.add_argument('--max-retries', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to every answer')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of 429 answers')
+    parser.add_argument('--retry-after', type=float, default=0.5, help='Retry-After of the 429 answers')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Fraction of 500/502/503 answers')
+    args = parser.parse_args()
+
+    setup()
+    seasons = list(range(SEASON-args.seasons+1, SEASON+1))
+    pages = site(n_players=args.players)
+
+    server = MockServer(pages, latency=args.latency, rate_429=args.rate_429, retry_after=args.retry_after,
+                        rate_5xx=args.rate_5xx)
+
+    print(f"{'workers':>7} {'time':>8} {'requests':>8} {'200':>5} {'429':>5} {'5xx':>5} {'req/s':>7} {'rows/s':>9}")
+    with server:
+        try:
+            for workers in [int(w) for w in args.workers.split(',')]:
+                elapsed, rows, statuses = run(server, seasons, workers, args.rpm, args.max_retries)
+                requests = sum(statuses.values())
+                errors = sum(n for status, n in statuses.items() if status >= 500)
+                print(f"{workers:7d} {elapsed:7.2f}s {requests:8d} {statuses.get(200, 0):5d} "
+                      f"{statuses.get(429, 0):5d} {errors:5d} {requests/elapsed:7.1f} {rows/elapsed:9.0f}")
+        finally:
+            fetch.configure(base_url=fetch.BASE_URL)
+
+if __name__ == '__main__':
+    main()
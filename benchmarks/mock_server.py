@@ -0,0 +1,194 @@
+"""
+Local stand-in for basketball-reference.com serving fixture pages at the
+real URL paths, with injectable latency, 429 answers (with
+``Retry-After``) and 5xx errors.
+
+    python benchmarks/mock_server.py --port 8000 --latency 0.05 --rate-429 0.1 --rate-5xx 0.02
+
+then point the library at it with ``fetch.configure(base_url='http://127.0.0.1:8000')``
+(or ``BRSCRAPER_BASE_URL=http://127.0.0.1:8000``). Pages come from
+``fixtures.site()``, or from ``--pages`` (laid out by URL path, see
+``fixtures.load_pages``). Any season is answered with the page of the
+fixture season, so bulk crawls over many seasons work too.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import SEASON, load_pages, site
+
+_season_re = re.compile(r'(?<![0-9])(19|20)[0-9]{2}(?![0-9])')
+
+class MockServer:
+    """
+    Threaded HTTP server answering from ``pages`` (URL path -> HTML).
+
+    Parameters
+    ----------
+    pages : dict, optional
+        Pages by URL path. Defaults to ``fixtures.site()``.
+    latency : float, optional
+        Seconds added before every answer.
+    rate_429 : float, optional
+        Fraction of requests answered ``429 Too Many Requests``.
+    retry_after : float, optional
+        ``Retry-After`` seconds sent with the 429 answers.
+    rate_5xx : float, optional
+        Fraction of requests answered with one of ``error_statuses``.
+    error_statuses : tuple of int, optional
+        Statuses of the injected errors (503 is retried by ``fetch``,
+        the others are not).
+    seed : int, optional
+        Seed of the fault injection, for repeatable runs.
+    """
+
+    def __init__(self, pages=None, host='127.0.0.1', port=0, latency=0.0, rate_429=0.0, retry_after=1.0,
+                 rate_5xx=0.0, error_statuses=(500, 502, 503), seed=0):
+
+        self.pages = site() if pages is None else pages
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.rate_5xx = rate_5xx
+        self.error_statuses = error_statuses
+        self.statuses = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+
+        host, port = self._server.server_address[:2]
+
+        return 'http://'+host+':'+str(port)
+
+    def page(self, path):
+        """
+        HTML served for ``path``, ``None`` for a 404.
+        """
+
+        html = self.pages.get(path)
+        if html is None:
+            html = self.pages.get(_season_re.sub(str(SEASON), path))
+
+        return html
+
+    def answer(self, path):
+        """
+        ``(status, headers, body)`` for a request of ``path``.
+        """
+
+        with self._lock:
+            draw = self._random.random()
+            status = None
+            if draw < self.rate_429:
+                status = 429
+            elif draw < self.rate_429+self.rate_5xx:
+                status = self._random.choice(self.error_statuses)
+
+        if status == 429:
+            headers, body = {'Retry-After': str(self.retry_after)}, ''
+        elif status is not None:
+            headers, body = {}, ''
+        else:
+            body = self.page(path)
+            status, headers = (200, {}) if body is not None else (404, {})
+            body = body or ''
+
+        with self._lock:
+            self.statuses[status] += 1
+
+        return status, headers, body
+
+    def _handler(self):
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                status, headers, body = server.answer(urlsplit(self.path).path)
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve(self):
+        """
+        Serve in the current thread until interrupted.
+        """
+
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def __enter__(self):
+
+        return self.start()
+
+    def __exit__(self, *exc):
+
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--pages', help='Directory of recorded pages, laid out by URL path')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every answer')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of 429 answers')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After of the 429 answers')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Fraction of 500/502/503 answers')
+    args = parser.parse_args()
+
+    pages = site()
+    if args.pages:
+        pages.update(load_pages(args.pages))
+
+    server = MockServer(pages, port=args.port, latency=args.latency, rate_429=args.rate_429,
+                        retry_after=args.retry_after, rate_5xx=args.rate_5xx)
+    print('Serving '+str(len(pages))+' pages on '+server.url+' (Ctrl+C to stop)')
+    server.serve()
+
+if __name__ == '__main__':
+    main()
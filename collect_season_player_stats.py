@@ -1,8 +1,11 @@
 from enum import Enum, auto
 import pandas as pd
-from BRScraper import nba
+from BRScraper import nba, fetch, cache
+import csv
+import json
 import logging
-from typing import Optional
+import os
+from typing import Iterator, Optional
 from datetime import datetime
 import sys
 import traceback
@@ -21,6 +24,70 @@ class SeasonType(Enum):
         return "regular season" if self == SeasonType.REGULAR else "playoff"
 
 
+# Columns stored as text in columnar outputs; every other column is numeric
+TEXT_COLUMNS = {'player_id', 'Player', 'Team', 'Tm', 'Pos', 'Awards', 'season_type'}
+PARTITION_COLUMNS = ['season_year', 'season_type']
+# Whole-number stats stored as nullable Int32 in the Parquet dataset; every
+# other numeric column is float64, whatever values one season happens to have,
+# so all partitions share one schema
+COUNTING_COLUMNS = {'Rk', 'Age', 'G', 'GS', 'MP', 'FG', 'FGA', '3P', '3PA', '2P', '2PA', 'FT', 'FTA',
+                    'ORB', 'DRB', 'TRB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS', 'Trp-Dbl'}
+
+
+class CrawlManifest:
+    """
+    Record of the (season, season_type) units of a crawl that are already
+    stored on disk, so an interrupted run can resume where it stopped.
+
+    Each completed unit is written to its own file under ``parts/`` and
+    listed in ``manifest.json`` inside the checkpoint directory. Seasons
+    still in progress are stored too but never count as complete, so every
+    run fetches them again.
+    """
+
+    def __init__(self, checkpoint_dir: str):
+        self.checkpoint_dir = checkpoint_dir
+        self.parts_dir = os.path.join(checkpoint_dir, "parts")
+        self.path = os.path.join(checkpoint_dir, "manifest.json")
+        os.makedirs(self.parts_dir, exist_ok=True)
+
+        self.units = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.units = json.load(f).get("units", {})
+            logging.info(f"Loaded crawl manifest with {len(self.units)} completed units from {self.path}")
+
+    @staticmethod
+    def key(year: int, season_type: SeasonType) -> str:
+        return f"{season_type}:{year}"
+
+    def is_complete(self, year: int, season_type: SeasonType) -> bool:
+        if not cache.season_finished(year):
+            return False
+        unit = self.units.get(self.key(year, season_type))
+        return unit is not None and os.path.exists(os.path.join(self.checkpoint_dir, unit["path"]))
+
+    def save_unit(self, year: int, season_type: SeasonType, df: pd.DataFrame) -> None:
+        """Persist one unit and mark it complete (both writes are atomic)."""
+        relative_path = os.path.join("parts", f"{season_type}_{year}.csv")
+        part_path = os.path.join(self.checkpoint_dir, relative_path)
+        df.to_csv(part_path + ".tmp", index=False)
+        os.replace(part_path + ".tmp", part_path)
+
+        self.units[self.key(year, season_type)] = {
+            "path": relative_path,
+            "rows": len(df),
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(self.path + ".tmp", "w") as f:
+            json.dump({"units": self.units}, f, indent=2, sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+    def load_unit(self, year: int, season_type: SeasonType) -> pd.DataFrame:
+        unit = self.units[self.key(year, season_type)]
+        return pd.read_csv(os.path.join(self.checkpoint_dir, unit["path"]))
+
+
 def setup_logging(log_level: int = logging.DEBUG, logs_dir: str = "logs") -> str:
     """
     Set up logging configuration with both file and console handlers.
@@ -93,8 +160,7 @@ def get_single_season_stats(year: int, season_type: SeasonType) -> Optional[pd.D
     """
     try:
         logging.info(f"Fetching {season_type.display_name} stats for {year}")
-        logging.debug(f"Making API call with parameters: year={
-                      year}, playoffs={season_type == SeasonType.PLAYOFF}")
+        logging.debug(f"Making API call with parameters: year={year}, playoffs={season_type == SeasonType.PLAYOFF}")
 
         df = nba.get_stats(
             season=year,
@@ -104,8 +170,7 @@ def get_single_season_stats(year: int, season_type: SeasonType) -> Optional[pd.D
         )
 
         if df is None or df.empty:
-            logging.warning(f"No data returned for {year} {
-                            season_type.display_name}")
+            logging.warning(f"No data returned for {year} {season_type.display_name}")
             return None
 
         logging.debug(f"Data shape before adding columns: {df.shape}")
@@ -115,8 +180,7 @@ def get_single_season_stats(year: int, season_type: SeasonType) -> Optional[pd.D
         if name_of_col_to_remove in df.columns:
             df.drop(name_of_col_to_remove, axis=1, inplace=True)
         elif season_type == SeasonType.REGULAR:
-            logging.error(f"Error: no 'Awards' column for {year} {
-                season_type.display_name} stats.")
+            logging.error(f"Error: no 'Awards' column for {year} {season_type.display_name} stats.")
         
         name_of_col_to_remove = 'Season'
         if name_of_col_to_remove in df.columns:
@@ -130,15 +194,12 @@ def get_single_season_stats(year: int, season_type: SeasonType) -> Optional[pd.D
         df['season_year'] = year
         df['season_type'] = str(season_type)
 
-        logging.info(f"Successfully fetched {len(df)} records for {
-                     year} {season_type.display_name}")
-        logging.debug(f"Final data shape: {df.shape}, columns: {
-                      df.columns.tolist()}")
+        logging.info(f"Successfully fetched {len(df)} records for {year} {season_type.display_name}")
+        logging.debug(f"Final data shape: {df.shape}, columns: {df.columns.tolist()}")
         return df
 
     except Exception as e:
-        logging.error(f"Error fetching {
-                      season_type.display_name} stats for {year}")
+        logging.error(f"Error fetching {season_type.display_name} stats for {year}")
         logging.error(f"Exception details: {str(e)}")
         logging.debug(f"Traceback: {traceback.format_exc()}")
         return None
@@ -147,7 +208,8 @@ def get_single_season_stats(year: int, season_type: SeasonType) -> Optional[pd.D
 def get_stats_for_years(
     first_year: int,
     last_year: int,
-    season_type: SeasonType
+    season_type: SeasonType,
+    checkpoint_dir: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Fetch stats for multiple seasons.
@@ -156,28 +218,31 @@ def get_stats_for_years(
         first_year (int): Starting year
         last_year (int): Ending year
         season_type (SeasonType): Type of season stats to fetch
+        checkpoint_dir (Optional[str]): If given, every season is stored
+            there as soon as it is fetched and seasons already recorded in
+            its manifest are not fetched again
 
     Returns:
         pd.DataFrame: Combined stats for all seasons
     """
+    if checkpoint_dir is not None:
+        return get_stats_for_years_resumable(first_year, last_year, season_type, checkpoint_dir)
+
     season_dfs = []
 
-    logging.info(f"Starting collection of {season_type.display_name} stats from {
-                 first_year} to {last_year}")
+    logging.info(f"Starting collection of {season_type.display_name} stats from {first_year} to {last_year}")
 
     for year in range(first_year, last_year + 1):
         df = get_single_season_stats(year, season_type)
         if df is not None and not df.empty:
-            logging.debug(f"Adding DataFrame for {
-                          year} to collection. Shape: {df.shape}")
+            logging.debug(f"Adding DataFrame for {year} to collection. Shape: {df.shape}")
             season_dfs.append(df)
         else:
             logging.warning(f"Skipping {year} due to empty or None DataFrame")
 
     # Combine all DataFrames
     if not season_dfs:
-        logging.warning(f"No data was collected for {
-                        season_type.display_name} stats")
+        logging.warning(f"No data was collected for {season_type.display_name} stats")
         return pd.DataFrame()
 
     logging.debug(f"Concatenating {len(season_dfs)} DataFrames")
@@ -187,6 +252,357 @@ def get_stats_for_years(
     return all_stats
 
 
+def iter_season_stats(
+    first_year: int,
+    last_year: int,
+    season_type: SeasonType,
+    checkpoint_dir: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield the stats of each season one at a time.
+
+    With a checkpoint directory, seasons recorded in its manifest are read
+    back from disk instead of fetched, and newly fetched seasons are
+    persisted before being yielded.
+
+    Args:
+        first_year (int): Starting year
+        last_year (int): Ending year
+        season_type (SeasonType): Type of season stats to fetch
+        checkpoint_dir (Optional[str]): Directory holding the manifest and the parts
+
+    Yields:
+        pd.DataFrame: Stats of one season
+    """
+    manifest = CrawlManifest(checkpoint_dir) if checkpoint_dir is not None else None
+    years = range(first_year, last_year + 1)
+
+    if manifest is not None:
+        done = sum(manifest.is_complete(year, season_type) for year in years)
+        logging.info(f"{done} of {len(years)} {season_type.display_name} "
+                     f"seasons already collected, fetching {len(years) - done}")
+
+    for year in years:
+        if manifest is not None and manifest.is_complete(year, season_type):
+            yield manifest.load_unit(year, season_type)
+            continue
+
+        df = get_single_season_stats(year, season_type)
+        if df is None or df.empty:
+            logging.warning(f"Skipping {year} due to empty or None DataFrame")
+            continue
+
+        if manifest is not None:
+            manifest.save_unit(year, season_type, df)
+            logging.debug(f"Checkpointed {year} {season_type.display_name}. Shape: {df.shape}")
+        yield df
+
+
+def get_stats_for_years_resumable(
+    first_year: int,
+    last_year: int,
+    season_type: SeasonType,
+    checkpoint_dir: str
+) -> pd.DataFrame:
+    """
+    Checkpointed version of get_stats_for_years: completed seasons are
+    skipped, new ones are persisted one by one and the result is assembled
+    from the stored parts.
+
+    Args:
+        first_year (int): Starting year
+        last_year (int): Ending year
+        season_type (SeasonType): Type of season stats to fetch
+        checkpoint_dir (str): Directory holding the manifest and the parts
+
+    Returns:
+        pd.DataFrame: Combined stats for all seasons
+    """
+    season_dfs = list(iter_season_stats(first_year, last_year, season_type, checkpoint_dir))
+
+    if not season_dfs:
+        logging.warning(f"No data was collected for {season_type.display_name} stats")
+        return pd.DataFrame()
+
+    all_stats = pd.concat(season_dfs, ignore_index=True)
+    logging.info(f"Assembled {len(all_stats)} total records from {len(season_dfs)} stored seasons")
+    return all_stats
+
+
+class StreamingStatsWriter:
+    """
+    Append season DataFrames to a single CSV or Parquet file as soon as
+    they are fetched, so memory stays bounded by one season.
+
+    Columns that only appear in later seasons are added at the end of the
+    schema; on close the output is rewritten once, a row group (or line)
+    at a time, so earlier rows get the new columns as empty values.
+    """
+
+    INTEGER_COLUMNS = {'season_year'}
+
+    def __init__(self, path: str, file_format: str = "csv"):
+        if file_format not in ("csv", "parquet"):
+            raise ValueError(f"{file_format} is not a valid format. Try one of: \"csv\", \"parquet\".")
+
+        self.path = path
+        self.file_format = file_format
+        self.columns = []
+        self.rows = 0
+        self._segments = []      # parquet files, one per schema
+        self._writer = None
+        self._grew = False
+        self._tmp_path = path + ".tmp"
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _update_columns(self, df: pd.DataFrame) -> bool:
+        new_columns = [column for column in df.columns if column not in self.columns]
+        self.columns += new_columns
+        return bool(new_columns) and self.rows > 0
+
+    def _arrow_schema(self):
+        import pyarrow as pa
+
+        def arrow_type(column):
+            if column in TEXT_COLUMNS:
+                return pa.string()
+            if column in self.INTEGER_COLUMNS:
+                return pa.int64()
+            return pa.float64()
+
+        return pa.schema([(column, arrow_type(column)) for column in self.columns])
+
+    def _to_arrow(self, df: pd.DataFrame, schema):
+        import pyarrow as pa
+
+        df = df.reindex(columns=schema.names)
+        arrays = []
+        for field in schema:
+            values = df[field.name]
+            if pa.types.is_string(field.type):
+                values = values.astype("string")
+            else:
+                values = pd.to_numeric(values, errors="coerce")
+            arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append one season; the frame can be dropped right after."""
+        grew = self._update_columns(df)
+        self._grew = self._grew or grew
+
+        if self.file_format == "csv":
+            df.reindex(columns=self.columns).to_csv(
+                self._tmp_path, mode="a", header=(self.rows == 0), index=False)
+        else:
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+            if self._writer is None or grew:
+                if self._writer is not None:
+                    self._writer.close()
+                segment = f"{self._tmp_path}.{len(self._segments)}"
+                self._segments.append(segment)
+                self._writer = pq.ParquetWriter(segment, self._arrow_schema(), compression="zstd")
+            # One row group per season
+            self._writer.write_table(self._to_arrow(df, self._writer.schema))
+
+        self.rows += len(df)
+        logging.debug(f"Streamed {len(df)} rows to {self.path} ({self.rows} total)")
+
+    def _finish_csv(self) -> None:
+        if not self._grew:
+            os.replace(self._tmp_path, self.path)
+            return
+
+        # Rewrite once with the full header, padding the older, shorter rows
+        with open(self._tmp_path, newline="") as src, open(self.path, "w", newline="") as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader)
+            writer.writerow(self.columns)
+            for row in reader:
+                writer.writerow(row + [""] * (len(self.columns) - len(row)))
+        os.remove(self._tmp_path)
+
+    def _finish_parquet(self) -> None:
+        import pyarrow.parquet as pq
+
+        self._writer.close()
+        self._writer = None
+
+        if len(self._segments) == 1:
+            os.replace(self._segments[0], self.path)
+            return
+
+        # Merge the segments row group by row group under the final schema
+        schema = self._arrow_schema()
+        with pq.ParquetWriter(self.path, schema, compression="zstd") as writer:
+            for segment in self._segments:
+                parquet_file = pq.ParquetFile(segment)
+                for i in range(parquet_file.num_row_groups):
+                    table = parquet_file.read_row_group(i).to_pandas()
+                    writer.write_table(self._to_arrow(table, schema))
+                os.remove(segment)
+
+    def close(self) -> None:
+        if self.rows == 0:
+            return
+        if self.file_format == "csv":
+            if os.path.exists(self._tmp_path):
+                self._finish_csv()
+        elif self._writer is not None:
+            self._finish_parquet()
+        logging.info(f"Successfully streamed {self.rows} records to {self.path}")
+
+
+def stream_stats_for_years(
+    first_year: int,
+    last_year: int,
+    season_type: SeasonType,
+    path: str,
+    file_format: str = "csv",
+    checkpoint_dir: Optional[str] = None
+) -> int:
+    """
+    Fetch stats for multiple seasons, appending each season to the output
+    file as soon as it is available instead of concatenating them all.
+
+    Args:
+        first_year (int): Starting year
+        last_year (int): Ending year
+        season_type (SeasonType): Type of season stats to fetch
+        path (str): Output file
+        file_format (str): "csv", "parquet" or "parquet-dataset" (path is
+            then the dataset root and each season is its own partition)
+        checkpoint_dir (Optional[str]): Directory for resumable crawl checkpoints
+
+    Returns:
+        int: Number of records written
+    """
+    if file_format == "parquet-dataset":
+        rows = 0
+        for df in iter_season_stats(first_year, last_year, season_type, checkpoint_dir):
+            save_stats_to_parquet_dataset(df, path)
+            rows += len(df)
+            del df
+        return rows
+
+    with StreamingStatsWriter(path, file_format) as writer:
+        for df in iter_season_stats(first_year, last_year, season_type, checkpoint_dir):
+            writer.write(df)
+            del df
+    return writer.rows
+
+
+def to_columnar_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give a stats DataFrame proper columnar dtypes: text columns as strings,
+    counting stats (COUNTING_COLUMNS) as nullable Int32 and the remaining
+    stats as float64. The dtype depends only on the column name, so every
+    season gets the same schema.
+
+    Args:
+        df (pd.DataFrame): Stats as returned by get_single_season_stats
+
+    Returns:
+        pd.DataFrame: Copy of the frame with converted dtypes
+    """
+    df = df.copy()
+    for column in df.columns:
+        if column in TEXT_COLUMNS:
+            df[column] = df[column].astype("string")
+        elif column == 'season_year':
+            df[column] = df[column].astype("int16")
+        else:
+            values = pd.to_numeric(df[column], errors="coerce")
+            if column in COUNTING_COLUMNS:
+                df[column] = values.round().astype("Int32")
+            else:
+                df[column] = values.astype("float64")
+    return df
+
+
+def save_stats_to_parquet_dataset(
+    df: pd.DataFrame,
+    output_dir: str = os.path.join("nba_stats_output", "player_stats")
+) -> None:
+    """
+    Write stats to a Parquet dataset partitioned by season_year/season_type
+    (hive layout, zstd compressed). Partitions present in df replace the
+    ones already on disk, so the dataset can be updated season by season.
+
+    Args:
+        df (pd.DataFrame): Stats with season_year and season_type columns
+        output_dir (str): Root directory of the dataset
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+    # Write errors propagate: a missing or partial dataset must not look like success
+    table = pa.Table.from_pandas(to_columnar_dtypes(df), preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=output_dir,
+        partition_cols=PARTITION_COLUMNS,
+        compression="zstd",
+        existing_data_behavior="delete_matching",
+    )
+    logging.info(f"Successfully saved {len(df)} records to dataset {output_dir}")
+
+
+def load_stats_dataset(
+    output_dir: str = os.path.join("nba_stats_output", "player_stats"),
+    seasons: Optional[list] = None,
+    season_type: Optional[SeasonType] = None,
+    columns: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Read back a dataset written by save_stats_to_parquet_dataset. Only the
+    partitions of the requested seasons/season type and the requested
+    columns are read.
+
+    Args:
+        output_dir (str): Root directory of the dataset
+        seasons (Optional[list]): Season years to load (default: all)
+        season_type (Optional[SeasonType]): Season type to load (default: all)
+        columns (Optional[list]): Columns to load (default: all)
+
+    Returns:
+        pd.DataFrame: The selected stats
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(output_dir, format="parquet", partitioning="hive")
+    # Seasons may have different columns (e.g. no GS before 1982)
+    schema = pa.unify_schemas([fragment.physical_schema for fragment in dataset.get_fragments()]
+                              + [dataset.partitioning.schema])
+    dataset = ds.dataset(output_dir, format="parquet", partitioning="hive", schema=schema)
+
+    condition = None
+    if seasons is not None:
+        condition = ds.field('season_year').isin(list(seasons))
+    if season_type is not None:
+        season_condition = ds.field('season_type') == str(season_type)
+        condition = season_condition if condition is None else condition & season_condition
+
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
 def save_stats_to_csv(
     df: pd.DataFrame,
     filename: str,
@@ -203,8 +619,7 @@ def save_stats_to_csv(
     import os
 
     try:
-        logging.debug(f"Attempting to save DataFrame with shape {
-                      df.shape} to {filename}")
+        logging.debug(f"Attempting to save DataFrame with shape {df.shape} to {filename}")
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -221,7 +636,14 @@ def save_stats_to_csv(
         logging.debug(f"Traceback: {traceback.format_exc()}")
 
 
-def main(first_year: int, last_year: int, season_type: SeasonType):
+def main(
+    first_year: int,
+    last_year: int,
+    season_type: SeasonType,
+    checkpoint_dir: Optional[str] = None,
+    stream: bool = False,
+    output_format: str = "csv"
+):
     """
     Main function to run the NBA stats scraper.
 
@@ -229,19 +651,44 @@ def main(first_year: int, last_year: int, season_type: SeasonType):
         first_year (int): Starting year for data collection
         last_year (int): Ending year for data collection
         season_type (SeasonType): Type of season stats to collect
+        checkpoint_dir (Optional[str]): Directory for resumable crawl
+            checkpoints (None disables checkpointing)
+        stream (bool): Append each season to the output file as it is
+            fetched instead of holding every season in memory
+        output_format (str): "csv", "parquet" or "parquet-dataset"
+            (partitioned by season_year/season_type)
     """
-    logging.info(f"Starting NBA stats collection: years {
-                 first_year}-{last_year}, type: {season_type.display_name}")
+    logging.info(f"Starting NBA stats collection: years {first_year}-{last_year}, type: {season_type.display_name}")
+
+    if stream:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if output_format == "parquet-dataset":
+            path = os.path.join("nba_stats_output", "player_stats")
+        else:
+            path = os.path.join("nba_stats_output", f"{str(season_type)}_stats_{timestamp}.{output_format}")
+        rows = stream_stats_for_years(first_year, last_year, season_type, path,
+                                      file_format=output_format, checkpoint_dir=checkpoint_dir)
+        if rows == 0:
+            logging.warning("No data to save - no season was collected")
+        return
 
     # Get stats
     stats_df = get_stats_for_years(
         first_year=first_year,
         last_year=last_year,
-        season_type=season_type
+        season_type=season_type,
+        checkpoint_dir=checkpoint_dir
     )
 
     # Save results
-    if not stats_df.empty:
+    if not stats_df.empty and output_format == "parquet-dataset":
+        save_stats_to_parquet_dataset(stats_df)
+    elif not stats_df.empty and output_format == "parquet":
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join("nba_stats_output", f"{str(season_type)}_stats_{timestamp}.parquet")
+        with StreamingStatsWriter(path, "parquet") as writer:
+            writer.write(stats_df)
+    elif not stats_df.empty:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{str(season_type)}_stats_{timestamp}.csv"
         save_stats_to_csv(stats_df, filename)
@@ -264,6 +711,37 @@ if __name__ == "__main__":
         default=SeasonType.REGULAR.name,
         help='Type of season stats to collect'
     )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Directory for the on-disk page cache (default: ~/.cache/BRScraper)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always download pages instead of using the on-disk cache'
+    )
+    parser.add_argument(
+        '--checkpoint-dir',
+        type=str,
+        default=None,
+        help='Directory where completed seasons are stored so interrupted runs can resume '
+             '(e.g. nba_stats_output/checkpoints; default: no checkpoints)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write each season to the output file as soon as it is fetched (bounded memory)'
+    )
+    parser.add_argument(
+        '--output-format',
+        type=str,
+        choices=['csv', 'parquet', 'parquet-dataset'],
+        default='csv',
+        help='Output format: one CSV file, one Parquet file or a Parquet dataset '
+             'partitioned by season_year/season_type'
+    )
     parser.add_argument(
         '--log-level',
         type=str,
@@ -277,11 +755,19 @@ if __name__ == "__main__":
     # Setup logging before anything else
     setup_logging(log_level=getattr(logging, args.log_level))
 
+    # Finished seasons are served from disk on reruns
+    if not args.no_cache:
+        page_cache = fetch.enable_cache(args.cache_dir)
+        logging.info(f"Using page cache at {page_cache.directory}")
+
     try:
         main(
             args.first_year,
             args.last_year,
-            SeasonType[args.season_type]
+            SeasonType[args.season_type],
+            checkpoint_dir=args.checkpoint_dir,
+            stream=args.stream,
+            output_format=args.output_format
         )
     except Exception as e:
         logging.critical(f"Unhandled exception in main execution")
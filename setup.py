@@ -20,7 +20,9 @@ setuptools.setup(
             install_requires=['pandas>=1.5.3',
                               'numpy>=1.24.4',
                               'python-dateutil>=2.8.2',
-                              'pytz>=2023.3'
+                              'pytz>=2023.3',
+                              'requests>=2.28.0',
+                              'lxml>=4.9.0'
                               ],
             classifiers=[
                 "Programming Language :: Python :: 3",
@@ -0,0 +1,36 @@
+import asyncio
+import time
+import unittest
+
+from BRScraper import aio, nba
+
+
+def slow_double(x, delay=0.2):
+    time.sleep(delay)
+    return 2*x
+
+
+class TestAio(unittest.TestCase):
+    def test_asyncify_keeps_result_and_name(self):
+        adouble = aio.asyncify(slow_double)
+        self.assertEqual(adouble.__name__, 'aslow_double')
+        self.assertEqual(asyncio.run(adouble(4, delay=0)), 8)
+
+    def test_calls_overlap(self):
+        """Awaited calls run concurrently on the shared executor."""
+        adouble = aio.asyncify(slow_double)
+
+        async def main():
+            return await asyncio.gather(*(adouble(i) for i in range(4)))
+
+        start = time.monotonic()
+        self.assertEqual(asyncio.run(main()), [0, 2, 4, 6])
+        self.assertLess(time.monotonic()-start, 0.6)
+
+    def test_nba_exposes_async_getters(self):
+        self.assertTrue(asyncio.iscoroutinefunction(nba.aget_stats))
+        self.assertIs(nba.aget_stats.__wrapped__, nba.get_stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
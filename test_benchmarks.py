@@ -0,0 +1,48 @@
+import unittest
+
+from BRScraper import dtypes, fetch, identity, names, warehouse
+from benchmarks import bench_getters
+from benchmarks.fixtures import site
+
+
+class TestGetterBenchmark(unittest.TestCase):
+    def test_every_getter_replays_offline(self):
+        pages = site(n_players=40, league_players=20)
+        results = bench_getters.run(pages, repeat=1, memory=False)
+
+        self.assertEqual(len(results), len(bench_getters.cases(pages)))
+        for label, result in results.items():
+            self.assertGreater(result['rows'], 0, label)
+
+        result = bench_getters.run(pages, repeat=1, match='nba.get_standings')['nba.get_standings']
+        self.assertGreater(result['peak_mb'], 0)
+
+    def test_state_is_restored(self):
+        session, limiter, index = object(), fetch.get_rate_limiter(), names.get_index()
+        fetch.set_session(session)
+        store = warehouse.enable(':memory:')
+        dtypes.enable()
+        try:
+            bench_getters.run(site(n_players=10, league_players=10), repeat=1, match='nba.get_standings', memory=False)
+
+            self.assertIs(fetch.set_session(None), session)
+            self.assertIs(fetch.get_rate_limiter(), limiter)
+            self.assertIs(warehouse.get_store(), store)
+            self.assertIs(names.get_index(), index)
+            self.assertTrue(dtypes.enabled())
+            self.assertIsNone(fetch.get_cache())
+        finally:
+            dtypes.disable()
+            warehouse.disable()
+            fetch.set_session(None)
+
+    def test_regressions(self):
+        baseline = {'a': {'ms': 10.0, 'peak_mb': 1.0}, 'b': {'ms': 0.2, 'peak_mb': 1.0}}
+        results = {'a': {'ms': 20.0, 'peak_mb': 1.1}, 'b': {'ms': 0.6, 'peak_mb': 2.0}, 'c': {'ms': 5.0, 'peak_mb': 1.0}}
+
+        self.assertEqual(bench_getters.regressions(results, baseline, 0.25),
+                         [('a', 'ms', 10.0, 20.0), ('b', 'peak_mb', 1.0, 2.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from BRScraper import dtypes, fetch, metrics, nba
+from test_fetch import FakeResponse, FakeSession
+
+
+class TestStatsBulk(unittest.TestCase):
+    def setUp(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def fake_get_stats(self, season, info='per_game', playoffs=False, rename=False):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        if season == 1950:
+            raise ValueError('An error occurred while fetching data for season 1950')
+        return pd.DataFrame({'player_id': ['a01', 'b01'], 'PTS': [season, playoffs],
+                             'Season': str(season-1)+'-'+str(season)[-2:]})
+
+    def test_stacks_every_unit_in_order(self):
+        with mock.patch.object(nba, '_get_stats', side_effect=self.fake_get_stats):
+            df = nba.get_stats_bulk([2023, 2024], ['totals', 'advanced'], playoffs=(False, True), max_workers=2)
+
+        self.assertEqual(len(df), 2*2*2*2)
+        self.assertLessEqual(self.peak, 2)
+        self.assertEqual(df['Season'].dtype, 'category')
+        self.assertEqual(df['Season'].cat.categories.tolist(), ['2022-23', '2023-24'])
+        self.assertEqual(df['info'].cat.categories.tolist(), ['totals', 'advanced'])
+        self.assertEqual(df.iloc[::2][['Season', 'info', 'Playoffs']].astype(str).values.tolist()[:3],
+                         [['2022-23', 'totals', 'False'], ['2022-23', 'advanced', 'False'],
+                          ['2023-24', 'totals', 'False']])
+
+    def test_errors(self):
+        with mock.patch.object(nba, '_get_stats', side_effect=self.fake_get_stats):
+            with self.assertRaises(ValueError):
+                nba.get_stats_bulk([1950, 2024], 'totals')
+            with self.assertWarns(UserWarning):
+                df = nba.get_stats_bulk([1950, 2024], 'totals', errors='warn')
+        self.assertEqual(df['Season'].unique().tolist(), ['2023-24'])
+
+    def test_invalid_info(self):
+        with self.assertRaises(ValueError):
+            nba.get_stats_bulk([2024], ['per_minute'])
+
+
+class TestStatsWide(unittest.TestCase):
+    def fake_get_stats(self, season, info='per_game', playoffs=False, rename=False):
+        pts = {'per_game': [20.0, 10.0, 10.0, 5.0], 'totals': [1200, 600, 600, 400]}
+        if info == 'advanced':
+            return pd.DataFrame({'player_id': ['c01', 'a01', 'a01', 'a01'], 'Team': ['BOS', '2TM', 'BOS', 'LAL'],
+                                 'Pos': ['C', 'SG', 'SG', 'SG'], 'G': [80, 60, 30, 30], 'PER': [15.0, 20.0, 19.0, 21.0],
+                                 'Season': '2022-23'})
+        return pd.DataFrame({'player_id': ['a01', 'a01', 'a01', 'b01'], 'Team': ['2TM', 'BOS', 'LAL', 'LAL'],
+                             'Pos': ['SG', 'SG', 'SG', 'PF'], 'G': [60, 30, 30, 82], 'PTS': pts[info],
+                             'Season': '2022-23'})
+
+    def test_join_without_duplicated_columns(self):
+        with mock.patch.object(nba, '_get_stats', side_effect=self.fake_get_stats):
+            df = nba.get_stats_wide(2023, ['per_game', 'totals', 'advanced'])
+
+        self.assertEqual(df.columns.tolist(), ['player_id', 'Team', 'Pos', 'G', 'PTS_per_game', 'PTS_totals',
+                                               'PER_advanced', 'Season'])
+        self.assertEqual(df[['player_id', 'Team']].values.tolist(),
+                         [['a01', '2TM'], ['a01', 'BOS'], ['a01', 'LAL'], ['b01', 'LAL'], ['c01', 'BOS']])
+        self.assertEqual(df['PTS_totals'].tolist()[:4], [1200, 600, 600, 400])
+        self.assertEqual(df['PER_advanced'].tolist()[:3], [20.0, 19.0, 21.0])
+        self.assertEqual(df['Pos'].tolist(), ['SG', 'SG', 'SG', 'PF', 'C'])
+
+    def test_traded_rows(self):
+        with mock.patch.object(nba, '_get_stats', side_effect=self.fake_get_stats):
+            combined = nba.get_stats_wide(2023, ['per_game', 'advanced'], traded='combined')
+            teams = nba.get_stats_wide(2023, ['per_game', 'advanced'], traded='teams')
+
+        self.assertEqual(combined['Team'].tolist(), ['2TM', 'LAL', 'BOS'])
+        self.assertEqual(teams[['player_id', 'Team']].values.tolist()[:2], [['a01', 'BOS'], ['a01', 'LAL']])
+        self.assertNotIn('2TM', teams['Team'].tolist())
+
+    def test_invalid_infos(self):
+        for infos in [[], ['per_minute']]:
+            with self.assertRaises(ValueError):
+                nba.get_stats_wide(2023, infos)
+
+
+def career_page(seasons):
+    rows = ''.join('<tr><th data-stat="year_id">'+s+'</th><td>'+team+'</td><td>'+str(pts)+'</td></tr>'
+                   for s, team, pts in seasons)
+    return ('<html><body><div id="div_totals"><table id="totals">'
+            '<thead><tr><th>Season</th><th>Team</th><th>PTS</th></tr></thead>'
+            '<tbody>'+rows+'</tbody><tfoot><tr><th>Career</th><td></td><td>0</td></tr></tfoot>'
+            '</table></div></body></html>')
+
+
+class TestPlayerStatsBulk(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        url = 'https://www.basketball-reference.com/players/{}/{}.html'
+        self.session = FakeSession({
+            url.format('a', 'aaaa01'): FakeResponse(career_page([('2021-22', 'BOS', 100), ('2022-23', '2TM', 50)])),
+            url.format('b', 'bbbb01'): FakeResponse(career_page([('2022-23', 'LAL', 7)])),
+            url.format('c', 'cccc01'): FakeResponse('Not found', status_code=404),
+        })
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_long_frame_keyed_by_player(self):
+        df = nba.get_player_stats_bulk(['aaaa01', 'bbbb01', 'aaaa01', None], max_workers=2)
+
+        self.assertEqual(df.columns.tolist(), ['player_id', 'Season', 'Team', 'PTS'])
+        self.assertEqual(df['player_id'].tolist(), ['aaaa01', 'aaaa01', 'bbbb01'])
+        self.assertEqual(df['PTS'].tolist(), [100, 50, 7])
+        self.assertEqual(len(self.session.calls), 2)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            nba.get_player_stats_bulk(['aaaa01', 'cccc01'])
+        with self.assertWarns(UserWarning):
+            df = nba.get_player_stats_bulk(['cccc01', 'bbbb01'], errors='warn')
+        self.assertEqual(df['player_id'].unique().tolist(), ['bbbb01'])
+
+    def test_one_metrics_call_and_one_compaction(self):
+        calls = []
+        metrics.add_hook(calls.append)
+        dtypes.enable()
+        try:
+            with mock.patch.object(dtypes, 'compact', wraps=dtypes.compact) as compact:
+                nba.get_player_stats_bulk(['aaaa01', 'bbbb01'], max_workers=2)
+        finally:
+            dtypes.disable()
+            metrics.clear_hooks()
+
+        self.assertEqual(compact.call_count, 1)
+        self.assertEqual([call.getter for call in calls], ['nba.get_player_stats_bulk'])
+        self.assertEqual(calls[0].requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
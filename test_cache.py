@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from datetime import date
+
+from BRScraper import cache, fetch
+from test_fetch import FakeResponse, FakeSession
+
+BASE = 'https://www.basketball-reference.com/'
+
+
+class ConditionalSession(FakeSession):
+    """Answers 304 whenever the request carries a validator."""
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        if kwargs.get('headers'):
+            return FakeResponse('', 304)
+        return self.responses[url]
+
+
+class TestTTL(unittest.TestCase):
+    def test_finished_season_is_kept_forever(self):
+        self.assertIsNone(cache.ttl_for(BASE+'leagues/NBA_1985_per_game.html'))
+        self.assertIsNone(cache.ttl_for(BASE+'draft/NBA_2010.html'))
+        self.assertIsNone(cache.ttl_for(BASE+'international/euroleague/2019_totals.html'))
+
+    def test_current_season_expires(self):
+        today = date(2024, 3, 1)
+        self.assertEqual(cache.ttl_for(BASE+'leagues/NBA_2024_totals.html', today), cache.CURRENT_SEASON_TTL)
+        self.assertIsNone(cache.ttl_for(BASE+'leagues/NBA_2023_totals.html', today))
+
+    def test_live_pages(self):
+        self.assertEqual(cache.ttl_for(BASE+'contracts/players.html'), 6*cache.HOUR)
+        self.assertEqual(cache.ttl_for(BASE+'friv/playoff_prob.html'), 6*cache.HOUR)
+        self.assertEqual(cache.ttl_for(BASE+'friv/birthdays.fcgi?month=1&day=2'), cache.DAY)
+        self.assertEqual(cache.ttl_for(BASE+'awards/mvp.html'), cache.DEFAULT_TTL)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.cache = fetch.enable_cache(self.dir.name)
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.disable_cache()
+        fetch.set_session(None)
+        fetch.clear_memo()
+        self.dir.cleanup()
+
+    def test_fresh_entry_skips_network(self):
+        url = BASE+'leagues/NBA_1985_per_game.html'
+        session = FakeSession({url: FakeResponse('<p>1985</p>')})
+        fetch.set_session(session)
+
+        self.assertEqual(fetch.get_html(url), '<p>1985</p>')
+        self.assertEqual(fetch.get_html(url), '<p>1985</p>')
+        self.assertEqual(len(session.calls), 1)
+
+    def test_stale_entry_is_revalidated(self):
+        url = BASE+'contracts/players.html'
+        session = ConditionalSession({url: FakeResponse('<p>salaries</p>', headers={'ETag': '"v1"'})})
+        fetch.set_session(session)
+
+        fetch.get_html(url)
+        entry = self.cache.load(url)
+        self.assertEqual(entry['etag'], '"v1"')
+
+        # Age the entry past its TTL
+        entry.pop('body')
+        entry['stored_at'] -= 7*cache.HOUR
+        self.cache._write(self.cache._path(url, '.json'), cache.json.dumps(entry))
+
+        self.assertEqual(fetch.get_html(url), '<p>salaries</p>')
+        self.assertEqual(session.calls[-1][1]['headers'], {'If-None-Match': '"v1"'})
+        self.assertTrue(self.cache.is_fresh(self.cache.load(url)))
+
+
+if __name__ == '__main__':
+    unittest.main()
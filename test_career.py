@@ -0,0 +1,58 @@
+import unittest
+
+import pandas as pd
+
+from BRScraper import career, warehouse
+
+
+def totals():
+    return pd.DataFrame({
+        'player_id': ['a01', 'a01', 'a01', 'a01', 'b01'],
+        'Team': ['BOS', '2TM', 'BOS', 'LAL', 'LAL'],
+        'G': [80, 60, 30, 30, 10], 'MP': [2000, 1200, 600, 600, 100],
+        'FG': [400, 240, 120, 120, 20], 'FGA': [800, 500, 250, 250, 40], '3P': [50, 20, 10, 10, 0],
+        'PTS': [1000, 600, 300, 300, 50],
+        'Season': ['2021-22', '2022-23', '2022-23', '2022-23', '2022-23'],
+    })
+
+
+class TestCareer(unittest.TestCase):
+    def test_traded_seasons_counted_once(self):
+        rows = career.season_rows(totals())
+        self.assertEqual(rows['Team'].tolist(), ['BOS', '2TM', 'LAL'])
+
+        df = career.career_totals(totals()).set_index('player_id')
+        self.assertEqual(df.loc['a01', ['From', 'To', 'Seasons', 'Teams', 'G', 'PTS']].tolist(),
+                         [2022, 2023, 2, 2, 140, 1600])
+        self.assertAlmostEqual(df.loc['a01', 'FG%'], 640/1300)
+        self.assertAlmostEqual(df.loc['a01', 'eFG%'], (640+35)/1300)
+
+    def test_per_game_and_per_36(self):
+        per_game = career.get_career_stats(totals(), 'per_game').set_index('player_id')
+        per_36 = career.get_career_stats(totals(), 'per_36').set_index('player_id')
+
+        self.assertEqual(per_game.loc['a01', 'G'], 140)
+        self.assertAlmostEqual(per_game.loc['a01', 'PTS'], 1600/140)
+        self.assertEqual(per_36.loc['a01', 'MP'], 3200)
+        self.assertAlmostEqual(per_36.loc['b01', 'PTS'], 18.0)
+
+    def test_from_warehouse(self):
+        warehouse.enable(':memory:')
+        try:
+            for label, season in [('2021-22', 2022), ('2022-23', 2023)]:
+                df = totals()
+                warehouse.record('stats_totals', df[df['Season'] == label].drop(columns=['Season']),
+                                 season=season, playoffs=False)
+            df = career.get_career_stats().set_index('player_id')
+        finally:
+            warehouse.disable()
+
+        self.assertEqual(df.loc['a01', ['Seasons', 'PTS']].tolist(), [2, 1600])
+
+    def test_invalid_info(self):
+        with self.assertRaises(ValueError):
+            career.get_career_stats(totals(), 'per_100')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import logging
+import os
+import runpy
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import collect_season_player_stats as collect
+from BRScraper import fetch
+from collect_season_player_stats import CrawlManifest, SeasonType, StreamingStatsWriter
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def season_frame(year, extra=None):
+    df = pd.DataFrame({'Player': ['Player A', 'Player B'], 'Team': ['BOS', 'LAL'], 'G': [70, 82],
+                       'PTS': [1500, 1200], 'FG%': [0.5, 0.45]})
+    if extra:
+        df = df.assign(**extra)
+    df['season_year'] = year
+    df['season_type'] = str(SeasonType.REGULAR)
+    return df
+
+
+class TestCrawlManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = os.path.join(self.tmp.name, 'checkpoints')
+
+    def test_resume(self):
+        CrawlManifest(self.directory).save_unit(2010, SeasonType.REGULAR, season_frame(2010))
+
+        manifest = CrawlManifest(self.directory)
+        self.assertTrue(manifest.is_complete(2010, SeasonType.REGULAR))
+        self.assertFalse(manifest.is_complete(2010, SeasonType.PLAYOFF))
+        self.assertFalse(manifest.is_complete(2011, SeasonType.REGULAR))
+        pd.testing.assert_frame_equal(manifest.load_unit(2010, SeasonType.REGULAR), season_frame(2010))
+
+    def test_unfinished_season_is_never_complete(self):
+        manifest = CrawlManifest(self.directory)
+        with mock.patch.object(collect.cache, 'season_finished', return_value=False):
+            manifest.save_unit(2010, SeasonType.REGULAR, season_frame(2010))
+            self.assertFalse(manifest.is_complete(2010, SeasonType.REGULAR))
+
+    def test_iter_skips_stored_seasons(self):
+        CrawlManifest(self.directory).save_unit(2010, SeasonType.REGULAR, season_frame(2010))
+
+        with mock.patch.object(collect, 'get_single_season_stats', side_effect=lambda year, _: season_frame(year)) as get:
+            df = collect.get_stats_for_years(2010, 2012, SeasonType.REGULAR, checkpoint_dir=self.directory)
+
+        self.assertEqual([call.args[0] for call in get.call_args_list], [2011, 2012])
+        self.assertEqual(df['season_year'].tolist(), [2010, 2010, 2011, 2011, 2012, 2012])
+        self.assertTrue(CrawlManifest(self.directory).is_complete(2012, SeasonType.REGULAR))
+
+
+class TestScript(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        self.addCleanup(setattr, logging.root, 'handlers', logging.root.handlers[:])
+        self.addCleanup(logging.root.setLevel, logging.root.level)
+        self.addCleanup(fetch.disable_cache)
+        os.chdir(self.tmp.name)
+
+    def run_script(self, *args):
+        argv = ['collect_season_player_stats.py', '--first-year', '2000', '--last-year', '2001',
+                '--cache-dir', 'page_cache', '--log-level', 'WARNING', *args]
+        stats = lambda season, **kwargs: season_frame(season).drop(columns=['season_year', 'season_type'])
+        with mock.patch.object(sys, 'argv', argv), mock.patch('BRScraper.nba.get_stats', side_effect=stats) as get:
+            runpy.run_path(collect.__file__, run_name='__main__')
+        return get
+
+    def test_checkpoints_with_page_cache(self):
+        get = self.run_script('--checkpoint-dir', 'ck')
+        self.assertEqual(get.call_count, 2)
+        self.assertTrue(CrawlManifest('ck').is_complete(2001, SeasonType.REGULAR))
+        self.assertIsNotNone(fetch.get_cache())
+
+        get = self.run_script('--checkpoint-dir', 'ck')
+        self.assertEqual(get.call_count, 0)
+        self.assertTrue(os.listdir('nba_stats_output'))
+
+
+class TestStreamingStatsWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, path, file_format):
+        with StreamingStatsWriter(path, file_format) as writer:
+            writer.write(season_frame(1980))
+            writer.write(season_frame(1982, {'GS': [60, 82]}))
+        return writer
+
+    def test_csv_pads_older_rows(self):
+        path = os.path.join(self.tmp.name, 'stats.csv')
+        writer = self.write(path, 'csv')
+
+        df = pd.read_csv(path)
+        self.assertEqual(writer.rows, 4)
+        self.assertEqual(df.columns[-1], 'GS')
+        self.assertEqual(df['GS'].isna().tolist(), [True, True, False, False])
+        self.assertEqual(df['season_year'].tolist(), [1980, 1980, 1982, 1982])
+        self.assertFalse(os.path.exists(path+'.tmp'))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_merges_schemas(self):
+        path = os.path.join(self.tmp.name, 'stats.parquet')
+        self.write(path, 'parquet')
+
+        df = pd.read_parquet(path)
+        self.assertEqual(df['GS'].isna().tolist(), [True, True, False, False])
+        self.assertEqual(df['PTS'].tolist(), [1500, 1200, 1500, 1200])
+        self.assertEqual(os.listdir(self.tmp.name), ['stats.parquet'])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            StreamingStatsWriter(os.path.join(self.tmp.name, 'stats.json'), 'json')
+
+
+class TestParquetDataset(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_dtypes_depend_on_column_only(self):
+        # Whole-number percentages and an all-missing GS must not change the schema
+        old = collect.to_columnar_dtypes(season_frame(1980, {'FG%': [0.0, 1.0], 'GS': [None, None]}))
+        new = collect.to_columnar_dtypes(season_frame(2020, {'GS': [60, 82]}))
+
+        self.assertEqual(old.dtypes.to_dict(), new.dtypes.to_dict())
+        self.assertEqual(str(new['G'].dtype), 'Int32')
+        self.assertEqual(str(new['FG%'].dtype), 'float64')
+        self.assertEqual(str(new['Player'].dtype), 'string')
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_round_trip(self):
+        path = os.path.join(self.tmp.name, 'player_stats')
+        collect.save_stats_to_parquet_dataset(season_frame(1980, {'FG%': [0.0, 1.0]}), path)
+        collect.save_stats_to_parquet_dataset(season_frame(2020, {'GS': [60, 82]}), path)
+
+        df = collect.load_stats_dataset(path).sort_values('season_year', ignore_index=True)
+        self.assertEqual(df['FG%'].tolist(), [0.0, 1.0, 0.5, 0.45])
+        self.assertEqual(df['GS'].isna().tolist(), [True, True, False, False])
+
+        df = collect.load_stats_dataset(path, seasons=[2020], columns=['Player', 'PTS'])
+        self.assertEqual(df.values.tolist(), [['Player A', 1500], ['Player B', 1200]])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_write_errors_propagate(self):
+        path = os.path.join(self.tmp.name, 'not_a_directory')
+        open(path, 'w').close()
+        with self.assertRaises(Exception):
+            collect.save_stats_to_parquet_dataset(season_frame(2020), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
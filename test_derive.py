@@ -0,0 +1,129 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from BRScraper import derive, dtypes, fetch, names, nba
+from benchmarks.fixtures import TEAMS, stats_page
+from test_fetch import FakeResponse, FakeSession
+
+
+def totals():
+    return pd.DataFrame({
+        'player_id': ['a01', 'a01', 'a01', 'b01'], 'Team': ['2TM', 'BOS', 'LAL', 'LAL'],
+        'G': [60, 30, 30, 0], 'GS': [10, 5, 5, 0], 'MP': [1200, 600, 600, 0],
+        'FG': [240, 120, 120, 0], 'FGA': [500, 250, 250, 0], '3P': [20, 10, 10, 0], '3PA': [60, 30, 30, 0],
+        '2P': [220, 110, 110, 0], '2PA': [440, 220, 220, 0], 'FT': [100, 50, 50, 0], 'FTA': [125, 60, 65, 0],
+        'AST': [120, 60, 60, 0], 'TOV': [60, 30, 30, 0], 'PTS': [600, 300, 300, 0], 'Season': '2022-23',
+    })
+
+
+def teams():
+    return pd.DataFrame({'MP': [19800, 19750, 19775], 'FG': [3400, 3300, 3350], 'FGA': [7200, 7100, 7150],
+                         'FTA': [1800, 1900, 1850], 'TOV': [1100, 1200, 1150], 'Pace': [98.0, 100.0, 99.0]},
+                        index=pd.Index(['BOS', 'LAL', 'LgAvg'], name='team_id'))
+
+
+def team_page():
+    def table(table_id, header, rows):
+        return ('<table id="'+table_id+'"><thead>'+header+'</thead><tbody>'+''.join(rows)+'</tbody></table>')
+
+    def team_cell(code):
+        if code is None:
+            return '<td data-stat="team">League Average</td>'
+        return '<td data-stat="team"><a href="/teams/'+code+'/2023.html">Team '+code+'</a>*</td>'
+
+    codes = TEAMS+[None]
+    totals = table('totals-team', '<tr><th>Rk</th><th>Team</th><th>MP</th><th>FG</th><th>FGA</th>'
+                   '<th>FTA</th><th>TOV</th></tr>',
+                   ['<tr><th>'+str(i)+'</th>'+team_cell(c)+'<td>19800</td><td>3400</td><td>7200</td>'
+                    '<td>1800</td><td>1100</td></tr>' for i, c in enumerate(codes)])
+    advanced = table('advanced-team', '<tr><th colspan="2"></th><th colspan="1">Pace Factor</th></tr>'
+                     '<tr><th>Rk</th><th>Team</th><th>Pace</th></tr>',
+                     ['<tr><th>'+str(i)+'</th>'+team_cell(c)+'<td>'+str(90+i)+'</td></tr>'
+                      for i, c in enumerate(codes)])
+    return '<html><body>'+totals+'<!--'+advanced+'--></body></html>'
+
+
+class TestDerive(unittest.TestCase):
+    def test_per_game_and_per_36(self):
+        df = derive.derive(totals(), 'per_game')
+        self.assertEqual(df['G'].tolist()[:2], [60, 30])
+        self.assertEqual(df['PTS'].tolist()[:2], [10.0, 10.0])
+        self.assertTrue(np.isnan(df['PTS'].iloc[3]))
+
+        df = derive.derive(totals(), 'per_36')
+        self.assertEqual(df['MP'].iloc[0], 1200)
+        self.assertEqual(df['PTS'].iloc[0], 18.0)
+
+    def test_shooting(self):
+        df = derive.derive(totals(), 'shooting')
+        self.assertEqual(df.columns.tolist()[:3], ['player_id', 'Team', 'Season'])
+        self.assertAlmostEqual(df['FG%'].iloc[0], 240/500)
+        self.assertAlmostEqual(df['eFG%'].iloc[0], 250/500)
+        self.assertAlmostEqual(df['TS%'].iloc[0], 600/(2*(500+0.44*125)))
+
+    def test_team_relative_rates(self):
+        df = derive.derive(totals(), 'advanced', teams())
+        share = 600/(19750/5)
+        self.assertAlmostEqual(df['USG%'].iloc[2], 100*(250+0.44*65+30)/(share*(7100+0.44*1900+1200)))
+        # The combined row uses the league average team
+        share = 1200/(19775/5)
+        self.assertAlmostEqual(df['AST%'].iloc[0], 100*120/(share*3350-240))
+
+        df = derive.derive(totals(), 'per_100', teams())
+        self.assertAlmostEqual(df['PTS'].iloc[1], 100*300/(98.0*600/48))
+
+        with self.assertRaises(ValueError):
+            derive.derive(totals(), 'per_100')
+
+
+class TestDerivedStats(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+        html, self.ids = stats_page(n_players=40, table_id='totals_stats')
+        self.session = FakeSession({
+            'https://www.basketball-reference.com/leagues/NBA_2023_totals.html': FakeResponse(html),
+            'https://www.basketball-reference.com/leagues/NBA_2023.html': FakeResponse(team_page()),
+        })
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        names.set_index(None)
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_team_stats(self):
+        df = nba.get_team_stats(2023, 'advanced')
+        self.assertEqual(df.columns.tolist(), ['team_id', 'Team', 'Pace'])
+        self.assertEqual(df['team_id'].tolist()[:2], TEAMS[:2])
+        self.assertEqual(df['Team'].iloc[0], 'Team '+TEAMS[0])
+
+    def test_two_fetches_for_every_view(self):
+        views = derive.get_all_derived_stats(2023)
+
+        self.assertEqual(sorted(views), sorted(derive.INFOS))
+        self.assertEqual(len(self.session.calls), 2)
+        self.assertEqual(views['per_100']['player_id'].tolist(), self.ids)
+        self.assertFalse(views['advanced']['USG%'].isna().all())
+
+    def test_compact_mode(self):
+        dtypes.enable()
+        try:
+            views = derive.get_all_derived_stats(2023)
+            df = derive.get_derived_stats(2023, 'per_100')
+            compacted = derive.derive(nba.get_stats(2023, 'totals'), 'advanced', derive.get_team_context(2023))
+        finally:
+            dtypes.disable()
+
+        self.assertEqual(df['player_id'].tolist(), self.ids)
+        self.assertFalse(views['advanced']['USG%'].isna().all())
+        # Compacted frames hold float32
+        np.testing.assert_allclose(compacted['USG%'], views['advanced']['USG%'], rtol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
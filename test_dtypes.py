@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from BRScraper import dtypes
+
+
+def frame():
+    return pd.DataFrame({
+        'player_id': ['a01', 'b01', 'c01'], 'Team': ['BOS', 'LAL', 'BOS'], 'Pos': ['PG', 'C', 'PG'],
+        'G': [82.0, 10.0, np.nan], 'MP': [2500.0, 300.0, 40000.0], 'PTS': [25.3, 10.1, 0.0],
+        'Salary': [40_000_000, 1_000_000, 3_000_000_000], 'Playoffs': [True, False, True],
+        'Season': '2022-23',
+    })
+
+
+class TestCompact(unittest.TestCase):
+    def test_dtype_policy(self):
+        df = dtypes.compact(frame())
+
+        self.assertEqual(df['Team'].dtype, 'category')
+        self.assertEqual(df['Pos'].dtype, 'category')
+        self.assertEqual(df['Season'].dtype, 'category')
+        self.assertEqual(str(df['G'].dtype), 'Int8')
+        self.assertEqual(str(df['MP'].dtype), 'Int32')
+        self.assertEqual(str(df['Salary'].dtype), 'Int64')
+        self.assertEqual(df['PTS'].dtype, 'float32')
+        self.assertEqual(df['Playoffs'].dtype, bool)
+        self.assertTrue(pd.isna(df['G'].iloc[2]))
+        self.assertEqual(df['player_id'].tolist(), ['a01', 'b01', 'c01'])
+        self.assertLess(df.memory_usage(deep=True).sum(), frame().memory_usage(deep=True).sum())
+
+    def test_opt_in_decorator(self):
+        getter = dtypes.compactable(lambda: {'a': frame()})
+
+        self.assertEqual(getter()['a']['G'].dtype, 'float64')
+        dtypes.enable()
+        try:
+            self.assertEqual(str(getter()['a']['G'].dtype), 'Int8')
+        finally:
+            dtypes.disable()
+
+
+if __name__ == '__main__':
+    unittest.main()
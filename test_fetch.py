@@ -0,0 +1,94 @@
+import unittest
+
+import requests
+
+from BRScraper import fetch
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.responses[url]
+
+
+TABLE = '<table><thead><tr><th>Player</th><th>PTS</th></tr></thead>' \
+        '<tbody><tr><td>A</td><td>10</td></tr></tbody></table>'
+
+
+class TestFetch(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+        fetch.configure(pool_size=fetch.DEFAULT_POOL_SIZE, timeout=fetch.DEFAULT_TIMEOUT)
+
+    def test_shared_session_is_reused(self):
+        """The library session is created once and reused."""
+        self.assertIs(fetch.get_session(), fetch.get_session())
+
+    def test_pool_size_is_applied(self):
+        """The configured pool size reaches the HTTPS adapter."""
+        fetch.configure(pool_size=3)
+        adapter = fetch.get_session().get_adapter('https://www.basketball-reference.com/')
+        self.assertEqual(adapter._pool_maxsize, 3)
+
+    def test_injected_session_is_used(self):
+        """read_html goes through an injected session with the default timeout."""
+        url = 'https://www.basketball-reference.com/x.html'
+        session = FakeSession({url: FakeResponse(TABLE)})
+        fetch.set_session(session)
+
+        df = fetch.read_html(url)[0]
+
+        self.assertEqual(df['PTS'].tolist(), [10])
+        self.assertEqual(session.calls, [(url, {'timeout': fetch.DEFAULT_TIMEOUT})])
+
+    def test_http_error_is_raised(self):
+        """Bad status codes raise requests.HTTPError."""
+        url = 'https://www.basketball-reference.com/missing.html'
+        fetch.set_session(FakeSession({url: FakeResponse('', 404)}))
+        with self.assertRaises(requests.HTTPError):
+            fetch.get(url)
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(ValueError):
+            fetch.configure(pool_size=0)
+
+    def test_base_url(self):
+        """Requests go to the configured base URL instead of the real site."""
+        url = 'http://127.0.0.1:8000/x.html'
+        session = FakeSession({url: FakeResponse(TABLE)})
+        fetch.set_session(session)
+        fetch.configure(base_url='http://127.0.0.1:8000/')
+        try:
+            df = fetch.read_html('https://www.basketball-reference.com/x.html')[0]
+        finally:
+            fetch.configure(base_url=fetch.BASE_URL)
+
+        self.assertEqual(df['PTS'].tolist(), [10])
+        self.assertEqual(session.calls[0][0], url)
+        self.assertEqual(fetch.resolve_url('https://www.basketball-reference.com/x.html'),
+                         'https://www.basketball-reference.com/x.html')
+
+
+if __name__ == '__main__':
+    unittest.main()
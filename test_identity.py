@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from BRScraper import fetch, identity, names
+from BRScraper.international import leagues, players
+from test_fetch import FakeResponse, FakeSession
+
+LEAGUE_PAGE = '''<table><thead><tr><th>Player</th><th>Team</th><th>G</th></tr></thead><tbody>
+<tr><td data-stat="player"><a href="/international/players/bruno-caboclo-1.html">Bruno Caboclo</a></td><td>ABC</td><td>30</td></tr>
+<tr><td data-stat="player"><a href="/international/players/marcus-williams-1.html">Marcus Williams</a></td><td>ABC</td><td>20</td></tr>
+<tr><td data-stat="player"><a href="/international/players/marcus-williams-2.html">Marcus Williams</a></td><td>DEF</td><td>10</td></tr>
+</tbody></table>'''
+
+NBA_PAGE = '''<div id="div_totals"><table><thead><tr><th>Season</th><th>PTS</th></tr></thead>
+<tbody><tr><td>2014-15</td><td>23</td></tr><tr><td>Career</td><td>23</td></tr></tbody></table></div>'''
+
+SEASONS_PAGE = '''<table><thead><tr><th>Season</th><th>PTS</th></tr></thead>
+<tbody><tr><td>2015-16</td><td>{}</td></tr><tr><td>Career</td><td>{}</td></tr></tbody></table>'''
+
+
+class TestIdentity(unittest.TestCase):
+    def setUp(self):
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+        identity.set_index(identity.IdentityIndex())
+        names.get_index().add(['cabocbr01', 'williama01', 'williama02'],
+                              ['Bruno Caboclo', 'Marcus Williams', 'Marcus Williams'])
+        identity.record('gleague', ['cabocbr01d'], ['Bruno Caboclo'])
+
+        url = leagues.BASE_URL+'euroleague/2024_per_game.html'
+        fetch.set_session(FakeSession({url: FakeResponse(LEAGUE_PAGE)}))
+        leagues.get_stats('euroleague', 2024)
+
+    def tearDown(self):
+        names.set_index(None)
+        identity.set_index(None)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_league_pages_feed_the_index(self):
+        df = leagues.get_stats('euroleague', 2024)
+
+        self.assertEqual(df['player_id'].tolist(), ['bruno-caboclo-1', 'marcus-williams-1', 'marcus-williams-2'])
+        self.assertEqual(identity.get_index().lookup('international', 'bruno caboclo'), ['bruno-caboclo-1'])
+
+    def test_links(self):
+        expected = {'nba': 'cabocbr01', 'gleague': 'cabocbr01d', 'international': 'bruno-caboclo-1'}
+        for player in ['Bruno Caboclo', 'cabocbr01', 'cabocbr01d', 'bruno-caboclo-1']:
+            self.assertEqual(identity.links(player), expected)
+
+        self.assertEqual(identity.links('marcus-williams-2'), {'international': 'marcus-williams-2'})
+        self.assertEqual(identity.resolve('international', 'Marcus Williams 2'), None)
+        with self.assertRaises(ValueError):
+            identity.links('Marcus Williams')
+
+    def test_career_is_one_request_per_league(self):
+        session = FakeSession({
+            'https://www.basketball-reference.com/players/c/cabocbr01.html': FakeResponse(NBA_PAGE),
+            'https://www.basketball-reference.com/gleague/players/c/cabocbr01d.html': FakeResponse(SEASONS_PAGE.format(400, 400)),
+            'https://www.basketball-reference.com/international/players/bruno-caboclo-1.html': FakeResponse(SEASONS_PAGE.format(300, 300)),
+        })
+        fetch.set_session(session)
+
+        career = players.get_career('bruno caboclo')
+
+        self.assertEqual(list(career), ['nba', 'gleague', 'international'])
+        self.assertEqual(career['nba']['PTS'].tolist(), [23])
+        self.assertEqual(career['gleague']['PTS'].tolist(), [400])
+        self.assertEqual(career['international']['PTS'].tolist(), [300])
+        self.assertEqual(len(session.calls), 3)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'identity.json')
+            identity.IdentityIndex(path).add('international', ['bruno-caboclo-1'], ['Bruno Caboclo'])
+
+            self.assertEqual(identity.IdentityIndex(path).lookup('international', 'Bruno Caboclo'), ['bruno-caboclo-1'])
+
+    def test_saved_only_when_enabled(self):
+        environ = {k: v for k, v in os.environ.items() if k != 'BRSCRAPER_IDENTITY_INDEX'}
+        with unittest.mock.patch.dict(os.environ, environ, clear=True):
+            identity.set_index(None)
+            self.assertIsNone(identity.get_index().path)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'identity.json')
+            identity.enable(path)
+            identity.record('international', ['bruno-caboclo-1'], ['Bruno Caboclo'])
+            self.assertTrue(os.path.exists(path))
+
+            identity.disable()
+            identity.record('international', ['marcus-williams-1'], ['Marcus Williams'])
+            self.assertEqual(identity.IdentityIndex(path).lookup('international', 'Marcus Williams'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import warnings
+
+import pandas as pd
+
+from BRScraper import fetch, identity, international
+from BRScraper.international import euroleague, leagues
+from test_fetch import FakeResponse, FakeSession
+
+
+def stats_page(player):
+    return ('<table><thead><tr><th>Player</th><th>Team</th><th>G</th><th>PTS</th></tr></thead><tbody>'
+            '<tr><td>'+player+'</td><td>ABC</td><td>30</td><td>12.5</td></tr></tbody></table>')
+
+
+class Pages(dict):
+    """URL -> FakeResponse, with a 404 for every other URL."""
+
+    def __missing__(self, url):
+        return FakeResponse('', status_code=404)
+
+
+def url(slug, season):
+    return leagues.BASE_URL+slug+'/'+str(season)+'_per_game.html'
+
+
+class TestStatsMany(unittest.TestCase):
+    def setUp(self):
+        fetch.set_rate_limiter(None)
+        identity.set_index(identity.IdentityIndex())
+        self.session = FakeSession(Pages({
+            url('euroleague', 2023): FakeResponse(stats_page('Player A')),
+            url('euroleague', 2024): FakeResponse(stats_page('Player B')),
+            url('spain-liga-acb', 2024): FakeResponse(stats_page('Player C')),
+        }))
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        identity.set_index(None)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_stacks_leagues_and_seasons(self):
+        df = international.get_stats_many(['euroleague', 'acb'], [2024], max_workers=2)
+
+        self.assertEqual(df['Player'].tolist(), ['Player B', 'Player C'])
+        self.assertIsInstance(df['League'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['League'].tolist(), ['euroleague', 'acb'])
+        self.assertEqual(df['Season'].tolist(), ['2023-24', '2023-24'])
+
+    def test_missing_pages(self):
+        with self.assertRaises(ValueError):
+            international.get_stats_many(['euroleague', 'acb'], [2023, 2024])
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            df = international.get_stats_many(['euroleague', 'acb'], [2023, 2024], errors='warn')
+
+        self.assertEqual(df['Player'].tolist(), ['Player A', 'Player B', 'Player C'])
+        self.assertEqual(len(caught), 1)
+
+    def test_league_module_and_registry(self):
+        self.assertEqual(euroleague.get_stats(2024)['Player'].tolist(), ['Player B'])
+
+        with self.assertRaises(ValueError):
+            international.get_stats_many(['lkl'], [2024])
+
+        international.register('lkl', 'lithuania-lkl')
+        try:
+            self.session.responses[url('lithuania-lkl', 2024)] = FakeResponse(stats_page('Player D'))
+            df = international.get_stats_many(['lkl'], [2024])
+        finally:
+            del international.LEAGUES['lkl']
+
+        self.assertEqual(df['Player'].tolist(), ['Player D'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from BRScraper import fetch, leaders, names, nba, warehouse
+from benchmarks.fixtures import stats_page
+from test_fetch import FakeResponse, FakeSession
+
+
+def seasons():
+    return pd.DataFrame({
+        'player_id': ['a01', 'a01', 'a01', 'b01', 'c01', 'a01', 'b01', 'c01'],
+        'Team': ['2TM', 'BOS', 'LAL', 'LAL', 'BOS', 'LAL', 'LAL', 'BOS'],
+        'G': [60, 30, 30, 82, 10, 70, 75, 80],
+        'PTS': [1500, 700, 800, 1200, 400, 1400, 1200, np.nan],
+        'Season': ['2021-22']*5+['2022-23']*3,
+    })
+
+
+class TestLeaders(unittest.TestCase):
+    def setUp(self):
+        names.set_index(names.PlayerIndex())
+        names.get_index().add(['a01', 'b01'], ['Player A', 'Player B'])
+
+    def tearDown(self):
+        names.set_index(None)
+
+    def test_top_n(self):
+        values = [3, np.nan, 9, 1, 7, 9]
+        self.assertEqual(leaders.top_n(values, 3).tolist(), [2, 5, 4])
+        self.assertEqual(leaders.top_n(values, 2, ascending=True).tolist(), [3, 0])
+        self.assertEqual(leaders.top_n(values, 10).tolist(), [2, 5, 4, 0, 3])
+
+    def test_season_leaders(self):
+        df = leaders.get_leaders('PTS', n=3, df=seasons())
+
+        self.assertEqual(df[['Rk', 'player_id', 'Team', 'PTS']].values.tolist(),
+                         [[1, 'a01', '2TM', 1500], [2, 'a01', 'LAL', 1400], [3, 'b01', 'LAL', 1200]])
+        self.assertEqual(df['Player'].tolist(), ['Player A', 'Player A', 'Player B'])
+
+        df = leaders.get_leaders('PTS', n=5, seasons='2021-22', min_games=20, df=seasons())
+        self.assertEqual(df['player_id'].tolist(), ['a01', 'b01'])
+
+    def test_career_leaders_from_warehouse(self):
+        warehouse.enable(':memory:')
+        try:
+            df = seasons()
+            for label, year in [('2021-22', 2022), ('2022-23', 2023)]:
+                warehouse.record('stats_totals', df[df['Season'] == label].drop(columns=['Season']),
+                                 season=year, playoffs=False)
+            df = leaders.get_leaders('PTS', n=2, seasons=(2022, 2023), career_totals=True)
+        finally:
+            warehouse.disable()
+
+        self.assertEqual(df[['player_id', 'PTS']].values.tolist(), [['a01', 2900], ['b01', 2400]])
+
+    def test_leaders_by_games_from_warehouse(self):
+        warehouse.enable(':memory:')
+        try:
+            df = seasons()
+            warehouse.record('stats_totals', df[df['Season'] == '2022-23'].drop(columns=['Season']),
+                             season=2023, playoffs=False)
+            df = leaders.get_leaders('G', n=2, seasons=2023)
+        finally:
+            warehouse.disable()
+
+        self.assertEqual(df[['player_id', 'G']].values.tolist(), [['c01', 80], ['b01', 75]])
+
+    def test_names_from_a_persisted_warehouse(self):
+        html, ids = stats_page(n_players=20, table_id='totals_stats')
+        url = 'https://www.basketball-reference.com/leagues/NBA_2023_totals.html'
+        limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        fetch.set_session(FakeSession({url: FakeResponse(html)}))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stats.sqlite')
+            try:
+                warehouse.enable(path)
+                expected = names.get_index().names(nba.get_stats(2023, 'totals')['player_id'])
+                warehouse.disable()
+
+                # A later session: same database, empty in-memory player index
+                names.set_index(names.PlayerIndex())
+                warehouse.enable(path)
+                season = leaders.get_leaders('PTS', n=5, seasons=2023)
+                career = leaders.get_leaders('PTS', n=5, career_totals=True)
+            finally:
+                warehouse.disable()
+                fetch.set_session(None)
+                fetch.set_rate_limiter(limiter)
+                fetch.clear_memo()
+
+        names_by_id = dict(zip(ids, expected))
+        for board in [season, career]:
+            self.assertTrue(board['Player'].notna().all())
+            self.assertEqual(board['Player'].tolist(), [names_by_id[i] for i in board['player_id']])
+
+    def test_invalid_stat(self):
+        with self.assertRaises(ValueError):
+            leaders.get_leaders('XYZ', df=seasons())
+
+
+if __name__ == '__main__':
+    unittest.main()
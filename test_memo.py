@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+from BRScraper import fetch, nba
+from BRScraper.memo import LRUMemo
+from test_fetch import FakeResponse, FakeSession
+
+STANDINGS = '''<html><body>
+<table><thead><tr><th>Eastern Conference</th><th>W</th><th>L</th><th>W/L%</th><th>GB</th></tr></thead>
+<tbody><tr><td>Boston Celtics*</td><td>64</td><td>18</td><td>.780</td><td>&mdash;</td></tr>
+<tr><td>New York Knicks*</td><td>50</td><td>32</td><td>.610</td><td>14.0</td></tr></tbody></table>
+<table><thead><tr><th>Western Conference</th><th>W</th><th>L</th><th>W/L%</th><th>GB</th></tr></thead>
+<tbody><tr><td>Oklahoma City Thunder*</td><td>57</td><td>25</td><td>.695</td><td>&mdash;</td></tr></tbody></table>
+</body></html>'''
+
+
+class TestLRUMemo(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        memo = LRUMemo(maxsize=2, ttl=None)
+        memo.put('a', 1)
+        memo.put('b', 2)
+        memo.get('a')
+        memo.put('c', 3)
+        self.assertEqual((memo.get('a'), memo.get('b'), memo.get('c')), (1, None, 3))
+
+    def test_entries_expire(self):
+        memo = LRUMemo(maxsize=2, ttl=10)
+        with mock.patch('BRScraper.memo.time.monotonic', return_value=100):
+            memo.put('a', 1)
+        with mock.patch('BRScraper.memo.time.monotonic', return_value=109):
+            self.assertEqual(memo.get('a'), 1)
+        with mock.patch('BRScraper.memo.time.monotonic', return_value=111):
+            self.assertIsNone(memo.get('a'))
+
+    def test_disabled(self):
+        memo = LRUMemo(maxsize=0)
+        memo.put('a', 1)
+        self.assertIsNone(memo.get('a'))
+
+
+class TestPageMemo(unittest.TestCase):
+    url = 'https://www.basketball-reference.com/leagues/NBA_2024_standings.html'
+
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        self.session = FakeSession({self.url: FakeResponse(STANDINGS)})
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_slices_share_one_fetch(self):
+        east = nba.get_standings(2024, 'east')
+        west = nba.get_standings(2024, 'west')
+        total = nba.get_standings(2024, 'total')
+
+        self.assertEqual(len(self.session.calls), 1)
+        self.assertEqual(east['Tm'].tolist(), ['Boston Celtics*', 'New York Knicks*'])
+        self.assertEqual(west['Tm'].tolist(), ['Oklahoma City Thunder*'])
+        self.assertEqual(len(total), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
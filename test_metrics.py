@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+
+from BRScraper import fetch, identity, metrics, names, nba
+from BRScraper.international import euroleague, leagues
+from benchmarks.fixtures import stats_page
+from test_fetch import FakeResponse, FakeSession
+
+PAGE = '''<table><thead><tr><th>Player</th><th>Team</th><th>G</th></tr></thead><tbody>
+<tr><td>Player A</td><td>ABC</td><td>30</td></tr><tr><td>Player B</td><td>DEF</td><td>20</td></tr>
+</tbody></table>'''
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        fetch.set_rate_limiter(None)
+        identity.set_index(identity.IdentityIndex())
+        fetch.set_session(FakeSession({leagues.BASE_URL+'euroleague/2024_per_game.html': FakeResponse(PAGE)}))
+        self.calls = []
+        metrics.add_hook(self.calls.append)
+
+    def tearDown(self):
+        metrics.clear_hooks()
+        identity.set_index(None)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_call_record(self):
+        euroleague.get_stats(2024)
+
+        # The nested leagues.get_stats call is counted in the outer one
+        self.assertEqual(len(self.calls), 1)
+        call = self.calls[0]
+        self.assertEqual(call.getter, 'international.euroleague.get_stats')
+        self.assertEqual((call.requests, call.bytes, call.rows, call.error), (1, len(PAGE), 2, None))
+        self.assertGreater(call.parse, 0)
+        self.assertAlmostEqual(call.seconds, sum(getattr(call, stage) for stage in metrics.STAGES), places=6)
+
+    def test_bulk_pages_count_in_the_bulk_call(self):
+        html, _ = stats_page(n_players=5, table_id='totals_stats')
+        url = 'https://www.basketball-reference.com/leagues/NBA_{}_totals.html'
+        fetch.set_session(FakeSession({url.format(season): FakeResponse(html) for season in [2023, 2024]}))
+        names.set_index(names.PlayerIndex())
+        try:
+            df = nba.get_stats_bulk([2023, 2024], 'totals', max_workers=2)
+        finally:
+            names.set_index(None)
+
+        self.assertEqual([call.getter for call in self.calls], ['nba.get_stats_bulk'])
+        self.assertEqual((self.calls[0].requests, self.calls[0].bytes), (2, 2*len(html)))
+        self.assertEqual(self.calls[0].rows, len(df))
+
+    def test_stats_many_reports_only_the_public_getter(self):
+        df = leagues.get_stats_many(['euroleague'], [2024])
+
+        self.assertEqual([call.getter for call in self.calls], ['international.leagues.get_stats_many'])
+        self.assertEqual((self.calls[0].requests, self.calls[0].rows), (1, len(df)))
+
+    def test_errors_and_disabled(self):
+        with self.assertRaises(ValueError):
+            euroleague.get_stats(2023)
+        self.assertEqual((self.calls[0].error, self.calls[0].rows), ('ValueError', None))
+
+        metrics.clear_hooks()
+        euroleague.get_stats(2024)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_exporters(self):
+        prometheus = metrics.add_hook(metrics.PrometheusExporter())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'calls.jsonl')
+            metrics.add_hook(metrics.JSONLinesExporter(path))
+            euroleague.get_stats(2024)
+            euroleague.get_stats(2024)
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual([line['rows'] for line in lines], [2, 2])
+        text = prometheus.render()
+        self.assertIn('brscraper_call_seconds_count{getter="international.euroleague.get_stats"} 2', text)
+        self.assertIn('brscraper_rows_total{getter="international.euroleague.get_stats"} 4', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from BRScraper import fetch, names, nba
+from benchmarks.fixtures import stats_page
+from benchmarks.mock_server import MockServer
+
+
+class TestMockServer(unittest.TestCase):
+    def setUp(self):
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+        self.server = MockServer({'/leagues/NBA_2024_per_game.html': stats_page(30)[0]}).start()
+        fetch.configure(base_url=self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+        fetch.configure(base_url=fetch.BASE_URL, max_retries=fetch.DEFAULT_MAX_RETRIES)
+        names.set_index(None)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_getters_use_the_mock(self):
+        df = nba.get_stats(2024)
+        self.assertEqual(len(df), 30)
+
+        # Other seasons get the fixture season's page
+        self.assertEqual(len(nba.get_stats(2010)), 30)
+        self.assertEqual(self.server.statuses, {200: 2})
+
+        with self.assertRaises(ValueError):
+            nba.get_stats(2024, 'totals')
+        self.assertEqual(self.server.statuses[404], 1)
+
+    def test_injected_429(self):
+        self.server.rate_429 = 1.0
+        self.server.retry_after = 0
+        fetch.configure(max_retries=2)
+
+        with self.assertRaises(ValueError):
+            nba.get_stats(2024)
+        self.assertEqual(self.server.statuses, {429: 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
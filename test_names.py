@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from BRScraper import fetch, names, nba
+from test_fetch import FakeResponse, FakeSession
+
+INDEX_J = '''<html><body><table id="players"><thead><tr><th>Player</th><th>From</th><th>To</th></tr></thead><tbody>
+<tr><th data-stat="player" data-append-csv="jamesle01"><a href="/players/j/jamesle01.html">LeBron James</a></th><td>2004</td><td>2025</td></tr>
+<tr><th data-stat="player" data-append-csv="jokicni01"><a href="/players/j/jokicni01.html">Nikola Jokić</a></th><td>2016</td><td>2025</td></tr>
+<tr><th data-stat="player" data-append-csv="johnsma01"><a href="/players/j/johnsma01.html">Magic Johnson*</a></th><td>1980</td><td>1996</td></tr>
+</tbody></table></body></html>'''
+
+PLAYER_PAGE = '''<html><body><span id="totals_link" data-label="Totals"></span><div id="div_totals"><table>
+<thead><tr><th>Season</th><th>PTS</th></tr></thead>
+<tbody><tr><td>2003-04</td><td>1654</td></tr><tr><td>Career</td><td>1654</td></tr></tbody>
+</table></div></body></html>'''
+
+
+class TestPlayerIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = names.PlayerIndex()
+        self.index.add(['williama01', 'williama02', 'jamesle01'],
+                       ['Marcus Williams', 'Marcus Williams', 'LeBron James'], 2008, 2008)
+
+    def test_lookup_and_search(self):
+        self.assertEqual(self.index.lookup('LEBRON  JAMES'), ['jamesle01'])
+        self.assertEqual(self.index.lookup('marcus williams'), ['williama01', 'williama02'])
+        self.assertEqual(self.index.search('lebron j')['player_id'].tolist(), ['jamesle01'])
+        self.assertEqual(self.index.search('willi')['player_id'].tolist(), ['williama01', 'williama02'])
+        self.assertEqual(self.index.fuzzy('Lebron Jmaes')['player_id'].tolist(), ['jamesle01'])
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'players.json')
+            index = names.PlayerIndex(path)
+            index.add(['jamesle01'], ['LeBron James'], 2004, 2004)
+            index.add(['jamesle01'], ['LeBron James'], 2024, 2024)
+
+            players = names.PlayerIndex(path).frame(['jamesle01'])
+        self.assertEqual(players[['From', 'To']].values.tolist(), [[2004, 2024]])
+
+    def test_saved_only_when_enabled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'players.json')
+            environ = {k: v for k, v in os.environ.items() if k != 'BRSCRAPER_PLAYER_INDEX'}
+            try:
+                with unittest.mock.patch.dict(os.environ, environ, clear=True):
+                    names.set_index(None)
+                    names.record(['jamesle01'], ['LeBron James'], 2004)
+                    self.assertIsNone(names.get_index().path)
+
+                names.enable(path)
+                names.record(['jamesle01'], ['LeBron James'], 2004)
+                self.assertTrue(os.path.exists(path))
+                names.disable()
+                names.record(['jokicni01'], ['Nikola Jokić'], 2016)
+                self.assertEqual(names.PlayerIndex(path).lookup('nikola jokic'), [])
+            finally:
+                names.set_index(None)
+
+
+class TestResolve(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+        self.session = FakeSession({names.INDEX_URL.format(letter='j'): FakeResponse(INDEX_J),
+                                    'https://www.basketball-reference.com/players/j/jokicni01.html':
+                                        FakeResponse(PLAYER_PAGE)})
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        names.set_index(None)
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_index_page_fetched_once(self):
+        self.assertEqual(names.resolve('nikola jokic'), 'jokicni01')
+        self.assertEqual(names.resolve('Magic Johnson'), 'johnsma01')
+        self.assertEqual(len(self.session.calls), 1)
+
+    def test_get_player_stats_single_exact_fetch(self):
+        df = nba.get_player_stats('Nikola Jokić')
+
+        self.assertEqual(df['Season'].tolist(), ['2003-04'])
+        self.assertEqual([c[0] for c in self.session.calls][-1],
+                         'https://www.basketball-reference.com/players/j/jokicni01.html')
+
+    def test_ambiguous_and_unknown(self):
+        names.get_index().add(['jamesle01', 'jamesle02'], ['LeBron James', 'LeBron James'], 1990, 1990)
+        with self.assertRaisesRegex(ValueError, 'jamesle01.*jamesle02'):
+            names.resolve('LeBron James')
+        with self.assertRaisesRegex(ValueError, 'Did you mean'):
+            names.resolve('Nikola Jokicc')
+
+
+if __name__ == '__main__':
+    unittest.main()
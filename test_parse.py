@@ -0,0 +1,148 @@
+import unittest
+from io import StringIO
+
+import pandas as pd
+
+from BRScraper import fetch, names, nba, parse
+from benchmarks.fixtures import stats_page
+from test_fetch import FakeResponse, FakeSession
+
+MULTI = '''<html><body>
+<table id="draft"><thead>
+<tr class="over_header"><th colspan="2"></th><th colspan="2">Totals</th></tr>
+<tr><th>Pk</th><th>Player</th><th>G</th><th>PTS</th></tr>
+</thead><tbody>
+<tr><th>1</th><td data-stat="player"><a href="/players/j/jamesle01.html">LeBron James</a></td><td>1,492</td><td>40474</td></tr>
+<tr><th>2</th><td data-stat="player">Darko Milicic</td><td>468</td><td></td></tr>
+</tbody></table>
+<!-- <table id="hidden"><thead><tr><th>A</th></tr></thead><tbody><tr><td>1</td></tr></tbody></table> -->
+</body></html>'''
+
+
+class TestReadTable(unittest.TestCase):
+    def test_matches_read_html(self):
+        """Same frame as pd.read_html minus repeated header and footer rows."""
+        html, ids = stats_page(n_players=45)
+        df = parse.read_table(html)
+
+        expected = pd.read_html(StringIO(html))[0]
+        expected = expected[(expected['Player'] != 'Player') &
+                            (expected['Player'] != 'League Average')].reset_index(drop=True)
+        # The repeated header rows left read_html with text columns
+        for column in expected.columns:
+            try:
+                expected[column] = pd.to_numeric(expected[column])
+            except ValueError:
+                pass
+
+        self.assertEqual(df['player_id'].tolist(), ids)
+        pd.testing.assert_frame_equal(df.drop(columns=['player_id']), expected, check_dtype=False)
+
+    def test_multi_level_header_and_href_ids(self):
+        df = parse.read_table(MULTI, table_id='draft')
+        self.assertEqual(df.columns[0], ('', 'player_id'))
+        self.assertEqual(df.columns[2], ('Unnamed: 1_level_0', 'Player'))
+        self.assertEqual(df.columns[4], ('Totals', 'PTS'))
+        self.assertEqual(df[('', 'player_id')].iloc[0], 'jamesle01')
+        self.assertTrue(pd.isna(df[('', 'player_id')].iloc[1]))
+        self.assertEqual(df[('Totals', 'G')].tolist(), [1492, 468])
+
+    def test_commented_table(self):
+        doc = parse.parse_document(MULTI)
+        self.assertEqual(parse.table_ids(doc), ['draft', 'hidden'])
+        self.assertEqual(parse.read_table(doc, table_id='hidden')['A'].tolist(), [1])
+        with self.assertRaises(ValueError):
+            parse.read_table(doc, table_id='missing')
+
+
+class TestReadTables(unittest.TestCase):
+    def test_matches_read_html_with_ids(self):
+        dfs = parse.read_tables(MULTI)
+        expected = pd.read_html(StringIO(MULTI))
+
+        self.assertEqual(len(dfs), len(expected))
+        df = dfs[0]
+        df.columns = df.columns.droplevel(0)
+        self.assertEqual(df['player_id'].iloc[0], 'jamesle01')
+        self.assertTrue(pd.isna(df['player_id'].iloc[1]))
+        self.assertEqual(df.drop(columns=['player_id']).columns.tolist(),
+                         expected[0].columns.droplevel(0).tolist())
+
+
+class TestGetStats(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+
+    def tearDown(self):
+        names.set_index(None)
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_player_ids_are_aligned(self):
+        html, ids = stats_page(n_players=30)
+        url = 'https://www.basketball-reference.com/leagues/NBA_2023_per_game.html'
+        fetch.set_session(FakeSession({url: FakeResponse(html)}))
+
+        df = nba.get_stats(2023)
+
+        self.assertEqual(df['player_id'].tolist(), ids)
+        self.assertNotIn('FG%', df.columns)
+        self.assertEqual(df['Season'].iloc[0], '2022-23')
+
+
+def leaders_page(n_tables=50, n_rows=20):
+    tables = []
+    for t in range(n_tables):
+        rows = ''.join('<tr><td class="rank">'+str(r+1)+'.</td>'
+                       '<td class="who"><a href="/players/p/player'+str(r)+'01.html">Player '+str(r)+'</a>'
+                       ', BOS</td><td class="value">'+str(t*100-r)+'</td></tr>'
+                       for r in range(n_rows))
+        tables.append('<div class="data_grid_box"><table class="columns">'+rows+'</table></div>')
+    return '<html><body>'+''.join(tables)+'</body></html>'
+
+
+class TestSeasonLeaders(unittest.TestCase):
+    url = 'https://www.basketball-reference.com/leagues/NBA_2023_leaders.html'
+
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        self.session = FakeSession({self.url: FakeResponse(leaders_page())})
+        fetch.set_session(self.session)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_single_leaderboard(self):
+        df = nba.get_season_leaders(2023, 'ast', n=5, per_game=True)
+        self.assertEqual(df.columns.tolist(), ['player_id', 'Player', 'AST', 'Rank', 'Tm'])
+        self.assertEqual(df['player_id'].iloc[1], 'player101')
+        self.assertEqual(df['AST'].tolist(), [700, 699, 698, 697, 696])
+        self.assertEqual(df['Player'].iloc[0], 'Player 0')
+        self.assertEqual(df['Tm'].iloc[0], 'BOS')
+
+    def test_all_leaderboards_from_one_download(self):
+        leaders = nba.get_all_season_leaders(2023, n=3)
+        self.assertEqual(list(leaders), list(nba.leaders_tables))
+        self.assertEqual(leaders['tov%']['TOV%'].tolist(), [4900, 4899, 4898])
+        self.assertEqual(len(self.session.calls), 1)
+
+    def test_missing_leaderboards_are_skipped(self):
+        self.session.responses[self.url] = FakeResponse(leaders_page(n_tables=30))
+        with self.assertWarns(UserWarning):
+            leaders = nba.get_all_season_leaders(2023, n=3)
+        self.assertIn('pts', leaders)
+        self.assertNotIn('tov%', leaders)
+        self.assertTrue(all(index < 30 for index, _ in map(nba.leaders_tables.get, leaders)))
+
+        with self.assertRaises(ValueError):
+            nba.get_season_leaders(2023, 'tov%')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from BRScraper import persist
+
+
+class FakeIndex:
+    def __init__(self, path=None):
+        self.path = path
+
+
+class TestPersist(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_write_json(self):
+        path = os.path.join(self.tmp.name, 'sub', 'index.json')
+        persist.write_json(path, {'a': 1})
+        persist.write_json(path, {'b': 2})
+
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'b': 2})
+        self.assertEqual(os.listdir(os.path.dirname(path)), ['index.json'])
+
+    def test_shared_index(self):
+        shared = persist.SharedIndex(FakeIndex, 'BRSCRAPER_TEST_INDEX', 'test.json')
+        path = os.path.join(self.tmp.name, 'env.json')
+
+        with unittest.mock.patch.dict(os.environ, {'BRSCRAPER_TEST_INDEX': path}):
+            index = shared.get()
+            self.assertIs(shared.get(), index)
+            self.assertEqual(index.path, path)
+            self.assertEqual(shared.default_path(), path)
+
+        enabled = shared.enable(os.path.join(self.tmp.name, 'on.json'))
+        self.assertIs(shared.get(), enabled)
+        shared.disable()
+        self.assertIsNone(enabled.path)
+
+        shared.set(None)
+        with unittest.mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(shared.get().path)
+            self.assertEqual(os.path.basename(shared.default_path()), 'test.json')
+
+
+if __name__ == '__main__':
+    unittest.main()
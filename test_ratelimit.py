@@ -0,0 +1,119 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import requests
+
+from BRScraper import fetch, ratelimit
+from test_fetch import FakeResponse, FakeSession
+
+
+class SequenceSession(FakeSession):
+    """Returns the queued responses for a URL one after another."""
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.responses[url].pop(0)
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.events = []
+
+    def acquire(self):
+        self.events.append('acquire')
+        return 0.0
+
+    def penalize(self, delay):
+        self.events.append(('penalize', delay))
+
+    def reward(self):
+        self.events.append('reward')
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(ratelimit.parse_retry_after('120'), 120.0)
+
+    def test_http_date(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        self.assertEqual(ratelimit.parse_retry_after('Mon, 01 Jan 2024 12:01:00 GMT', now), 60.0)
+
+    def test_invalid(self):
+        self.assertIsNone(ratelimit.parse_retry_after(None))
+        self.assertIsNone(ratelimit.parse_retry_after('soon'))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rate_is_enforced(self):
+        """The second request waits for a token at 600 requests/minute."""
+        bucket = ratelimit.TokenBucket(600)
+        self.assertLess(bucket.acquire(), 0.01)
+        self.assertGreater(bucket.acquire(), 0.05)
+
+    def test_adaptive_rate(self):
+        bucket = ratelimit.TokenBucket(60, min_requests_per_minute=20)
+        bucket.penalize(0)
+        self.assertAlmostEqual(bucket.requests_per_minute, 30)
+        bucket.penalize(0)
+        bucket.penalize(0)
+        self.assertAlmostEqual(bucket.requests_per_minute, 20)
+        for _ in range(100):
+            bucket.reward()
+        self.assertAlmostEqual(bucket.requests_per_minute, 60)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            ratelimit.TokenBucket(0)
+
+
+class TestFetchRetries(unittest.TestCase):
+    url = 'https://www.basketball-reference.com/leagues/NBA_2024_totals.html'
+
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        self.recorder = RecordingLimiter()
+        fetch.set_rate_limiter(self.recorder)
+
+    def tearDown(self):
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_429_honors_retry_after(self):
+        fetch.set_session(SequenceSession({self.url: [
+            FakeResponse('', 429, {'Retry-After': '7'}),
+            FakeResponse('ok'),
+        ]}))
+
+        self.assertEqual(fetch.get_html(self.url), 'ok')
+        self.assertEqual(self.recorder.events,
+                         ['acquire', ('penalize', 7.0), 'acquire', 'reward'])
+        self.assertEqual(fetch.last_timing().attempt, 1)
+
+    def test_gives_up_after_max_retries(self):
+        fetch.configure(max_retries=1)
+        self.addCleanup(fetch.configure, max_retries=fetch.DEFAULT_MAX_RETRIES)
+        fetch.set_session(SequenceSession({self.url: [
+            FakeResponse('', 503),
+            FakeResponse('', 503),
+        ]}))
+
+        with self.assertRaises(requests.HTTPError):
+            fetch.get(self.url)
+        self.assertIn(('penalize', fetch.BACKOFF_BASE), self.recorder.events)
+
+    def test_sleeps_without_limiter(self):
+        fetch.set_rate_limiter(None)
+        fetch.set_session(SequenceSession({self.url: [
+            FakeResponse('', 429, {'Retry-After': '2'}),
+            FakeResponse('ok'),
+        ]}))
+
+        with mock.patch('BRScraper.fetch.time.sleep') as sleep:
+            self.assertEqual(fetch.get_html(self.url), 'ok')
+        sleep.assert_called_once_with(2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import pandas as pd
+
+from BRScraper import fetch, names, nba, warehouse
+from benchmarks.fixtures import stats_page
+from test_fetch import FakeResponse, FakeSession
+
+
+def season_frame(season, teams=('BOS', 'LAL')):
+    return pd.DataFrame({'player_id': ['a01', 'b01'], 'Team': list(teams), 'PTS': [10.5, 20.0],
+                         'G': [season-2000, 70]})
+
+
+class TestWarehouse(unittest.TestCase):
+    def setUp(self):
+        self.store = warehouse.Warehouse(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_query_by_player_and_team(self):
+        self.store.write('stats_totals', season_frame(2010), season=2010, playoffs=False)
+        self.store.write('stats_totals', season_frame(2011, ('LAL', 'LAL')), season=2011, playoffs=False)
+
+        player = self.store.query('stats_totals', player_id='a01')
+        self.assertEqual(player['season_year'].tolist(), [2010, 2011])
+        self.assertEqual(player['team_code'].tolist(), ['BOS', 'LAL'])
+
+        roster = self.store.query('stats_totals', season=2011, team='LAL')
+        self.assertEqual(sorted(roster['player_id']), ['a01', 'b01'])
+        self.assertEqual(len(self.store.query('stats_totals', season=(2009, 2010))), 2)
+
+    def test_rewrite_replaces_and_schema_grows(self):
+        self.store.write('stats_totals', season_frame(2010), season=2010, playoffs=False)
+        newer = season_frame(2010).assign(**{'3P': [1, 2]})
+        self.store.write('stats_totals', newer, season=2010, playoffs=False)
+        self.store.write('stats_totals', season_frame(2010), season=2010, playoffs=True)
+
+        df = self.store.query('stats_totals', season=2010, playoffs=False)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df['3P'].tolist(), [1, 2])
+        self.assertEqual(len(self.store.query('stats_totals', season=2010)), 4)
+
+    def test_season_derived_from_column(self):
+        awards = pd.DataFrame({'Season': ['2022-23', '2021-22'], 'Player': ['Joel Embiid', 'Nikola Jokic'],
+                               'Tm': ['PHI', 'DEN']})
+        self.store.write('awards', awards, award='mvp')
+
+        df = self.store.query('awards', team='DEN')
+        self.assertEqual(df['season_year'].tolist(), [2022])
+
+    def test_unknown_dataset(self):
+        with self.assertRaises(ValueError):
+            self.store.query('draft')
+
+
+class TestWriteThrough(unittest.TestCase):
+    def setUp(self):
+        self.limiter = fetch.get_rate_limiter()
+        fetch.set_rate_limiter(None)
+        names.set_index(names.PlayerIndex())
+        self.store = warehouse.enable(':memory:')
+
+    def tearDown(self):
+        names.set_index(None)
+        warehouse.disable()
+        fetch.set_rate_limiter(self.limiter)
+        fetch.set_session(None)
+        fetch.clear_memo()
+
+    def test_get_stats_is_stored(self):
+        html, ids = stats_page(n_players=30, table_id='totals_stats')
+        url = 'https://www.basketball-reference.com/leagues/NBA_2023_totals.html'
+        fetch.set_session(FakeSession({url: FakeResponse(html)}))
+
+        df = nba.get_stats(2023, 'totals', rename=True)
+
+        stored = warehouse.query('stats_totals', season=2023)
+        self.assertEqual(stored['player_id'].tolist(), ids)
+        self.assertEqual(stored['PTS'].tolist(), df['PTS_totals'].tolist())
+        self.assertEqual(stored['playoffs'].unique().tolist(), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()